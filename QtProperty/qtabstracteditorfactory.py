@@ -123,6 +123,16 @@ class QtAbstractEditorFactory(QObject):
 
         return 0
 
+    def releaseEditor(self, editor) -> None:
+        """
+        Forgets the given editing widget created by this factory, so that
+        it can be deleted. The destroyed signal only carries a plain QObject
+        in PySide, which never matches the editors tracked by the factory.
+        """
+        d_ptr = getattr(self, 'd_ptr', None)
+        if d_ptr:
+            d_ptr.slotEditorDestroyed(editor)
+
     def addPropertyManager(self, manager) -> None:
         """
         Adds the given manager to this factory's set of managers,
@@ -47,7 +47,7 @@ from abc import *
 from PySide6.QtCore import Signal, Slot
 from PySide6.QtWidgets import QWidget
 
-from libqt5.pyqtcore import QMap, QMapList, QMapMapList, QList
+from libqt5.pyqtcore import QMap, QMapList, QMapMapList, QList, QIndexedList
 from QtProperty.qtbrowseritem import QtBrowserItem
 from QtProperty.qtproperty import QtProperty
 
@@ -56,7 +56,7 @@ g_viewToManagerToFactory = None
 
 def m_viewToManagerToFactory():
     global g_viewToManagerToFactory
-    if not g_viewToManagerToFactory:
+    if g_viewToManagerToFactory is None:
         g_viewToManagerToFactory = QMapMapList()
     return g_viewToManagerToFactory
 
@@ -66,7 +66,7 @@ g_managerToFactoryToViews = None
 
 def m_managerToFactoryToViews():
     global g_managerToFactoryToViews
-    if not g_managerToFactoryToViews:
+    if g_managerToFactoryToViews is None:
         g_managerToFactoryToViews = QMapMapList()
     return g_managerToFactoryToViews
 
@@ -161,13 +161,18 @@ class QtAbstractPropertyBrowser(QWidget):
         """
         super(QtAbstractPropertyBrowser, self).__init__(parent)
 
-        self.m_subItems = QList()
+        self.m_subItems = QIndexedList()
         self.m_managerToProperties = QMapList()
         self.m_propertyToParents = QMapList()
         self.m_topLevelPropertyToIndex = QMap()
-        self.m_topLevelIndexes = QList()
+        self.m_topLevelIndexes = QIndexedList()
         self.m_propertyToIndexes = QMapList()
         self.m_currentItem = None
+        # Lazy mode: items whose children are created on first expansion, and
+        # properties whose subproperties are not connected to this browser yet.
+        self.m_lazyItems = False
+        self.m_deferredItems = set()
+        self.m_deferredProperties = set()
 
     """
     The properties that were displayed in
@@ -199,6 +204,7 @@ class QtAbstractPropertyBrowser(QWidget):
         if not self.m_managerToProperties[manager]:
             # connect manager's signals
             manager.propertyInsertedSignal.connect(self.slotPropertyInserted)
+            manager.propertiesInsertedSignal.connect(self.slotPropertiesInserted)
             manager.propertyRemovedSignal.connect(self.slotPropertyRemoved)
             manager.propertyDestroyedSignal.connect(self.slotPropertyDestroyed)
             manager.propertyChangedSignal.connect(self.slotPropertyChanged)
@@ -206,6 +212,11 @@ class QtAbstractPropertyBrowser(QWidget):
         self.m_managerToProperties[manager].append(prop)
         self.m_propertyToParents[prop].append(parentProperty)
 
+        if self.m_lazyItems and prop.hasSubProperties():
+            # the subproperties are inserted with the first child items, see createDeferredItems()
+            self.m_deferredProperties.add(prop)
+            return
+
         for subProperty in prop.subProperties():
             self.insertSubTree(subProperty, prop)
 
@@ -224,21 +235,23 @@ class QtAbstractPropertyBrowser(QWidget):
         if not self.m_managerToProperties[manager]:
             # disconnect manager's signals
             manager.propertyInsertedSignal.disconnect(self.slotPropertyInserted)
+            manager.propertiesInsertedSignal.disconnect(self.slotPropertiesInserted)
             manager.propertyRemovedSignal.disconnect(self.slotPropertyRemoved)
             manager.propertyDestroyedSignal.disconnect(self.slotPropertyDestroyed)
             manager.propertyChangedSignal.disconnect(self.slotPropertyChanged)
             self.m_managerToProperties.remove(manager)
 
+        if prop in self.m_deferredProperties:
+            self.m_deferredProperties.discard(prop)
+            return
+
         for subProperty in prop.subProperties():
             self.removeSubTree(subProperty, prop)
 
-    def createBrowserIndexes(self, prop, parentProperty, afterProperty):
+    def parentToAfterIndexes(self, parentProperty, afterProperty) -> QMap:
         parentToAfter = QMap()
         if afterProperty:
             indexes = self.m_propertyToIndexes.get(afterProperty)
-            if not indexes:
-                return
-
             for idx in indexes:
                 parentIdx = idx.parent()
                 if ((parentProperty and parentIdx and parentIdx.property() == parentProperty) or (
@@ -246,19 +259,26 @@ class QtAbstractPropertyBrowser(QWidget):
                     parentToAfter[idx.parent()] = idx
         elif parentProperty:
             indexes = self.m_propertyToIndexes.get(parentProperty)
-            if not indexes:
-                return
-
             for idx in indexes:
                 parentToAfter[idx] = 0
         else:
             parentToAfter[0] = 0
 
+        return parentToAfter
+
+    def createBrowserIndexes(self, prop, parentProperty, afterProperty):
+        parentToAfter = self.parentToAfterIndexes(parentProperty, afterProperty)
         for it in parentToAfter.keys():
+            if it in self.m_deferredItems:
+                continue
             self.createBrowserIndex(prop, it, parentToAfter[it])
 
     def createBrowserIndex(self, prop, parentIndex, afterIndex):
         newIndex = QtBrowserItem(self, prop, parentIndex)
+        deferred = prop.hasSubProperties() and (self.m_lazyItems or prop in self.m_deferredProperties)
+        if deferred:
+            self.m_deferredItems.add(newIndex)
+        self.itemAboutToBeInserted(newIndex, afterIndex)
         if parentIndex:
             parentIndex.addChild(newIndex, afterIndex)
             # parentIndex.d__ptr.addChild(newIndex, afterIndex)
@@ -266,11 +286,11 @@ class QtAbstractPropertyBrowser(QWidget):
             self.m_topLevelPropertyToIndex[prop] = newIndex
             self.m_topLevelIndexes.insert(self.m_topLevelIndexes.indexOf(afterIndex) + 1, newIndex)
 
-        if not self.m_propertyToIndexes.get(prop):
-            self.m_propertyToIndexes[prop] = QList()
-
         self.m_propertyToIndexes[prop].append(newIndex)
         self.itemInserted(newIndex, afterIndex)
+        if deferred:
+            return newIndex
+
         subItems = prop.subProperties()
         afterChild = 0
         for child in subItems:
@@ -278,9 +298,48 @@ class QtAbstractPropertyBrowser(QWidget):
 
         return newIndex
 
+    def createDeferredItems(self, index):
+        """
+        Creates the child items of an item whose children were deferred in lazy mode.
+        The views call this when the item is first expanded.
+        """
+        if not index in self.m_deferredItems:
+            return
+
+        prop = index.property()
+        # Deferred subproperties are created before the browser listens to them
+        subItems = prop.subProperties()
+        self.m_deferredItems.discard(index)
+        if prop in self.m_deferredProperties:
+            self.m_deferredProperties.discard(prop)
+            for subProperty in subItems:
+                self.insertSubTree(subProperty, prop)
+
+        afterChild = 0
+        for child in subItems:
+            afterChild = self.createBrowserIndex(child, index, afterChild)
+
+    def hasDeferredChildren(self, index):
+        """
+        Returns whether the child items of index are created on its first expansion.
+        """
+        return index in self.m_deferredItems
+
+    def lazyItems(self):
+        return self.m_lazyItems
+
+    def setLazyItems(self, lazy):
+        """
+        In lazy mode, the items of subproperties are only created when their parent item
+        is first expanded, so inserting a collapsed subtree costs the same at any size.
+        Items with deferred children start collapsed, but keep their expand indicator.
+        Only affects properties inserted afterwards.
+        """
+        self.m_lazyItems = lazy
+
     def removeBrowserIndexes(self, prop, parentProperty):
         toRemove = QList()
-        if not prop in self.m_propertyToIndexes.keys():
+        if not prop in self.m_propertyToIndexes:
             return
 
         indexes = self.m_propertyToIndexes[prop]
@@ -310,6 +369,7 @@ class QtAbstractPropertyBrowser(QWidget):
         self.m_propertyToIndexes[prop].removeAll(index)
         if len(self.m_propertyToIndexes[prop]) <= 0:
             self.m_propertyToIndexes.remove(prop)
+        self.m_deferredItems.discard(index)
         del index
 
     def clearIndex(self, index):
@@ -331,7 +391,7 @@ class QtAbstractPropertyBrowser(QWidget):
         Returns the property browser's list of all items associated with the given property.
         There is one itme per instance of the property in the browser.
         """
-        return self.m_propertyToIndexes[prop]
+        return self.m_propertyToIndexes.get(prop)
 
     def topLevelItem(self, prop) -> QMap:
         """
@@ -392,17 +452,9 @@ class QtAbstractPropertyBrowser(QWidget):
             return 0
 
         # if item is already inserted in this item then cannot add.
-        pendingList = self.properties()
-        pos = 0
-        newPos = 0
-        while pos < len(pendingList):
-            p = pendingList[pos]
-            if p == prop:
-                return 0
-            if p == afterProperty:
-                newPos = pos + 1
-
-            pos += 1
+        if prop in self.m_subItems:
+            return 0
+        newPos = self.m_subItems.indexOf(afterProperty) + 1 if afterProperty else 0
 
         self.createBrowserIndexes(prop, 0, afterProperty)
 
@@ -425,21 +477,13 @@ class QtAbstractPropertyBrowser(QWidget):
         if not prop:
             return
 
-        pendingList = self.properties()
-        pos = 0
-        while pos < len(pendingList):
-            if pendingList[pos] == prop:
-                self.m_subItems.removeAt(pos)   # perhaps this two lines
-                self.removeSubTree(prop, 0)     # should be moved down after propertyRemoved call.
-
-                self.removeBrowserIndexes(prop, 0)
+        if self.m_subItems.removeAll(prop):
+            self.removeSubTree(prop, 0)     # perhaps this should be moved down after propertyRemoved call.
 
-                # when item is deleted, item will call removeItem for top level items,
-                # and itemRemoved for nested items.
+            self.removeBrowserIndexes(prop, 0)
 
-                return
-
-            pos += 1
+            # when item is deleted, item will call removeItem for top level items,
+            # and itemRemoved for nested items.
 
     """
     If the property is created by a property manager which was not
@@ -471,15 +515,30 @@ class QtAbstractPropertyBrowser(QWidget):
 
         return factory.findEditor(prop, parent)
 
+    def releaseEditor(self, prop, editor):
+        """
+        Makes the factory which created the given editing widget for the
+        given property forget it, before the widget is deleted.
+        """
+        factory = 0
+        manager = prop.propertyManager()
+
+        pb = m_viewToManagerToFactory().get(self)
+        if pb:
+            factory = pb.get(manager)
+
+        if factory:
+            factory.releaseEditor(editor)
+
     def addFactory(self, abstractManager, abstractFactory) -> bool:
         connectNeeded = False
-        if (not abstractManager in m_managerToFactoryToViews().keys()) or (
+        if (not abstractManager in m_managerToFactoryToViews()) or (
         not abstractFactory in m_managerToFactoryToViews()[abstractManager]):
             connectNeeded = True
         elif self in m_managerToFactoryToViews()[abstractManager][abstractFactory]:
             return connectNeeded
 
-        if (self in m_viewToManagerToFactory().keys()) and (abstractManager in m_viewToManagerToFactory()[self]):
+        if (self in m_viewToManagerToFactory()) and (abstractManager in m_viewToManagerToFactory()[self]):
             self.unsetFactoryForManager(abstractManager)
 
         m_managerToFactoryToViews()[abstractManager][abstractFactory].append(self)
@@ -492,7 +551,7 @@ class QtAbstractPropertyBrowser(QWidget):
         Removes the association between the given manager and the factory bound to it,
         automatically calling the QtAbstractEditorFactory.removePropertyManager() function if necessary.
         """
-        if (not self in m_viewToManagerToFactory().keys()) or (not manager in m_viewToManagerToFactory()[self]):
+        if (not self in m_viewToManagerToFactory()) or (not manager in m_viewToManagerToFactory()[self]):
             return
 
         abstractFactory = m_viewToManagerToFactory()[self][manager]
@@ -500,9 +559,9 @@ class QtAbstractPropertyBrowser(QWidget):
         if not m_viewToManagerToFactory()[self]:
             m_viewToManagerToFactory().remove(self)
 
-        m_managerToFactoryToViews()[manager][abstractFactory][self].clear()
+        m_managerToFactoryToViews()[manager][abstractFactory].removeAll(self)
         if len(m_managerToFactoryToViews()[manager][abstractFactory]) <= 0:
-            m_managerToFactoryToViews().remove(manager)[abstractFactory]
+            m_managerToFactoryToViews()[manager].remove(abstractFactory)
             abstractFactory.breakConnection(manager)
             if not m_managerToFactoryToViews()[manager]:
                 m_managerToFactoryToViews().remove(manager)
@@ -561,16 +620,39 @@ class QtAbstractPropertyBrowser(QWidget):
 
     @Slot(QtProperty, QtProperty, list)
     def slotPropertyInserted(self, prop, parentProperty, afterProperty):
-        if not self.m_propertyToParents.get(parentProperty):
+        if not self.m_propertyToParents.get(parentProperty) or parentProperty in self.m_deferredProperties:
             return
         if type(afterProperty) == list:
             afterProperty = afterProperty[0]
         self.createBrowserIndexes(prop, parentProperty, afterProperty)
         self.insertSubTree(prop, parentProperty)
 
+    @Slot(QtProperty, list, list)
+    def slotPropertiesInserted(self, parentProperty, props, afterProperty):
+        if not self.m_propertyToParents.get(parentProperty) or parentProperty in self.m_deferredProperties:
+            return
+        if type(afterProperty) == list:
+            afterProperty = afterProperty[0]
+
+        # create the items of all properties under each parent item in one pass
+        # and repaint the view once at the end.
+        updatesEnabled = self.updatesEnabled()
+        self.setUpdatesEnabled(False)
+        parentToAfter = self.parentToAfterIndexes(parentProperty, afterProperty)
+        for it in parentToAfter.keys():
+            if it in self.m_deferredItems:
+                continue
+            afterIndex = parentToAfter[it]
+            for prop in props:
+                afterIndex = self.createBrowserIndex(prop, it, afterIndex)
+
+        for prop in props:
+            self.insertSubTree(prop, parentProperty)
+        self.setUpdatesEnabled(updatesEnabled)
+
     @Slot(QtProperty, QtProperty)
     def slotPropertyRemoved(self, prop, parentProperty):
-        if not self.m_propertyToParents.get(parentProperty):
+        if not self.m_propertyToParents.get(parentProperty) or parentProperty in self.m_deferredProperties:
             return
         self.removeSubTree(prop, parentProperty)  # this line should be probably moved down after propertyRemoved call
         self.removeBrowserIndexes(prop, parentProperty)
@@ -583,13 +665,21 @@ class QtAbstractPropertyBrowser(QWidget):
 
     @Slot(QtProperty)
     def slotPropertyChanged(self, prop):
-        if not prop in self.m_propertyToIndexes.keys():
+        if not prop in self.m_propertyToIndexes:
             return
 
         indexes = self.m_propertyToIndexes[prop]
         for idx in indexes:
             self.itemChanged(idx)
 
+    """
+    This function is called just before insertedItem is added after precedingItem,
+    while the item is not yet among its parent's children. Views backed by an item
+    model reimplement it to start the row insertion.
+    """
+    def itemAboutToBeInserted(self, insertedItem, precedingItem) -> None:
+        pass
+
     """
     This function is called to update the widget whenever a property
     is inserted or added to the property browser, passing the insertedItem 
@@ -43,6 +43,7 @@
 ############################################################################
 
 from abc import *
+from contextlib import contextmanager
 from PySide6.QtCore import QObject, Signal
 from PySide6.QtGui import QIcon
 from PySide6.QtWidgets import QLineEdit
@@ -108,11 +109,27 @@ from QtProperty.qtproperty import QtProperty
 #   Note that signal is emitted only if the parentProperty is created by this manager.
 #
 #   - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+#   propertiesInsertedSignal(parentProperty, newProperties, precedingProperty)
+#   This signal is emitted once when QtProperty.insertSubProperties() inserts several
+#   subproperties, passing the parentProperty, the list of newProperties in their new order
+#   and the precedingProperty of the first one as parameters.
+#
+#   Note that signal is emitted only if the parentProperty is created by this manager.
+#
+#   - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
 #   propertyChangedSignal(property)
 #   This signal is emitted whenever a property's data changes, passing to the property as parameter.
 #
 #   Note that signal is only emitted for properties that are created by this manager.
 #
+#   Between beginUpdate() and endUpdate() the signal is held back and emitted once
+#   per changed property when the outermost endUpdate() is called.
+#
+#   - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+#   propertiesChangedSignal(properties)
+#   This signal is emitted by the outermost endUpdate() after the propertyChangedSignal
+#   of each property, passing the list of all properties changed during the update.
+#
 #   - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
 #   propertyRemovedSignal(property, parentProperty)
 #   This signal is emitted when a subproperty is removed, passing to the removed property
@@ -129,7 +146,9 @@ from QtProperty.qtproperty import QtProperty
 #####################################################################################
 class QtAbstractPropertyManager(QObject):
     propertyInsertedSignal = Signal(QtProperty, QtProperty, list)
+    propertiesInsertedSignal = Signal(QtProperty, list, list)
     propertyChangedSignal = Signal(QtProperty)
+    propertiesChangedSignal = Signal(list)
     propertyRemovedSignal = Signal(QtProperty, QtProperty)
     propertyDestroyedSignal = Signal(QtProperty)
 
@@ -139,6 +158,9 @@ class QtAbstractPropertyManager(QObject):
         """
         super(QtAbstractPropertyManager, self).__init__(parent)
         self.m_properties = set()
+        self.m_updateLevel = 0
+        self.m_changedProperties = {}
+        self.m_lazySubProperties = False
 
     def __del__(self) -> None:
         """
@@ -225,6 +247,37 @@ class QtAbstractPropertyManager(QObject):
     def initializeProperty(self, prop):
         pass
 
+    def lazySubProperties(self) -> bool:
+        """
+        Returns whether subproperties are created on first use instead of with their parent.
+        """
+        return self.m_lazySubProperties
+
+    def setLazySubProperties(self, lazy) -> None:
+        """
+        When lazy is True, properties added afterwards get their subproperties created
+        the first time QtProperty.subProperties() is called on them, e.g. when a browser
+        shows them. Until then the parent's own value is the only copy of the data.
+        """
+        self.m_lazySubProperties = lazy
+
+    def initializeSubProperties(self, prop) -> None:
+        """
+        Called from initializeProperty() by managers that have subproperties.
+        Creates them right away, or defers them in lazy mode.
+        """
+        if self.m_lazySubProperties:
+            prop.deferSubProperties()
+        else:
+            self.createSubProperties(prop)
+
+    def createSubProperties(self, prop) -> None:
+        """
+        Creates the subproperties of the given property from its current value.
+        The default implementation does nothing.
+        """
+        pass
+
     @abstractmethod
     def uninitializeProperty(self, prop):
         pass
@@ -236,10 +289,73 @@ class QtAbstractPropertyManager(QObject):
             self.m_properties.remove(prop)
 
     def propertyChanged(self, prop):
+        if self.m_updateLevel > 0:
+            self.m_changedProperties[prop] = True
+            return
         self.propertyChangedSignal.emit(prop)
 
+    def subPropertyManagers(self) -> list:
+        """
+        Returns the internal managers owned by this manager, which create its subproperties.
+        """
+        return [child for child in self.children() if isinstance(child, QtAbstractPropertyManager)]
+
+    def beginUpdate(self) -> None:
+        """
+        Starts an update. Until the matching endUpdate() call, propertyChangedSignal is
+        not emitted but the changed properties are recorded. Updates can be nested and
+        also cover the managers of the subproperties.
+
+        Type specific signals such as valueChangedSignal are still emitted immediately.
+        """
+        self.m_updateLevel += 1
+        for manager in self.subPropertyManagers():
+            manager.beginUpdate()
+
+    def endUpdate(self) -> None:
+        """
+        Ends an update started by beginUpdate(). When the outermost update ends,
+        propertyChangedSignal is emitted once for every changed property, followed by
+        propertiesChangedSignal with the list of all of them.
+        """
+        for manager in self.subPropertyManagers():
+            manager.endUpdate()
+
+        if self.m_updateLevel <= 0:
+            return
+        self.m_updateLevel -= 1
+        if self.m_updateLevel > 0 or not self.m_changedProperties:
+            return
+
+        changed = [prop for prop in self.m_changedProperties if prop in self.m_properties]
+        self.m_changedProperties = {}
+        for prop in changed:
+            self.propertyChangedSignal.emit(prop)
+        if changed:
+            self.propertiesChangedSignal.emit(changed)
+
+    def isUpdating(self) -> bool:
+        """
+        Returns whether an update started by beginUpdate() is in progress.
+        """
+        return self.m_updateLevel > 0
+
+    @contextmanager
+    def updating(self):
+        """
+        Context manager calling beginUpdate() and endUpdate() around its block.
+        """
+        self.beginUpdate()
+        try:
+            yield self
+        finally:
+            self.endUpdate()
+
     def propertyRemoved(self, prop, parentProperty):
         self.propertyRemovedSignal.emit(prop, parentProperty)
 
     def propertyInserted(self, prop, parentProperty, afterProperty=None):
         self.propertyInsertedSignal.emit(prop, parentProperty, [afterProperty])
+
+    def propertiesInserted(self, props, parentProperty, afterProperty=None):
+        self.propertiesInsertedSignal.emit(parentProperty, props, [afterProperty])
@@ -42,7 +42,13 @@
 #
 ############################################################################
 
-from libqt5.pyqtcore import QList
+from libqt5.pyqtcore import QIndexedList, QEmptyList
+
+
+# Shared child list of leaf items, replaced by a real list on the first addChild().
+# Only used as a marker; children() returns _EMPTY_CHILDREN for a leaf.
+_NO_CHILDREN = QIndexedList()
+_EMPTY_CHILDREN = QEmptyList()
 
 
 #####################################################################################
@@ -63,11 +69,15 @@ from libqt5.pyqtcore import QList
 #
 #####################################################################################
 class QtBrowserItem:
+    __slots__ = ('m_browser', 'm_property', 'm_parent', 'm_children', 'm_depth')
+
     def __init__(self, browser=None, prop=None, parent=None):
         self.m_browser = browser
         self.m_property = prop
         self.m_parent = parent
-        self.m_children = QList()
+        self.m_children = _NO_CHILDREN
+        # Items never change parent, so the depth is fixed at creation
+        self.m_depth = parent.m_depth + 1 if parent else 0
 
     def __del__(self):
         pass
@@ -102,8 +112,16 @@ class QtBrowserItem:
         """
         Returns the children items of this item.
         """
+        if self.m_children is _NO_CHILDREN:
+            return _EMPTY_CHILDREN
         return self.m_children
 
+    def depth(self):
+        """
+        Returns the number of parents of this item; 0 for top-level items.
+        """
+        return self.m_depth
+
     def browser(self):
         """
         Returns the property browser which owns this item.
@@ -113,8 +131,11 @@ class QtBrowserItem:
     def addChild(self, index, after):
         if index in self.m_children:
             return
+        if self.m_children is _NO_CHILDREN:
+            self.m_children = QIndexedList()
         idx = self.m_children.indexOf(after) + 1    # we insert after returned idx, if it was -1 then we set idx to 0
         self.m_children.insert(idx, index)
 
     def removeChild(self, index):
-        self.m_children.removeAll(index)
+        if self.m_children.removeAll(index) and not self.m_children:
+            self.m_children = _NO_CHILDREN
@@ -60,8 +60,8 @@ from PySide6.QtWidgets import (
     QDateTimeEdit,
     QFontDialog
 )
-from PySide6.QtGui import QKeySequence, QPainter, QColor, QBrush, QFont, QAction
-from QtProperty.qtpropertymanager import QtEnumPropertyManager, cursorDatabase
+from PySide6.QtGui import QKeySequence, QPainter, QColor, QBrush, QFont, QAction, QStandardItem, QStandardItemModel
+from QtProperty.qtpropertymanager import QtEnumPropertyManager, cursorDatabase, g_enumNameTables, g_enumIconTables
 from libqt5.pyqtcore import QMap, QList, QMapList
 from QtProperty.qtproperty import QtProperty
 from QtProperty.qtabstracteditorfactory import QtAbstractEditorFactory
@@ -682,7 +682,7 @@ class EditorFactoryPrivate:
         self.m_editorToProperty[editor] = prop
 
     def slotEditorDestroyed(self, obj):
-        if obj in self.m_editorToProperty.keys():
+        if obj in self.m_editorToProperty:
             prop = self.m_editorToProperty[obj]
             pit = self.m_createdEditors.get(prop)
             if pit:
@@ -1356,6 +1356,8 @@ class QtEnumEditorFactory(QtAbstractEditorFactory):
         self.d_ptr = QtEnumEditorFactoryPrivate()
         self.d_ptr.q_ptr = self
         self.editor = None
+        self.m_models = {}
+        self.m_editorToModelKey = {}
 
     def __del__(self):
         """
@@ -1364,6 +1366,51 @@ class QtEnumEditorFactory(QtAbstractEditorFactory):
         self.d_ptr.m_editorToProperty.clear()
         del self.d_ptr
 
+    def setEditorModel(self, editor, names, icons):
+        """
+        Sets the item model listing the given enum names and icons on editor.
+
+        Combo boxes showing equal name and icon tables share one model, keyed
+        on the content of the tables. A model is dropped with its last editor.
+        """
+        key = (g_enumNameTables.key(names), g_enumIconTables.key(icons))
+        entry = self.m_models.get(key)
+        if entry is None:
+            model = QStandardItemModel(self)
+            for i, name in enumerate(names):
+                icon = icons.get(i)
+                if type(icon) is not QIcon:
+                    icon = QIcon()
+                model.appendRow(QStandardItem(icon, name))
+
+            entry = self.m_models[key] = [model, 0]
+
+        old_key = self.m_editorToModelKey.get(id(editor))
+        if old_key == key:
+            return
+
+        entry[1] += 1
+        self.m_editorToModelKey[id(editor)] = key
+        editor.setModel(entry[0])
+        if old_key is not None:
+            self.releaseModel(old_key)
+
+    def releaseModel(self, key):
+        entry = self.m_models.get(key)
+        if entry is None:
+            return
+
+        entry[1] -= 1
+        if entry[1] <= 0:
+            del self.m_models[key]
+            entry[0].deleteLater()
+
+    def slotEditorDestroyed(self, editor):
+        self.d_ptr.slotEditorDestroyed(editor)
+        key = self.m_editorToModelKey.pop(id(editor), None)
+        if key is not None:
+            self.releaseModel(key)
+
     def createEditor(self, manager, prop, parent):
         """
         Reimplementation of QtAbstractEditorFactory.
@@ -1372,21 +1419,12 @@ class QtEnumEditorFactory(QtAbstractEditorFactory):
         editor.setSizeAdjustPolicy(QComboBox.AdjustToMinimumContentsLengthWithIcon)
         editor.setMinimumContentsLength(1)
         editor.view().setTextElideMode(Qt.ElideRight)
-        names = manager.enumNames(prop)
-        editor.addItems(names)
-
-        icons = manager.enumIcons(prop)
-        names_count = len(names)
-        for i in range(names_count):
-            icon = icons[i]
-            if type(icon) is not QIcon:
-                icon = QIcon()
-
-            editor.setItemIcon(i, icon)
+        self.setEditorModel(editor, manager.enumNames(prop), manager.enumIcons(prop))
         editor.setCurrentIndex(manager.value(prop))
 
         editor.currentIndexChanged.connect(self.slotSetValue)
-        editor.destroyed.connect(self.d_ptr.slotEditorDestroyed)
+        # The destroyed signal carries a plain QObject, so bind the editor itself
+        editor.destroyed.connect(lambda obj=None, editor=editor: self.slotEditorDestroyed(editor))
 
         self.editor = editor
 
@@ -1427,16 +1465,12 @@ class QtEnumEditorFactory(QtAbstractEditorFactory):
         if not mgr:
             return
 
+        names = mgr.enumNames(prop)
         icons = mgr.enumIcons(prop)
 
         for editor in editors:
             editor.blockSignals(True)
-            editor.clear()
-            editor.addItems(names)
-
-            for i in range(len(names)):
-                editor.setItemIcon(i, icons.get(i, QIcon))
-
+            self.setEditorModel(editor, names, icons)
             editor.setCurrentIndex(mgr.value(prop))
             editor.blockSignals(False)
 
@@ -1451,13 +1485,11 @@ class QtEnumEditorFactory(QtAbstractEditorFactory):
             return
 
         names = mgr.enumNames(prop)
+        icons = mgr.enumIcons(prop)
 
         for editor in editors:
             editor.blockSignals(True)
-
-            for i in range(len(names)):
-                editor.setItemIcon(i, icons.value(i))
-
+            self.setEditorModel(editor, names, icons)
             editor.setCurrentIndex(mgr.value(prop))
             editor.blockSignals(False)
 
@@ -2221,6 +2253,13 @@ class QtCursorEditorFactory(QtAbstractEditorFactory):
 
         return editor
 
+    def releaseEditor(self, editor) -> None:
+        """
+        Reimplemented from the QtAbstractEditorFactory class.
+        """
+        self.slotEditorDestroyed(editor)
+        self.enum_editor_factory.releaseEditor(editor)
+
     def connectPropertyManager(self, manager):
         manager.valueChangedSignal.connect(self.slotValueChanged)
 
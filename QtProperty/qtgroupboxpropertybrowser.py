@@ -43,7 +43,8 @@
 ############################################################################
 
 from PySide6.QtCore import Qt, QTimer, QRect
-from PySide6.QtWidgets import QGridLayout, QSizePolicy, QSpacerItem, QLabel, QGroupBox, QFrame
+from PySide6.QtGui import QPainter, QPalette
+from PySide6.QtWidgets import QApplication, QGridLayout, QSizePolicy, QSpacerItem, QLabel, QGroupBox, QFrame
 from libqt5.pyqtcore import QList, QMap
 from QtProperty.qtabstractpropertybrowser import QtAbstractPropertyBrowser
 
@@ -58,6 +59,32 @@ class WidgetItem:
         self.line = None
         self.parent = None
         self.children = QList()
+        self.placeholder = None
+
+
+PLACEHOLDER_ALIGNMENT = Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter
+
+
+####################################################################
+#
+# PlaceholderGroupBox
+#
+# Group box of a sub property which also paints the placeholder rows
+# of its children when the browser is virtualized.
+#
+####################################################################
+class PlaceholderGroupBox(QGroupBox):
+    def __init__(self, browser, item, parent=None) -> None:
+        super().__init__(parent)
+        self.browser = browser
+        self.item = item
+
+    def paintEvent(self, event):
+        """
+        Reimplementation
+        """
+        super().paintEvent(event)
+        self.browser.paintPlaceholders(self, self.item.children, event.rect())
 
 
 class QtGroupBoxPropertyBrowser(QtAbstractPropertyBrowser):
@@ -69,6 +96,13 @@ class QtGroupBoxPropertyBrowser(QtAbstractPropertyBrowser):
         self.main_layout = 0
         self.children = QList()
         self.recreate_queue = QList()
+        self.virtualized = False
+        self.realized_items = set()
+        self.row_height = 0
+        self.virtual_timer = QTimer(self)
+        self.virtual_timer.setSingleShot(True)
+        self.virtual_timer.setInterval(0)
+        self.virtual_timer.timeout.connect(self.slotUpdateVirtualRows)
 
         self.init()
 
@@ -110,6 +144,65 @@ class QtGroupBoxPropertyBrowser(QtAbstractPropertyBrowser):
         """
         self.propertyChanged(item)
 
+    def setVirtualized(self, virtualized):
+        """
+        Sets whether editors are only created for the rows which are
+        visible, e.g. inside the viewport of the QScrollArea holding this
+        browser. The other rows are painted as placeholders without any
+        widget, so the number of widgets stays bounded by the number of
+        visible rows.
+
+        Only properties inserted while the browser is virtualized get
+        placeholders, so this should be set before adding properties.
+        """
+        if self.virtualized == virtualized:
+            return
+
+        self.virtualized = virtualized
+        if virtualized:
+            self.scheduleVirtualUpdate()
+            return
+
+        self.virtual_timer.stop()
+        for item in self.item_to_index.keys():
+            if item.placeholder:
+                self.realizeItem(item)
+        self.realized_items.clear()
+
+    def isVirtualized(self):
+        """
+        Returns whether editors are only created for the visible rows
+        """
+        return self.virtualized
+
+    def showEvent(self, event):
+        """
+        Reimplementation
+        """
+        super().showEvent(event)
+        self.scheduleVirtualUpdate()
+
+    def moveEvent(self, event):
+        """
+        Reimplementation
+        """
+        super().moveEvent(event)
+        self.scheduleVirtualUpdate()
+
+    def resizeEvent(self, event):
+        """
+        Reimplementation
+        """
+        super().resizeEvent(event)
+        self.scheduleVirtualUpdate()
+
+    def paintEvent(self, event):
+        """
+        Reimplementation
+        """
+        super().paintEvent(event)
+        self.paintPlaceholders(self, self.children, event.rect())
+
     def scrollPosition(self):
         """
         Returns the position of scroll bar
@@ -127,7 +220,7 @@ class QtGroupBoxPropertyBrowser(QtAbstractPropertyBrowser):
         if not editor:
             return
         
-        if not editor in self.widget_to_item.keys():
+        if not editor in self.widget_to_item:
             return
 
         self.widget_to_item[editor] = 0
@@ -159,13 +252,15 @@ class QtGroupBoxPropertyBrowser(QtAbstractPropertyBrowser):
             else:
                 item.widget_label = QLabel(w)
                 item.widget_label.setSizePolicy(QSizePolicy(QSizePolicy.Ignored, QSizePolicy.Fixed))
-                item.widget_label.setTextFormat(Qt.PlanText)
+                item.widget_label.setTextFormat(Qt.PlainText)
 
             span = 1
             if item.widget:
                 l.addWidget(item.widget, old_row, 1, 1, 1)
+                item.widget.show()
             elif item.widget_label:
                 l.addWidget(item.widget_label, old_row, 1, 1, 1)
+                item.widget_label.show()
             else:
                 span = 2
             
@@ -173,12 +268,217 @@ class QtGroupBoxPropertyBrowser(QtAbstractPropertyBrowser):
             item.label.setSizePolicy(QSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed))
             l.addWidget(item.label, old_row, 0, 1, span)
 
-            self.upateItem(item)
+            self.updateItem(item)
+            if self.virtualized:
+                self.realized_items.add(item)
+                self.scheduleVirtualUpdate()
 
         self.recreate_queue.clear()
 
+    def scheduleVirtualUpdate(self):
+        if self.virtualized:
+            self.virtual_timer.start()
+
+    def slotUpdateVirtualRows(self):
+        if not self.virtualized or not self.isVisible():
+            return
+
+        rect = self.visibleRegion().boundingRect()
+        items = []
+        if not rect.isEmpty():
+            self.collectVisibleItems(self.children, self.main_layout, rect, items)
+
+        visible = set(items)
+        for item in list(self.realized_items):
+            if not item in visible and not self.editorHasFocus(item):
+                self.realized_items.discard(item)
+                self.virtualizeItem(item)
+
+        for item in items:
+            if item.placeholder:
+                self.realizeItem(item)
+                self.realized_items.add(item)
+
+    def collectVisibleItems(self, children, layout, rect, items):
+        layout.activate()
+        for i in range(self.firstVisibleChild(children, rect.top()), len(children)):
+            item = children[i]
+            if self.itemGeometry(item).top() > rect.bottom():
+                break
+
+            if item.group_box:
+                offset = item.group_box.pos()
+                self.collectVisibleItems(item.children, item.layout,
+                                         rect.translated(-offset.x(), -offset.y()), items)
+            elif item.placeholder or item in self.realized_items:
+                items.append(item)
+
+    def firstVisibleChild(self, children, top):
+        # Rows are laid out in the order of children, so bisect on their bottom
+        lo = 0
+        hi = len(children)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self.itemGeometry(children[mid]).bottom() < top:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def itemGeometry(self, item):
+        if item.group_box:
+            return item.group_box.geometry()
+        if item.placeholder:
+            return item.placeholder[0].geometry().united(item.placeholder[1].geometry())
+        if item.label:
+            rect = item.label.geometry()
+            if item.widget:
+                rect = rect.united(item.widget.geometry())
+            elif item.widget_label:
+                rect = rect.united(item.widget_label.geometry())
+            return rect
+        return QRect()
+
+    def itemContainer(self, item):
+        if item.parent:
+            return item.parent.layout, item.parent.group_box
+        return self.main_layout, self
+
+    def editorHasFocus(self, item):
+        if not item.widget:
+            return False
+        focus = QApplication.focusWidget()
+        return focus is not None and (focus is item.widget or item.widget.isAncestorOf(focus))
+
+    def placeholderRowHeight(self):
+        if not self.row_height:
+            self.row_height = self.fontMetrics().height() + 8
+        return self.row_height
+
+    def placeholderHeight(self, layout):
+        # Spacer rows are empty, so the grid layout skips their spacing
+        return self.placeholderRowHeight() + max(0, layout.verticalSpacing())
+
+    def setPlaceholderRowHeight(self, height):
+        self.row_height = height
+        for item in self.item_to_index.keys():
+            if item.placeholder:
+                name_spacer, value_spacer = item.placeholder
+                height = self.placeholderHeight(self.itemContainer(item)[0])
+                name_spacer.changeSize(name_spacer.sizeHint().width(), height,
+                                       QSizePolicy.Fixed, QSizePolicy.Fixed)
+                value_spacer.changeSize(0, height, QSizePolicy.Ignored, QSizePolicy.Fixed)
+            if item.layout:
+                item.layout.invalidate()
+        self.main_layout.invalidate()
+
+    def createPlaceholder(self, item, prop, parent_widget, layout, row):
+        height = self.placeholderHeight(layout)
+        name_width = parent_widget.fontMetrics().horizontalAdvance(prop.propertyName())
+        item.placeholder = (QSpacerItem(name_width, height, QSizePolicy.Fixed, QSizePolicy.Fixed),
+                            QSpacerItem(0, height, QSizePolicy.Ignored, QSizePolicy.Fixed))
+        layout.addItem(item.placeholder[0], row, 0)
+        layout.addItem(item.placeholder[1], row, 1)
+
+    def removePlaceholder(self, item, layout):
+        row = layout.getItemPosition(layout.indexOf(item.placeholder[0]))[0]
+        for spacer in item.placeholder:
+            layout.removeItem(spacer)
+        item.placeholder = None
+        return row
+
+    def createItemWidgets(self, item, prop, parent_widget, layout, row):
+        item.label = QLabel(parent_widget)
+        item.label.setSizePolicy(QSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed))
+        item.widget = self.createEditor(prop, parent_widget)
+        if not item.widget:
+            item.widget_label = QLabel(parent_widget)
+            item.widget_label.setSizePolicy(QSizePolicy(QSizePolicy.Ignored, QSizePolicy.Fixed))
+            item.widget_label.setTextFormat(Qt.PlainText)
+        else:
+            item.widget.destroyed.connect(self.slotEditorDestroyed)
+            self.widget_to_item[item.widget] = item
+
+        span = 1
+        if item.widget:
+            layout.addWidget(item.widget, row, 1)
+        elif item.widget_label:
+            layout.addWidget(item.widget_label, row, 1)
+        else:
+            span = 2
+
+        layout.addWidget(item.label, row, 0, 1, span)
+
+    def realizeItem(self, item):
+        layout, parent_widget = self.itemContainer(item)
+        row = self.removePlaceholder(item, layout)
+        self.createItemWidgets(item, self.item_to_index[item].property(), parent_widget, layout, row)
+        self.updateItem(item)
+
+        value_widget = item.widget or item.widget_label
+        height = max(item.label.sizeHint().height(), value_widget.sizeHint().height())
+        if height > self.placeholderRowHeight():
+            self.setPlaceholderRowHeight(height)
+            self.scheduleVirtualUpdate()
+
+    def virtualizeItem(self, item):
+        layout, parent_widget = self.itemContainer(item)
+        row = layout.getItemPosition(layout.indexOf(item.label))[0]
+        prop = self.item_to_index[item].property()
+        if item.widget:
+            self.widget_to_item.remove(item.widget)
+            self.releaseEditor(prop, item.widget)
+
+        for widget in (item.label, item.widget, item.widget_label):
+            if widget:
+                layout.removeWidget(widget)
+                widget.hide()
+                widget.deleteLater()
+
+        item.label = None
+        item.widget = None
+        item.widget_label = None
+        self.createPlaceholder(item, prop, parent_widget, layout, row)
+
+    def paintPlaceholders(self, widget, children, rect):
+        if not self.virtualized:
+            return
+
+        painter = None
+        for i in range(self.firstVisibleChild(children, rect.top()), len(children)):
+            item = children[i]
+            if not item.placeholder:
+                if self.itemGeometry(item).top() > rect.bottom():
+                    break
+                continue
+
+            name_rect = item.placeholder[0].geometry()
+            if name_rect.top() > rect.bottom():
+                break
+
+            if not painter:
+                painter = QPainter(widget)
+                palette = widget.palette()
+                font = widget.font()
+
+            prop = self.item_to_index[item].property()
+            if prop.isEnabled():
+                painter.setPen(palette.color(QPalette.ColorGroup.Active, QPalette.ColorRole.WindowText))
+            else:
+                painter.setPen(palette.color(QPalette.ColorGroup.Disabled, QPalette.ColorRole.WindowText))
+
+            font.setUnderline(prop.isModified())
+            painter.setFont(font)
+            painter.drawText(name_rect, PLACEHOLDER_ALIGNMENT, prop.propertyName())
+            font.setUnderline(False)
+            painter.setFont(font)
+            painter.drawText(item.placeholder[1].geometry(), PLACEHOLDER_ALIGNMENT, prop.valueText())
+
+        if painter:
+            painter.end()
+
     def updateLater(self):
-        QTimer.singleShot(0, self, self.slotUpdate())
+        QTimer.singleShot(0, self.slotUpdate)
 
     def propertyInserted(self, index, after_index):
         after_item = self.index_to_item[after_index]
@@ -215,6 +515,10 @@ class QtGroupBoxPropertyBrowser(QtAbstractPropertyBrowser):
         else:
             if not parent_item.group_box:
                 self.recreate_queue.removeAll(parent_item)
+                # A group box header shows the editor of the parent property
+                if parent_item.placeholder:
+                    self.realizeItem(parent_item)
+                self.realized_items.discard(parent_item)
                 par = parent_item.parent
 
                 w = 0
@@ -233,7 +537,7 @@ class QtGroupBoxPropertyBrowser(QtAbstractPropertyBrowser):
                     if self.hasHeader(par):
                         old_row += 2
 
-                parent_item.group_box = QGroupBox(w)
+                parent_item.group_box = PlaceholderGroupBox(self, parent_item, w)
                 parent_item.layout = QGridLayout()
                 parent_item.group_box.setLayout(parent_item.layout)
 
@@ -263,27 +567,12 @@ class QtGroupBoxPropertyBrowser(QtAbstractPropertyBrowser):
             layout = parent_item.layout
             parent_widget = parent_item.group_box
 
-        new_item.label = QLabel(parent_widget)
-        new_item.label.setSizePolicy(QSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed))
-        new_item.widget = self.createEditor(index.property(), parent_widget)
-        if not new_item.widget:
-            new_item.widget_label = QLabel(parent_widget)
-            new_item.widget_label.setSizePolicy(QSizePolicy(QSizePolicy.Ignored, QSizePolicy.Fixed))
-            new_item.widget_label.setTextFormat(Qt.PlainText)
-        else:
-            new_item.widget.destroyed.connect(self.slotEditorDestroyed)
-            self.widget_to_item[new_item.widget] = new_item
-
         self.insertRow(layout, row)
-        span = 1
-        if new_item.widget:
-            layout.addWidget(new_item.widget, row, 1)
-        elif new_item.widget_label:
-            layout.addWidget(new_item.widget_label, row, 1)
+        if self.virtualized:
+            self.createPlaceholder(new_item, index.property(), parent_widget, layout, row)
+            self.scheduleVirtualUpdate()
         else:
-            span = 2
-        
-        layout.addWidget(new_item.label, row, 0, 1, span)
+            self.createItemWidgets(new_item, index.property(), parent_widget, layout, row)
 
         self.item_to_index[new_item] = index
         self.index_to_item[index] = new_item
@@ -326,6 +615,10 @@ class QtGroupBoxPropertyBrowser(QtAbstractPropertyBrowser):
             item.group_box.close()
             del item.group_box
 
+        if item.placeholder:
+            self.removePlaceholder(item, self.itemContainer(item)[0])
+        self.realized_items.discard(item)
+
         if not parent_item:
             self.removeRow(self.main_layout, row)
         elif len(parent_item.children) > 0:
@@ -347,18 +640,18 @@ class QtGroupBoxPropertyBrowser(QtAbstractPropertyBrowser):
 
             if parent_item.widget:
                 parent_item.widget.hide()
-                parent_item.widget.setParent(0)
+                parent_item.widget.setParent(None)
             elif parent_item.widget_label:
                 parent_item.widget_label.hide()
-                parent_item.widget_label.setParent(0)
+                parent_item.widget_label.setParent(None)
             else:
                 pass
 
             l.removeWidget(parent_item.group_box)
             parent_item.group_box.close()
-            parent_item.group_box = 0
-            parent_item.line = 0
-            parent_item.layout = 0
+            parent_item.group_box = None
+            parent_item.line = None
+            parent_item.layout = None
 
             if not parent_item in self.recreate_queue:
                 self.recreate_queue.append(parent_item)
@@ -448,3 +741,13 @@ class QtGroupBoxPropertyBrowser(QtAbstractPropertyBrowser):
             item.widget.setEnabled(prop.isEnabled())
             item.widget.setToolTip(prop.valueText())
 
+        if item.placeholder:
+            layout, parent_widget = self.itemContainer(item)
+            name_spacer, value_spacer = item.placeholder
+            name_width = parent_widget.fontMetrics().horizontalAdvance(prop.propertyName())
+            if name_spacer.sizeHint().width() != name_width:
+                name_spacer.changeSize(name_width, self.placeholderHeight(layout),
+                                       QSizePolicy.Fixed, QSizePolicy.Fixed)
+                layout.invalidate()
+            parent_widget.update(name_spacer.geometry().united(value_spacer.geometry()))
+
@@ -0,0 +1,630 @@
+#############################################################################
+##
+## Copyright (C) 2013 Digia Plc and/or its subsidiary(-ies).
+## Contact: http:##www.qt-project.org/legal
+##
+## This file is part of the Qt Solutions component.
+##
+## $QT_BEGIN_LICENSE:BSD$
+## You may use this file under the terms of the BSD license as follows:
+##
+## "Redistribution and use in source and binary forms, with or without
+## modification, are permitted provided that the following conditions are
+## met:
+##   * Redistributions of source code must retain the above copyright
+##     notice, this list of conditions and the following disclaimer.
+##   * Redistributions in binary form must reproduce the above copyright
+##     notice, this list of conditions and the following disclaimer in
+##     the documentation and/or other materials provided with the
+##     distribution.
+##   * Neither the name of Digia Plc and its Subsidiary(-ies) nor the names
+##     of its contributors may be used to endorse or promote products derived
+##     from this software without specific prior written permission.
+##
+##
+## THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+## "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+## LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+## A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+## OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+## SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+## LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+## DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+## THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+## (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+## OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE."
+##
+## $QT_END_LICENSE$
+##
+#############################################################################
+#
+# Modified by Youngki Kim in 2021/11/17 for PySide6 support
+#
+############################################################################
+
+from PySide6.QtCore import (
+    Qt,
+    QSize,
+    QCoreApplication,
+    QAbstractItemModel,
+    QModelIndex,
+    Property,
+    Signal,
+    Slot
+)
+from PySide6.QtWidgets import QTreeView, QAbstractItemView, QHBoxLayout, QHeaderView
+from PySide6.QtGui import QIcon, QColor
+
+from libqt5.pyqtcore import QMap
+from QtProperty.qtbrowseritem import QtBrowserItem
+from QtProperty.qtproperty import QtProperty
+from QtProperty.qtabstractpropertybrowser import QtAbstractPropertyBrowser
+from QtProperty.qttreepropertybrowser import (
+    QtPropertyEditorDelegate,
+    drawIndicatorIcon,
+    propertyRowOption,
+    drawRowGridLine
+)
+
+# data() and flags() run for every painted cell; the fully qualified enum
+# values are resolved once here, PySide looks up the short Qt.* names slowly.
+DISPLAY_ROLE = Qt.ItemDataRole.DisplayRole
+DECORATION_ROLE = Qt.ItemDataRole.DecorationRole
+TOOLTIP_ROLE = Qt.ItemDataRole.ToolTipRole
+STATUSTIP_ROLE = Qt.ItemDataRole.StatusTipRole
+WHATSTHIS_ROLE = Qt.ItemDataRole.WhatsThisRole
+SERVED_ROLES = frozenset((DISPLAY_ROLE, DECORATION_ROLE, TOOLTIP_ROLE, STATUSTIP_ROLE, WHATSTHIS_ROLE))
+ITEM_FLAGS = Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsEditable
+ITEM_IS_ENABLED = Qt.ItemFlag.ItemIsEnabled
+
+
+#####################################################################################
+#
+#   class QtPropertyBrowserModel
+#
+#   brief Item model over the QtBrowserItem tree of a QtModelPropertyBrowser.
+#
+#   Every model index points at its QtBrowserItem, and the row of an item is its
+#   position in the parent's children (or in the browser's top level items).
+#   Nothing is copied per row: data() asks the property for its name, value text,
+#   icon and tips when the view needs them, i.e. only for visible rows.
+#
+#####################################################################################
+class QtPropertyBrowserModel(QAbstractItemModel):
+    def __init__(self, browser):
+        super(QtPropertyBrowserModel, self).__init__(browser)
+        self.m_browser = browser
+
+    def siblings(self, item):
+        parent = item.parent()
+        if parent:
+            return parent.children()
+        return self.m_browser.topLevelItems()
+
+    def itemIndex(self, item, column=0):
+        """
+        Returns the model index of the given browser item.
+        """
+        if not item:
+            return QModelIndex()
+        return self.createIndex(self.siblings(item).indexOf(item), column, item)
+
+    def indexItem(self, index):
+        """
+        Returns the browser item of the given model index, or None for the root.
+        """
+        if not index.isValid():
+            return None
+        return index.internalPointer()
+
+    def index(self, row, column, parent=QModelIndex()):
+        """
+        Reimplementation
+        """
+        if parent.isValid():
+            children = parent.internalPointer().children()
+        else:
+            children = self.m_browser.topLevelItems()
+
+        if row < 0 or row >= len(children) or column < 0 or column > 1:
+            return QModelIndex()
+        return self.createIndex(row, column, children[row])
+
+    def parent(self, index):
+        """
+        Reimplementation
+        """
+        if not index.isValid():
+            return QModelIndex()
+        return self.itemIndex(index.internalPointer().parent())
+
+    def rowCount(self, parent=QModelIndex()):
+        """
+        Reimplementation
+        """
+        if not parent.isValid():
+            return len(self.m_browser.topLevelItems())
+        if parent.column() > 0:
+            return 0
+        return len(parent.internalPointer().children())
+
+    def columnCount(self, parent=QModelIndex()):
+        """
+        Reimplementation
+        """
+        return 2
+
+    def hasChildren(self, parent=QModelIndex()):
+        """
+        Reimplementation
+        """
+        return self.rowCount(parent) > 0 or self.canFetchMore(parent)
+
+    def canFetchMore(self, parent):
+        """
+        Reimplementation
+        """
+        return parent.isValid() and self.m_browser.hasDeferredChildren(parent.internalPointer())
+
+    def fetchMore(self, parent):
+        """
+        Reimplementation
+        """
+        if parent.isValid():
+            self.m_browser.createDeferredItems(parent.internalPointer())
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        """
+        Reimplementation
+        """
+        if orientation != Qt.Horizontal or role != Qt.DisplayRole:
+            return None
+        if section == 0:
+            return QCoreApplication.translate("QtTreePropertyBrowser", "Property")
+        return QCoreApplication.translate("QtTreePropertyBrowser", "Value")
+
+    def data(self, index, role=Qt.DisplayRole):
+        """
+        Reimplementation
+        """
+        if role not in SERVED_ROLES or not index.isValid():
+            return None
+
+        prop = index.internalPointer().property()
+        if index.column() == 0:
+            if role == DISPLAY_ROLE or role == TOOLTIP_ROLE:
+                return prop.propertyName()
+            if role == DECORATION_ROLE:
+                if (not prop.hasValue() and self.m_browser.markPropertiesWithoutValue()
+                        and not self.m_browser.treeWidget().rootIsDecorated()):
+                    return self.m_browser.m_expandIcon
+                return None
+            if role == STATUSTIP_ROLE:
+                return prop.statusTip()
+            if role == WHATSTHIS_ROLE:
+                return prop.whatsThis()
+            return None
+
+        if not prop.hasValue():
+            return None
+        if role == DISPLAY_ROLE:
+            displayText = prop.displayText()
+            if len(displayText) <= 0:
+                return prop.valueText()
+            return displayText
+        if role == DECORATION_ROLE:
+            return prop.valueIcon()
+        if role == TOOLTIP_ROLE:
+            toolTip = prop.toolTip()
+            if len(toolTip) <= 0:
+                return prop.displayText()
+            return toolTip
+        return None
+
+    def flags(self, index):
+        """
+        Reimplementation
+        """
+        if not index.isValid():
+            return Qt.NoItemFlags
+
+        if self.isItemEnabled(index.internalPointer()):
+            return ITEM_FLAGS | ITEM_IS_ENABLED
+        return ITEM_FLAGS
+
+    def isItemEnabled(self, item):
+        # An item is enabled if its property and those of all its parents are.
+        while item:
+            if not item.property().isEnabled():
+                return False
+            item = item.parent()
+        return True
+
+    def beginInsertItem(self, item, afterItem):
+        """
+        Starts inserting an item after afterItem; the caller attaches it and calls endInsertRows().
+        """
+        row = self.siblings(item).indexOf(afterItem) + 1
+        self.beginInsertRows(self.itemIndex(item.parent()), row, row)
+
+    def beginRemoveItem(self, item):
+        """
+        Starts removing an item; the caller detaches it and calls endRemoveRows().
+        """
+        row = self.siblings(item).indexOf(item)
+        self.beginRemoveRows(self.itemIndex(item.parent()), row, row)
+
+    def itemChanged(self, item):
+        row = self.siblings(item).indexOf(item)
+        self.dataChanged.emit(self.createIndex(row, 0, item), self.createIndex(row, 1, item))
+
+
+## ------------ QtPropertyModelView
+class QtPropertyModelView(QTreeView):
+    def __init__(self, parent):
+        super(QtPropertyModelView, self).__init__(parent)
+
+        self.m_editorPrivate = None
+        self.header().sectionDoubleClicked.connect(self.resizeColumnToContents)
+
+    def setEditorPrivate(self, editorPrivate):
+        self.m_editorPrivate = editorPrivate
+
+    def drawRow(self, painter, option, index):
+        opt = propertyRowOption(self.m_editorPrivate, painter, option, index)
+        super(QtPropertyModelView, self).drawRow(painter, opt, index)
+        drawRowGridLine(painter, opt)
+
+    def keyPressEvent(self, event):
+        if event.key() in [Qt.Key_Return, Qt.Key_Enter, Qt.Key_Space]:  # Trigger Edit
+            if not self.m_editorPrivate.editedItem():
+                index = self.currentIndex()
+                if index.isValid():
+                    ## If the current position is at column 0, move to 1.
+                    index = index.sibling(index.row(), 1)
+                    if (index.flags() & (Qt.ItemIsEditable | Qt.ItemIsEnabled)) == (Qt.ItemIsEditable | Qt.ItemIsEnabled):
+                        event.accept()
+                        self.setCurrentIndex(index)
+                        self.edit(index)
+                        return
+
+        super(QtPropertyModelView, self).keyPressEvent(event)
+
+    def mousePressEvent(self, event):
+        super(QtPropertyModelView, self).mousePressEvent(event)
+        index = self.indexAt(event.pos())
+
+        if index.isValid():
+            item = index.internalPointer()
+            if ((item != self.m_editorPrivate.editedItem()) and (event.button() == Qt.LeftButton)
+                    and (self.header().logicalIndexAt(event.pos().x()) == 1)
+                    and ((index.flags() & (Qt.ItemIsEditable | Qt.ItemIsEnabled)) == (Qt.ItemIsEditable | Qt.ItemIsEnabled))):
+                self.edit(index.sibling(index.row(), 1))
+            elif not item.property().hasValue() and self.m_editorPrivate.markPropertiesWithoutValue() and not self.rootIsDecorated():
+                if event.pos().x() + self.header().offset() < 20:
+                    self.setExpanded(index, not self.isExpanded(index))
+
+
+######################################################################
+#
+#   class QtModelPropertyBrowser
+#
+#   brief The QtModelPropertyBrowser class provides a QTreeView based
+#   property browser backed by a QAbstractItemModel.
+#
+#   It offers the API of QtTreePropertyBrowser, but no tree widget item
+#   is created per property: QtPropertyBrowserModel serves the browser
+#   items directly and reads names, values and icons from the managers
+#   when the view paints a row. Memory stays flat and only visible rows
+#   cost anything, which suits browsers showing 100k+ properties.
+#
+#   Like in QtTreePropertyBrowser, an item is expanded when its first
+#   child is inserted. In lazy mode (see setLazyItems()) the model
+#   fetches deferred children when their parent is expanded.
+#
+######################################################################
+class QtModelPropertyBrowser(QtAbstractPropertyBrowser):
+    Interactive, Stretch, Fixed, ResizeToContents = range(4)
+
+    # Defines signals
+    collapsedSignal = Signal(QtBrowserItem)
+    expandedSignal = Signal(QtBrowserItem)
+
+    def __init__(self, parent=None) -> None:
+        super(QtModelPropertyBrowser, self).__init__(parent)
+
+        self.m_indexToBackgroundColor = QMap()
+        # Background color inherited by each painted item, see calculatedBackgroundColor()
+        self.m_itemToCalculatedColor = {}
+
+        self.m_model = None
+        self.m_treeView = None
+        self.m_headerVisible = True
+        self.m_resizeMode = QtModelPropertyBrowser.Stretch
+        self.m_delegate = None
+        self.m_markPropertiesWithoutValue = False
+        self.m_browserChangedBlocked = False
+        self.m_expandIcon = QIcon()
+
+        self.init(self)
+        self.currentItemChangedSignal.connect(self.slotCurrentBrowserItemChanged)
+
+    def init(self, parent):
+        layout = QHBoxLayout(parent)
+        layout.setContentsMargins(0, 0, 0, 0)
+        self.m_model = QtPropertyBrowserModel(self)
+        self.m_treeView = QtPropertyModelView(parent)
+        self.m_treeView.setEditorPrivate(self)
+        self.m_treeView.setIconSize(QSize(18, 18))
+        self.m_treeView.setModel(self.m_model)
+        layout.addWidget(self.m_treeView)
+        parent.setFocusProxy(self.m_treeView)
+
+        self.m_treeView.setAlternatingRowColors(True)
+        self.m_treeView.setEditTriggers(QAbstractItemView.EditKeyPressed)
+        self.m_delegate = QtPropertyEditorDelegate(parent)
+        self.m_delegate.setEditorPrivate(self)
+        self.m_treeView.setItemDelegate(self.m_delegate)
+        self.m_treeView.header().setSectionsMovable(False)
+        self.m_treeView.header().setSectionResizeMode(QHeaderView.Stretch)
+
+        self.m_expandIcon = drawIndicatorIcon(self.palette(), self.style())
+
+        self.m_treeView.collapsed.connect(self.slotCollapsed)
+        self.m_treeView.expanded.connect(self.slotExpanded)
+        self.m_treeView.selectionModel().currentChanged.connect(self.slotCurrentIndexChanged)
+
+    def model(self):
+        return self.m_model
+
+    def treeWidget(self):
+        """
+        Returns the tree view; named as in QtTreePropertyBrowser for the shared delegate.
+        """
+        return self.m_treeView
+
+    def currentItem(self):
+        return self.m_model.indexItem(self.m_treeView.currentIndex())
+
+    def setCurrItem(self, browserItem, block):
+        # The view follows the selection model's signals, so they are never blocked;
+        # slotCurrentIndexChanged() then finds browserItem already current.
+        self.m_treeView.setCurrentIndex(self.m_model.itemIndex(browserItem))
+
+    def indexToProperty(self, index):
+        item = self.m_model.indexItem(index)
+        if item:
+            return item.property()
+        return 0
+
+    def propertyToIndex(self, prop: QtProperty):
+        indices = self.m_propertyToIndexes.get(prop)
+        if not indices:
+            return
+
+        return indices[0]
+
+    def indexToBrowserItem(self, index):
+        return self.m_model.indexItem(index)
+
+    def indexToItem(self, index):
+        return self.m_model.indexItem(index)
+
+    def lastColumn(self, column):
+        return self.m_treeView.header().visualIndex(column) == self.m_model.columnCount() - 1
+
+    def markPropertiesWithoutValue(self):
+        return self.m_markPropertiesWithoutValue
+
+    def editedItem(self):
+        return self.m_delegate.editedItem()
+
+    def editItem(self, browserItem):
+        index = self.m_model.itemIndex(browserItem, 1)
+        if index.isValid():
+            self.m_treeView.setCurrentIndex(index)
+            self.m_treeView.edit(index)
+
+    def indentation(self):
+        return self.m_treeView.indentation()
+
+    def setIndentation(self, i):
+        self.m_treeView.setIndentation(i)
+
+    def rootIsDecorated(self):
+        return self.m_treeView.rootIsDecorated()
+
+    def setRootIsDecorated(self, show):
+        # The expand icons of properties without value are served by data()
+        self.m_treeView.setRootIsDecorated(show)
+        self.m_treeView.viewport().update()
+
+    def alternatingRowColors(self):
+        return self.m_treeView.alternatingRowColors()
+
+    def setAlternatingRowColors(self, enable):
+        self.m_treeView.setAlternatingRowColors(enable)
+
+    def isHeaderVisible(self):
+        return self.m_headerVisible
+
+    def setHeaderVisible(self, visible):
+        if self.m_headerVisible == visible:
+            return
+
+        self.m_headerVisible = visible
+        self.m_treeView.header().setVisible(visible)
+
+    def resizeMode(self):
+        return self.m_resizeMode
+
+    def setResizeMode(self, mode):
+        if self.m_resizeMode == mode:
+            return
+
+        self.m_resizeMode = mode
+        m = QHeaderView.Stretch
+        if mode == QtModelPropertyBrowser.Interactive:
+            m = QHeaderView.Interactive
+        elif mode == QtModelPropertyBrowser.Fixed:
+            m = QHeaderView.Fixed
+        elif mode == QtModelPropertyBrowser.ResizeToContents:
+            m = QHeaderView.ResizeToContents
+
+        self.m_treeView.header().setSectionResizeMode(m)
+
+    def scrollPosition(self):
+        return self.m_treeView.horizontalScrollBar().value(), self.m_treeView.verticalScrollBar().value()
+
+    def setScrollPosition(self, dx, dy):
+        self.m_treeView.horizontalScrollBar().setValue(dx)
+        self.m_treeView.verticalScrollBar().setValue(dy)
+
+    def splitterPosition(self):
+        return self.m_treeView.header().sectionSize(0)
+
+    def setSplitterPosition(self, position):
+        self.m_treeView.header().resizeSection(0, position)
+
+    def setExpanded(self, item: QtBrowserItem, expanded: bool) -> None:
+        index = self.m_model.itemIndex(item)
+        if index.isValid():
+            self.m_treeView.setExpanded(index, expanded)
+
+    def setExpandedByProperty(self, prop: QtProperty, expanded: bool) -> None:
+        self.setExpanded(self.propertyToIndex(prop), expanded)
+
+    def isExpanded(self, item: QtBrowserItem) -> bool:
+        index = self.m_model.itemIndex(item)
+        if index.isValid():
+            return self.m_treeView.isExpanded(index)
+
+        return False
+
+    def isItemVisible(self, item: QtBrowserItem) -> bool:
+        index = self.m_model.itemIndex(item)
+        if index.isValid():
+            return not self.m_treeView.isRowHidden(index.row(), index.parent())
+        return False
+
+    def setItemVisible(self, item: QtBrowserItem, visible: bool) -> None:
+        index = self.m_model.itemIndex(item)
+        if index.isValid():
+            self.m_treeView.setRowHidden(index.row(), index.parent(), not visible)
+
+    def setBackgroundColor(self, item, color):
+        if not item in self.m_propertyToIndexes.get(item.property(), ()):
+            return
+        if color.isValid():
+            self.m_indexToBackgroundColor[item] = color
+        else:
+            self.m_indexToBackgroundColor.remove(item)
+        # The color is inherited by the whole subtree
+        self.m_itemToCalculatedColor.clear()
+        self.m_treeView.viewport().update()
+
+    def backgroundColor(self, item):
+        return self.m_indexToBackgroundColor.get(item)
+
+    def calculatedBackgroundColor(self, item):
+        if not item:
+            return QColor()
+
+        color = self.m_itemToCalculatedColor.get(item)
+        if color is None:
+            color = self.m_indexToBackgroundColor.get(item)
+            if color is None:
+                color = self.calculatedBackgroundColor(item.parent())
+            self.m_itemToCalculatedColor[item] = color
+        return color
+
+    def setPropertiesWithoutValueMarked(self, mark):
+        if self.m_markPropertiesWithoutValue == mark:
+            return
+
+        self.m_markPropertiesWithoutValue = mark
+        self.m_treeView.viewport().update()
+
+    def propertiesWithoutValueMarked(self):
+        return self.m_markPropertiesWithoutValue
+
+    def itemAboutToBeInserted(self, item, afterItem):
+        """
+        Reimplementation
+        """
+        # The row must not exist before beginInsertRows(); QtAbstractPropertyBrowser
+        # attaches the item between this call and itemInserted().
+        self.m_model.beginInsertItem(item, afterItem)
+
+    def itemInserted(self, item, afterItem):
+        """
+        Reimplementation
+        """
+        self.m_model.endInsertRows()
+        if not item.property().hasValue():
+            index = self.m_model.itemIndex(item)
+            self.m_treeView.setFirstColumnSpanned(index.row(), index.parent(), True)
+
+        parent = item.parent()
+        if parent and len(parent.children()) == 1:
+            parentIndex = self.m_model.itemIndex(parent)
+            # Children fetched on expansion are inserted while the parent is already expanded
+            if not self.m_treeView.isExpanded(parentIndex):
+                self.m_treeView.expand(parentIndex)
+
+    def itemRemoved(self, item):
+        """
+        Reimplementation
+        """
+        # The row has to be gone between beginRemoveRows() and endRemoveRows(), so the item is
+        # detached here; the removal in QtAbstractPropertyBrowser then has nothing left to do.
+        self.m_model.beginRemoveItem(item)
+        parent = item.parent()
+        if parent:
+            parent.removeChild(item)
+        else:
+            self.m_topLevelIndexes.removeAll(item)
+        self.m_model.endRemoveRows()
+        self.m_indexToBackgroundColor.remove(item)
+        self.m_itemToCalculatedColor.pop(item, None)
+
+    def itemChanged(self, item):
+        """
+        Reimplementation
+        """
+        self.m_model.itemChanged(item)
+
+    @Slot(QModelIndex)
+    def slotCollapsed(self, index):
+        item = self.m_model.indexItem(index)
+        if item:
+            self.collapsedSignal.emit(item)
+
+    @Slot(QModelIndex)
+    def slotExpanded(self, index):
+        item = self.m_model.indexItem(index)
+        if item:
+            # The view does not fetch children of items expanded while hidden
+            self.createDeferredItems(item)
+            self.expandedSignal.emit(item)
+
+    @Slot(QtBrowserItem)
+    def slotCurrentBrowserItemChanged(self, item):
+        if not self.m_browserChangedBlocked and item != self.currentItem():
+            self.setCurrItem(item, True)
+
+    @Slot(QModelIndex, QModelIndex)
+    def slotCurrentIndexChanged(self, index, previous):
+        browserItem = self.m_model.indexItem(index)
+
+        self.m_browserChangedBlocked = True
+        self.setCurrentItem(browserItem)
+        self.m_browserChangedBlocked = False
+
+    indentation = Property(int, indentation, setIndentation)
+    rootIsDecorated = Property(bool, rootIsDecorated, setRootIsDecorated)
+    alternatingRowColors = Property(bool, alternatingRowColors, setAlternatingRowColors)
+    headerVisible = Property(bool, isHeaderVisible, setHeaderVisible)
+    resizeMode = Property(int, resizeMode, setResizeMode)
+    splitterPosition = Property(int, splitterPosition, setSplitterPosition)
+    propertiesWithoutValueMarked = Property(bool, propertiesWithoutValueMarked, setPropertiesWithoutValueMarked)
@@ -42,11 +42,20 @@
 #
 ############################################################################
 
-import copy
-from libqt5.pyqtcore import QList, QMap
+from libqt5.pyqtcore import QList, QIndexedList, QEmptyList
 from PySide6.QtGui import QColor, QIcon
 
 
+# Shared defaults for leaf properties. A color left at None reads as an invalid QColor,
+# and the child/parent containers are only allocated once a property gets linked.
+# The sentinels only mark states and are never handed out; subProperties() returns
+# _EMPTY_SUB_PROPERTIES for a leaf.
+_NO_SUB_ITEMS = QIndexedList()
+# Marks a property whose manager creates its subproperties on first use.
+_DEFERRED_SUB_ITEMS = QIndexedList()
+_NO_PARENT_ITEMS = frozenset()
+_EMPTY_SUB_PROPERTIES = QEmptyList()
+
 ######################################################################
 #
 #   class QtProperty
@@ -84,6 +93,9 @@ from PySide6.QtGui import QColor, QIcon
 #
 ######################################################################
 class QtProperty:
+    __slots__ = ('m_enabled', 'm_modified', 'm_manager', 'm_parentItems', 'm_subItems',
+                 'm_toolTip', 'm_statusTip', 'm_whatsThis', 'm_name', 'm_nameColor', 'm_valueColor')
+
     def __init__(self, manager=None) -> None:
         """
         Creates a property with the given manager.
@@ -96,14 +108,14 @@ class QtProperty:
         self.m_modified = False
         self.m_manager = manager
 
-        self.m_parentItems = set()
-        self.m_subItems = QList()
+        self.m_parentItems = _NO_PARENT_ITEMS
+        self.m_subItems = _NO_SUB_ITEMS
         self.m_toolTip = ''
         self.m_statusTip = ''
         self.m_whatsThis = ''
         self.m_name = ''
-        self.m_nameColor = QColor()
-        self.m_valueColor = QColor()
+        self.m_nameColor = None
+        self.m_valueColor = None
 
     def __del__(self) -> None:
         """
@@ -137,8 +149,40 @@ class QtProperty:
         Note that subproperties are not owned by this property,
         but by the manager that created them.
         """
+        if self.m_subItems is _DEFERRED_SUB_ITEMS:
+            self.createSubProperties()
+        if self.m_subItems is _NO_SUB_ITEMS:
+            return _EMPTY_SUB_PROPERTIES
         return self.m_subItems
 
+    def deferSubProperties(self) -> None:
+        """
+        Internal function.
+        Marks the subproperties to be created by the manager on the first subProperties() call.
+        """
+        if self.m_subItems is _NO_SUB_ITEMS:
+            self.m_subItems = _DEFERRED_SUB_ITEMS
+
+    def hasDeferredSubProperties(self) -> bool:
+        """
+        Returns whether the manager has not created this property's subproperties yet.
+        """
+        return self.m_subItems is _DEFERRED_SUB_ITEMS
+
+    def hasSubProperties(self) -> bool:
+        """
+        Returns whether this property has subproperties, without creating deferred ones.
+        """
+        return self.m_subItems is _DEFERRED_SUB_ITEMS or len(self.m_subItems) > 0
+
+    def createSubProperties(self) -> None:
+        """
+        Lets the manager create deferred subproperties now. Does nothing otherwise.
+        """
+        if self.m_subItems is _DEFERRED_SUB_ITEMS:
+            self.m_subItems = _NO_SUB_ITEMS
+            self.m_manager.createSubProperties(self)
+
     def propertyManager(self):
         """
         Returns the manager that owns this property.
@@ -264,24 +308,40 @@ class QtProperty:
         self.m_name = text
         self.propertyChanged()
 
+    def nameColor(self) -> QColor:
+        """
+        Returns the property's name color, an invalid color if none was set.
+        """
+        if self.m_nameColor is None:
+            return QColor()
+        return QColor(self.m_nameColor)
+
+    def valueColor(self) -> QColor:
+        """
+        Returns the property's value color, an invalid color if none was set.
+        """
+        if self.m_valueColor is None:
+            return QColor()
+        return QColor(self.m_valueColor)
+
     def setNameColor(self, color) -> None:
         """
         Sets the property's name color to the givne color.
         """
-        if self.m_nameColor == color:
+        if self.nameColor() == color:
             return
 
-        self.m_nameColor = color
+        self.m_nameColor = QColor(color)
         self.propertyChanged()
 
     def setValueColor(self, color) -> None:
         """
         Sets the property's value color to the given color.
         """
-        if self.m_valueColor == color:
+        if self.valueColor() == color:
             return
 
-        self.m_valueColor = color
+        self.m_valueColor = QColor(color)
         self.propertyChanged()
 
     def setEnabled(self, enable) -> None:
@@ -310,8 +370,9 @@ class QtProperty:
         If the given property already is added, this function does nothing.
         """
         after = None
-        if len(self.m_subItems) > 0:
-            after = self.m_subItems[-1]
+        subItems = self.subProperties()
+        if len(subItems) > 0:
+            after = subItems[-1]
         self.insertSubProperty(prop, after)
 
     def insertSubProperty(self, prop, afterProperty) -> None:
@@ -329,38 +390,97 @@ class QtProperty:
         if prop == self:
             return
 
-        # traverse all children of item. if this item is a child of item then cannot add.
-        pendingList = copy.copy(prop.subProperties())
-        visited = QMap()
-        while len(pendingList) > 0:
-            i = pendingList[0]
-            if i == self:
+        self.createSubProperties()
+        if prop in self.m_subItems:
+            return  # if item is already inserted in this item then cannot add.
+
+        # walk up the ancestors of this item. if item is one of them then cannot add.
+        for i in self.ancestors():
+            if i == prop:
                 return
-            pendingList.removeFirst()
-            if visited.get(i):
-                continue
-            visited[i] = True
-            pendingList += i.subProperties()
 
-        pendingList = self.subProperties()
-        pos = 0
         newPos = 0
         properAfterProperty = None
-        while pos < len(pendingList):
-            i = pendingList[pos]
-            if i == prop:
-                return  # if item is already inserted in this item then cannot add.
-            if i == afterProperty:
-                newPos = pos + 1
+        if afterProperty:
+            newPos = self.m_subItems.indexOf(afterProperty) + 1
+            if newPos > 0:
                 properAfterProperty = afterProperty
 
-            pos += 1
-
+        if self.m_subItems is _NO_SUB_ITEMS:
+            self.m_subItems = QIndexedList()
         self.m_subItems.insert(newPos, prop)
+        if prop.m_parentItems is _NO_PARENT_ITEMS:
+            prop.m_parentItems = set()
         prop.m_parentItems.add(self)
 
         self.m_manager.propertyInserted(prop, self, properAfterProperty)
 
+    def addSubProperties(self, props) -> None:
+        """
+        Appends the given properties to this property's subproperties.
+        Properties which are already added are skipped.
+        """
+        after = None
+        subItems = self.subProperties()
+        if len(subItems) > 0:
+            after = subItems[-1]
+        self.insertSubProperties(props, after)
+
+    def insertSubProperties(self, props, afterProperty) -> None:
+        """
+        inserts the given properties, in order, after the specified precedingProperty
+        into this property's list of subproperties.
+
+        Works like calling insertSubProperty() for each property, but the ancestors
+        are only walked once and a single propertiesInserted notification is sent.
+        """
+        self.createSubProperties()
+        ancestors = None
+        newProps = QIndexedList()
+        for prop in props:
+            if not prop or prop == self or prop in self.m_subItems or prop in newProps:
+                continue
+            if ancestors is None:
+                ancestors = set(self.ancestors())
+            if prop in ancestors:
+                continue
+            newProps.append(prop)
+
+        if not newProps:
+            return
+
+        newPos = 0
+        properAfterProperty = None
+        if afterProperty:
+            newPos = self.m_subItems.indexOf(afterProperty) + 1
+            if newPos > 0:
+                properAfterProperty = afterProperty
+
+        if self.m_subItems is _NO_SUB_ITEMS:
+            self.m_subItems = QIndexedList()
+        for prop in newProps:
+            self.m_subItems.insert(newPos, prop)
+            newPos += 1
+            if prop.m_parentItems is _NO_PARENT_ITEMS:
+                prop.m_parentItems = set()
+            prop.m_parentItems.add(self)
+
+        self.m_manager.propertiesInserted(newProps, self, properAfterProperty)
+
+    def ancestors(self):
+        """
+        Yields every property this property is nested in, each one once.
+        """
+        pendingList = list(self.m_parentItems)
+        visited = set(pendingList)
+        while pendingList:
+            i = pendingList.pop()
+            yield i
+            for parent in i.m_parentItems:
+                if parent not in visited:
+                    visited.add(parent)
+                    pendingList.append(parent)
+
     def removeSubProperty(self, prop) -> None:
         """
         Removes the given property from the list of subproperties without deleting it.
@@ -370,15 +490,12 @@ class QtProperty:
 
         self.m_manager.propertyRemoved(prop, self)
 
-        pendingList = self.subProperties()
-        pos = 0
-        while pos < len(pendingList):
-            if pendingList[pos] == prop:
-                self.m_subItems.removeAt(pos)
-                prop.m_parentItems.remove(self)
-                return
-
-            pos += 1
+        if self.m_subItems.removeAll(prop):
+            prop.m_parentItems.remove(self)
+            if not self.m_subItems:
+                self.m_subItems = _NO_SUB_ITEMS
+            if not prop.m_parentItems:
+                prop.m_parentItems = _NO_PARENT_ITEMS
 
     def propertyChanged(self) -> None:
         """
@@ -44,6 +44,15 @@
 
 
 import copy
+from array import array
+from functools import lru_cache
+from operator import attrgetter
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 from PySide6.QtCore import (
     QCoreApplication,
     Qt,
@@ -53,6 +62,7 @@ from PySide6.QtCore import (
     QRect, QRectF,
     QPoint, QPointF,
     QDate, QDateTime, QTime,
+    QTimer,
     qAddPostRoutine
 )
 from PySide6.QtWidgets import (
@@ -88,35 +98,32 @@ DATA_SETMINVAL      = 22
 DATA_SETMAXVAL      = 23
 
 
+# Data attribute read for each DATA_* id. Unknown ids read the value, like before.
+DATA_ATTRIBUTES = {
+    DATA_VAL:           'val',
+    DATA_MINVAL:        'min_val',
+    DATA_MAXVAL:        'max_val',
+    DATA_SINGLESTEP:    'single_step',
+    DATA_READONLY:      'read_only',
+    DATA_DECIMALS:      'decimals',
+    DATA_TEXTVISIBLE:   'text_visible',
+    DATA_ENUMNAMES:     'enum_names',
+    DATA_FLAGNAMES:     'flag_names',
+    DATA_REGEXP:        'regExp',
+    DATA_ECHOMODE:      'echo_mode',
+    DATA_CONSTRAINT:    'constraint',
+    DATA_ENUMICONS:     'enum_icons',
+}
+DATA_GETTERS = {data: attrgetter(name) for data, name in DATA_ATTRIBUTES.items()}
+getVal = DATA_GETTERS[DATA_VAL]
+
+
 def getData(propertyMap, data, prop, defaultValue=None):
     it = propertyMap.get(prop)
 
     if not it:
         return defaultValue
-    if data == DATA_MINVAL:
-        return it.min_val
-    elif data == DATA_MAXVAL:
-        return it.max_val
-    elif data == DATA_SINGLESTEP:
-        return it.single_step
-    elif data == DATA_READONLY:
-        return it.read_only
-    elif data == DATA_DECIMALS:
-        return it.decimals
-    elif data == DATA_TEXTVISIBLE:
-        return it.text_visible
-    elif data == DATA_ENUMNAMES:
-        return it.enum_names
-    elif data == DATA_ENUMICONS:
-        return it.enum_icons
-    elif data == DATA_FLAGNAMES:
-        return it.flag_names
-    elif data == DATA_REGEXP:
-        return it.regExp
-    elif data == DATA_ECHOMODE:
-        return it.echo_mode
-    else:
-        return it.val
+    return DATA_GETTERS.get(data, getVal)(it)
 
 
 def getValue(propertyMap, prop, defaultValue=None):
@@ -142,11 +149,11 @@ def setSimpleMaxData(data, max_val):
 
 
 def setSimpleValue(prop_map, 
-                   prop_changed_signal,
+                   prop_changed,
                    value_changed_signal,
                    prop,
                    val):
-    if not prop in prop_map.keys():
+    if not prop in prop_map:
         return
     
     if prop_map[prop] == val:
@@ -154,7 +161,7 @@ def setSimpleValue(prop_map,
     
     prop_map[prop] = val
 
-    prop_changed_signal.emit(prop)
+    prop_changed(prop)
     value_changed_signal.emit(prop, val)
 
 
@@ -166,8 +173,8 @@ def getMaximum(property_map, prop, default_value=None):
     return getData(property_map, DATA_MAXVAL, prop, default_value)
 
 
-def setValueInRange(mgr, prop_changed_signal, value_changed_signal, prop, val, set_subprop_value=None):
-    if not prop in mgr.values.keys():
+def setValueInRange(mgr, prop_changed, value_changed_signal, prop, val, set_subprop_value=None):
+    if not prop in mgr.values:
         return
 
     data = mgr.values[prop]
@@ -184,10 +191,71 @@ def setValueInRange(mgr, prop_changed_signal, value_changed_signal, prop, val, s
     if set_subprop_value:
         set_subprop_value(prop, data.val)
 
-    prop_changed_signal.emit(prop)
+    prop_changed(prop)
     value_changed_signal.emit(prop, data.val)
 
 
+def clampColumnValues(values, props, vals):
+    """
+    Clamps vals to the ranges of props in the QtNumericColumns values and
+    writes them to the value column. Unknown properties are skipped and
+    a property listed twice takes its last value.
+    Returns the (property, value) pairs that changed.
+    """
+    slots = values.slots
+    if numpy is not None and isinstance(vals, numpy.ndarray):
+        dtype = numpy.int64 if values.typecode == 'q' else numpy.float64
+        rows = numpy.fromiter((slots.get(prop, -1) for prop in props), numpy.intp, len(props))
+        known = numpy.flatnonzero(rows >= 0)
+        # keeps the last entry of every row
+        rows, last = numpy.unique(rows[known][::-1], return_index=True)
+        new = vals.ravel()[known[::-1][last]]
+        if dtype is numpy.int64:
+            new = numpy.clip(new, INT_MIN, INT_MAX).astype(dtype)
+        else:
+            new = new.astype(dtype)
+        # views on the columns, released when this function returns
+        val = numpy.frombuffer(values.val, dtype)
+        new = numpy.maximum(numpy.minimum(numpy.frombuffer(values.max_val, dtype)[rows], new),
+                            numpy.frombuffer(values.min_val, dtype)[rows])
+        changed = numpy.flatnonzero(new != val[rows])
+        rows = rows[changed]
+        new = new[changed]
+        val[rows] = new
+        return list(zip(map(values.props.__getitem__, rows.tolist()), new.tolist()))
+
+    cast = values.cast
+    val, min_val, max_val = values.val, values.min_val, values.max_val
+    pending = {slots[prop]: value for prop, value in zip(props, vals) if prop in slots}
+    # Cast before comparing, so 3.0 or 3.4 for an int property holding 3 is no change
+    clamped = [(row, max(min(max_val[row], cast(value)), min_val[row])) for row, value in pending.items()]
+    changed = [(row, value) for row, value in clamped if value != val[row]]
+    for row, value in changed:
+        val[row] = value
+    return [(values.props[row], value) for row, value in changed]
+
+
+def setValuesInRange(mgr, prop_changed, value_changed_signal, props, vals):
+    # vals may be any sequence; numpy arrays are clamped without converting them to lists.
+    if not isinstance(props, (list, tuple)):
+        props = list(props)
+    if not isinstance(vals, (list, tuple)) and not (numpy is not None and isinstance(vals, numpy.ndarray)):
+        vals = list(vals)
+
+    if len(props) != len(vals):
+        raise ValueError("setValues() got %d properties but %d values" % (len(props), len(vals)))
+
+    changed = clampColumnValues(mgr.values, props, vals)
+    if not changed:
+        return
+
+    mgr.beginUpdate()
+    for prop, val in changed:
+        prop_changed(prop)
+        value_changed_signal.emit(prop, val)
+    mgr.endUpdate()
+
+
 def qBoundSize(min_val, val, max_val):
     t1 = type(min_val)
     t2 = type(val)
@@ -221,29 +289,29 @@ def qBound(min_val, val, max_val):
 
 
 def setMinimumValue(mgr,
-                    prop_changed_signal,
+                    prop_changed,
                     value_changed_signal,
                     range_changed_signal,
                     prop,
                     min_val):
     set_sub_prop_range = 0
-    setBorderValue(mgr, prop_changed_signal, value_changed_signal, range_changed_signal,
+    setBorderValue(mgr, prop_changed, value_changed_signal, range_changed_signal,
                    prop, DATA_GETMINVAL, DATA_SETMINVAL, min_val, set_sub_prop_range)
 
 
 def setMaximumValue(mgr,
-                    prop_changed_signal,
+                    prop_changed,
                     value_changed_signal,
                     range_changed_signal,
                     prop,
                     max_val):
     set_sub_prop_range = 0
-    setBorderValue(mgr, prop_changed_signal, value_changed_signal, range_changed_signal,
+    setBorderValue(mgr, prop_changed, value_changed_signal, range_changed_signal,
                    prop, DATA_GETMAXVAL, DATA_SETMAXVAL, max_val, set_sub_prop_range)
 
 
 def setBorderValue(mgr,
-                   prop_changed_signal,
+                   prop_changed,
                    value_changed_signal,
                    range_changed_signal,
                    prop,
@@ -251,7 +319,7 @@ def setBorderValue(mgr,
                    set_range_val,
                    border_val,
                    set_subprop_range):
-    if not prop in mgr.values.keys():
+    if not prop in mgr.values:
         return
 
     data = mgr.values[prop]
@@ -283,19 +351,19 @@ def setBorderValue(mgr,
     if data.val == old_val:
         return
 
-    prop_changed_signal.emit(prop)
+    prop_changed(prop)
     value_changed_signal.emit(prop, data.val)
 
 
 def setBorderValues(mgr,
-                    prop_changed_signal,
+                    prop_changed,
                     value_changed_signal,
                     range_changed_signal,
                     prop,
                     min_val,
                     max_val,
                     set_subprop_range):
-    if not prop in mgr.values.keys():
+    if not prop in mgr.values:
         return
 
     from_val = min_val
@@ -328,7 +396,7 @@ def setBorderValues(mgr,
     if data.val == old_val:
         return
 
-    prop_changed_signal.emit(prop)
+    prop_changed(prop)
     value_changed_signal.emit(prop, data.val)
 
 
@@ -347,7 +415,53 @@ def orderSizeBorders(min_val, max_val):
     return (from_size, to_size)
 
 
+def linkSubProperty(sub_to_prop, prop_to_sub, prop, sub):
+    """
+    Registers sub as the prop_to_sub subproperty of prop.
+
+    sub_to_prop is the composite manager's reverse index. It maps every
+    subproperty to a (parent, channel) pair, the channel being the prop_to_sub
+    map the subproperty belongs to, so that value changes and destruction
+    of a subproperty are routed to its parent with a single lookup.
+    """
+    prop_to_sub[prop] = sub
+    sub_to_prop[sub] = (prop, prop_to_sub)
+
+
+def unlinkSubProperties(sub_to_prop, prop, *channels):
+    """
+    Forgets the subproperties of prop registered in the given channels.
+    """
+    for prop_to_sub in channels:
+        sub = prop_to_sub.pop(prop, None)
+        if sub:
+            sub_to_prop.remove(sub)
+
+
+def unlinkDestroyedSubProperty(sub_to_prop, sub):
+    """
+    Forgets a destroyed subproperty, leaving 0 in its parent's channel.
+    """
+    parent, prop_to_sub = sub_to_prop.pop(sub, (None, None))
+    if parent:
+        prop_to_sub[parent] = 0
+
+
+@lru_cache(maxsize=4096)
+def flagValueText(flag_names, val):
+    """
+    Returns the text of a flag property: the names of the set flags joined by " | ".
+    flag_names must be a tuple; properties sharing the same flag names share the cache.
+    """
+    return " | ".join(name for level, name in enumerate(flag_names) if val >> level & 1)
+
+
 def drawCheckBox(value):
+    style = QApplication.style()
+    return iconCache().get(("checkBox", bool(value), style.name()), lambda: drawCheckBoxIcon(value, style))
+
+
+def drawCheckBoxIcon(value, style):
     opt = QStyleOptionButton()
     if value:
         opt.state |= QStyle.State_On
@@ -355,7 +469,6 @@ def drawCheckBox(value):
         opt.state |= QStyle.State_Off
 
     opt.state |= QStyle.State_Enabled
-    style = QApplication.style()
 
     # Figure out size of an indicator and make sure it is not scaled down in a list view item
     # by making the pixmap as big as a list view icon and centering the indicator in it.
@@ -412,6 +525,295 @@ def fontDatabase():
     return g_fontDatabaseVar
 
 
+def toCInt(v):
+    """
+    Converts v to an int column value. Python ints outside [INT_MIN, INT_MAX]
+    are clamped to it, since the value signals and editors carry a C int.
+    """
+    v = int(v)
+    if v < INT_MIN:
+        return INT_MIN
+    if v > INT_MAX:
+        return INT_MAX
+    return v
+
+
+def columnProperty(name, cast=None):
+    def getter(self):
+        v = getattr(self.columns, name)[self.slot]
+        return cast(v) if cast else v
+
+    def setter(self, v):
+        column = getattr(self.columns, name)
+        column[self.slot] = cast(v) if cast else self.columns.cast(v)
+
+    return property(getter, setter)
+
+
+class QtNumericSlot:
+    """
+    View of one property's row in a QtNumericColumns store. It has the attributes of
+    the managers' Data classes, so the shared value helpers work on it unchanged.
+    """
+    __slots__ = ('columns', 'slot')
+
+    val = columnProperty('val')
+    min_val = columnProperty('min_val')
+    max_val = columnProperty('max_val')
+    single_step = columnProperty('single_step')
+    read_only = columnProperty('read_only', bool)
+    decimals = columnProperty('decimals', int)
+
+    def __init__(self, columns, slot):
+        self.columns = columns
+        self.slot = slot
+
+    def setMinValue(self, new_min_val):
+        setSimpleMinData(self, new_min_val)
+
+    def setMaxValue(self, new_max_val):
+        setSimpleMaxData(self, new_max_val)
+
+
+#####################################################################################
+#
+#   class   QtNumericColumns
+#
+#   brief   Struct-of-arrays value storage of QtIntPropertyManager and QtDoublePropertyManager.
+#
+#   Every field (val, min_val, max_val, single_step, read_only, decimals) is an array
+#   column and every property owns one slot (row) in them. Removing a property moves
+#   the last row into its slot, so the columns always hold exactly the live properties
+#   and can be re-clamped, summarized or copied without touching per-property objects.
+#
+#   Lookups behave like the QMap used by the other managers: store[prop] returns a
+#   QtNumericSlot view of the row, or None for unknown properties.
+#
+#####################################################################################
+class QtNumericColumns:
+    FIELDS = ('val', 'min_val', 'max_val', 'single_step', 'read_only', 'decimals')
+
+    def __init__(self, typecode, data):
+        self.typecode = typecode
+        self.cast = toCInt if typecode == 'q' else float
+        self.defaults = (data.val, data.min_val, data.max_val, data.single_step,
+                         data.read_only, getattr(data, 'decimals', 0))
+        self.val = array(typecode)
+        self.min_val = array(typecode)
+        self.max_val = array(typecode)
+        self.single_step = array(typecode)
+        self.read_only = array('b')
+        self.decimals = array('b')
+        self.slots = {}
+        self.props = []
+        # bound column readers per DATA_* id, the columns are never replaced.
+        self.readers = {
+            DATA_VAL:           self.val.__getitem__,
+            DATA_MINVAL:        self.min_val.__getitem__,
+            DATA_MAXVAL:        self.max_val.__getitem__,
+            DATA_SINGLESTEP:    self.single_step.__getitem__,
+            DATA_READONLY:      lambda slot: bool(self.read_only[slot]),
+            DATA_DECIMALS:      self.decimals.__getitem__,
+        }
+
+    def getData(self, data, prop, defaultValue=None):
+        slot = self.slots.get(prop)
+        if slot is None:
+            return defaultValue
+        reader = self.readers.get(data)
+        if reader is None:
+            return defaultValue
+        return reader(slot)
+
+    def columns(self):
+        return [getattr(self, name) for name in self.FIELDS]
+
+    def __contains__(self, prop):
+        return prop in self.slots
+
+    def __len__(self):
+        return len(self.props)
+
+    def __iter__(self):
+        return iter(list(self.props))
+
+    def keys(self):
+        return list(self.props)
+
+    def __getitem__(self, prop):
+        slot = self.slots.get(prop)
+        if slot is None:
+            return None
+        return QtNumericSlot(self, slot)
+
+    def get(self, prop, defvalue=None):
+        slot = self.slots.get(prop)
+        if slot is None:
+            return defvalue
+        return QtNumericSlot(self, slot)
+
+    def __setitem__(self, prop, data):
+        slot = self.slots.get(prop)
+        if slot is None:
+            slot = self.add(prop)
+        elif isinstance(data, QtNumericSlot) and data.columns is self and data.slot == slot:
+            return
+        row = QtNumericSlot(self, slot)
+        for name in self.FIELDS:
+            if hasattr(data, name):
+                setattr(row, name, getattr(data, name))
+
+    def add(self, prop):
+        slot = self.slots.get(prop)
+        if slot is not None:
+            return slot
+        slot = len(self.props)
+        self.slots[prop] = slot
+        self.props.append(prop)
+        val, min_val, max_val, single_step, read_only, decimals = self.defaults
+        self.val.append(self.cast(val))
+        self.min_val.append(self.cast(min_val))
+        self.max_val.append(self.cast(max_val))
+        self.single_step.append(self.cast(single_step))
+        self.read_only.append(read_only)
+        self.decimals.append(decimals)
+        return slot
+
+    def remove(self, prop):
+        slot = self.slots.pop(prop, None)
+        if slot is None:
+            return
+        last = len(self.props) - 1
+        if slot != last:
+            moved = self.props[last]
+            self.props[slot] = moved
+            self.slots[moved] = slot
+            for column in self.columns():
+                column[slot] = column[last]
+        self.props.pop()
+        for column in self.columns():
+            column.pop()
+
+    def valueRange(self):
+        """
+        Returns the smallest and largest current value, or None if there are no properties.
+        """
+        if not self.props:
+            return None
+        return min(self.val), max(self.val)
+
+    def snapshot(self):
+        """
+        Returns a copy of all columns keyed by field name, plus the properties in row order.
+        """
+        snapshot = {name: array(column.typecode, column) for name, column in zip(self.FIELDS, self.columns())}
+        snapshot['props'] = list(self.props)
+        return snapshot
+
+    def clamp(self):
+        """
+        Moves every value back into its [min_val, max_val] range and
+        returns the properties whose value changed.
+        """
+        clamped = array(self.typecode, map(max, map(min, self.max_val, self.val), self.min_val))
+        if clamped == self.val:
+            return []
+        changed = [prop for prop, old, new in zip(self.props, self.val, clamped) if old != new]
+        self.val[:] = clamped
+        return changed
+
+
+#####################################################################################
+#
+#   class   QtSharedTables
+#
+#   brief   Interns read-only lookup tables, such as enum names and enum icons, by content.
+#
+#   Equal tables are stored once and shared by every property using them, e.g. the
+#   family list of all font properties or the country list of all locale properties
+#   with the same language. Each table is reference counted: acquire() is called when
+#   a property starts using it and release() when it stops, and the table is dropped
+#   once nobody uses it anymore. Empty tables are never stored.
+#
+#   Shared tables must not be modified in place.
+#
+#####################################################################################
+class QtSharedTables:
+    def __init__(self, keyFunc, copyFunc):
+        self.keyFunc = keyFunc
+        self.copyFunc = copyFunc
+        self.tables = {}
+        self.keys = {}
+
+    def __len__(self):
+        return len(self.tables)
+
+    def key(self, table):
+        """
+        Returns the content key of table. Shared tables are recognized without hashing their content.
+        """
+        key = self.keys.get(id(table))
+        if key is not None and self.tables[key][0] is table:
+            return key
+        return self.keyFunc(table)
+
+    def acquire(self, key, table):
+        """
+        Returns the shared table stored under key, storing a copy of table if there is none yet.
+        key(shared table) then returns the stored key, so users need not keep their own copy.
+        """
+        if not key:
+            # Empty tables are not shared, but the caller keeps its own object
+            return self.copyFunc(table)
+
+        entry = self.tables.get(key)
+        if entry is None:
+            shared = self.copyFunc(table)
+            entry = self.tables[key] = [shared, 0]
+            self.keys[id(shared)] = key
+        entry[1] += 1
+        return entry[0]
+
+    def release(self, key):
+        """
+        Drops one reference to the table stored under key.
+        """
+        entry = self.tables.get(key)
+        if entry is None:
+            return
+
+        entry[1] -= 1
+        if entry[1] <= 0:
+            del self.keys[id(entry[0])]
+            del self.tables[key]
+
+    def refCount(self, key):
+        entry = self.tables.get(key)
+        if entry is None:
+            return 0
+        return entry[1]
+
+
+def enumNamesKey(names):
+    if isinstance(names, dict):
+        return (dict, tuple(names.items()))
+    return tuple(names)
+
+
+def enumNamesCopy(names):
+    if isinstance(names, dict):
+        return copy.copy(names)
+    return QList(names)
+
+
+def enumIconsKey(icons):
+    return tuple(sorted((i, icon.cacheKey() if isinstance(icon, QIcon) else id(icon)) for i, icon in icons.items()))
+
+
+g_enumNameTables = QtSharedTables(enumNamesKey, enumNamesCopy)
+g_enumIconTables = QtSharedTables(enumIconsKey, copy.copy)
+
+
 #####################################################################################
 #
 #   class   QtGroupPropertyManager
@@ -501,13 +903,13 @@ class QtStringPropertyManager(QtAbstractPropertyManager):
         return getData(self.values, DATA_READONLY, prop, False)
 
     def valueText(self, prop):
-        if not prop in self.values.keys():
+        if not prop in self.values:
             return ""
 
         return self.values[prop].val
 
     def displayText(self, prop):
-        if not prop in self.values.keys():
+        if not prop in self.values:
             return ""
 
         edit = QLineEdit()
@@ -516,7 +918,7 @@ class QtStringPropertyManager(QtAbstractPropertyManager):
         return edit.displayText()
 
     def setValue(self, prop, val):
-        if not prop in self.values.keys():
+        if not prop in self.values:
             return
 
         data = self.values[prop]
@@ -531,7 +933,7 @@ class QtStringPropertyManager(QtAbstractPropertyManager):
 
         self.values[prop] = data
 
-        self.propertyChangedSignal.emit(prop)
+        self.propertyChanged(prop)
         self.valueChangedSignal.emit(prop, data.val)
 
     ###
@@ -541,7 +943,7 @@ class QtStringPropertyManager(QtAbstractPropertyManager):
     ###
     # def setRegExp(self, property, regExp):
     #
-    #     if not property in self.d_ptr.values.keys():
+    #     if not property in self.d_ptr.values:
     #         return
     #
     #     data = self.d_ptr.values[property]
@@ -556,35 +958,35 @@ class QtStringPropertyManager(QtAbstractPropertyManager):
     #     self.regExpChangedSignal.emit(property, data.regExp)
 
     def setEchoMode(self, prop, echoMode):
-        if not prop in self.values.keys():
+        if not prop in self.values:
             return
 
         data = self.values[prop]
 
-        if data.echoMode == echoMode:
+        if data.echo_mode == echoMode:
             return
 
-        data.echoMode = echoMode
+        data.echo_mode = echoMode
         self.values[prop] = data
 
-        self.propertyChangedSignal.emit(prop)
-        self.echoModeChangedSignal.emit(prop, data.echoMode)
+        self.propertyChanged(prop)
+        self.echoModeChangedSignal.emit(prop, data.echo_mode)
 
     def setReadOnly(self, prop, readOnly):
 
-        if not prop in self.values.keys():
+        if not prop in self.values:
             return
 
         data = self.values[prop]
 
-        if data.readOnly == readOnly:
+        if data.read_only == readOnly:
             return
 
-        data.readOnly = readOnly
+        data.read_only = readOnly
         self.values[prop] = data
 
-        self.propertyChangedSignal.emit(prop)
-        self.echoModeChangedSignal.emit(prop, data.echoMode)
+        self.propertyChanged(prop)
+        self.readOnlyChangedSignal.emit(prop, data.read_only)
 
     def initializeProperty(self, prop):
         self.values[prop] = QtStringPropertyManager.Data()
@@ -658,7 +1060,7 @@ class QtIntPropertyManager(QtAbstractPropertyManager):
         Creates a manager with the given parent.
         """
         super(QtIntPropertyManager, self).__init__(parent)
-        self.values = QMap()
+        self.values = QtNumericColumns('q', QtIntPropertyManager.Data)
         self.Data = QtIntPropertyManager.Data()
 
     def __del__(self):
@@ -673,19 +1075,19 @@ class QtIntPropertyManager(QtAbstractPropertyManager):
         If the given property is not managed by this manager,
         this function returns 0.
         """
-        return getValue(self.values, prop, 0)
+        return self.values.getData(DATA_VAL, prop, 0)
 
     def minimum(self, prop):
         """
         Returns the given property's minimum value.
         """
-        return getMinimum(self.values, prop, 0)
+        return self.values.getData(DATA_MINVAL, prop, 0)
 
     def maximum(self, prop):
         """
         Returns the given property's maximum value.
         """
-        return getMaximum(self.values, prop, 0)
+        return self.values.getData(DATA_MAXVAL, prop, 0)
 
     def singleStep(self, prop):
         """
@@ -693,7 +1095,7 @@ class QtIntPropertyManager(QtAbstractPropertyManager):
         The step is typically used to increment or decrement a property value
         while pressing an arrow key.
         """
-        return getData(self.values, DATA_SINGLESTEP, prop, 0)
+        return self.values.getData(DATA_SINGLESTEP, prop, 0)
 
     def isReadOnly(self, prop):
         """
@@ -701,17 +1103,16 @@ class QtIntPropertyManager(QtAbstractPropertyManager):
         When property is read-only it's value can be selected and copied
         from editor but not modified.
         """
-        return getData(self.values, DATA_READONLY, prop, False)
+        return self.values.getData(DATA_READONLY, prop, False)
 
     def valueText(self, prop):
         """
         Reimplementation
         """
-        data = self.values.get(prop)
-        if not data:
+        if not prop in self.values:
             return ""
 
-        return str(data.val)
+        return str(self.values.getData(DATA_VAL, prop))
 
     def setValue(self, prop, val):
         """
@@ -721,9 +1122,18 @@ class QtIntPropertyManager(QtAbstractPropertyManager):
         value within the range.
         """
         set_subprop_value = None
-        setValueInRange(self, self.propertyChangedSignal, self.valueChangedSignal,
+        setValueInRange(self, self.propertyChanged, self.valueChangedSignal,
                         prop, val, set_subprop_value)
 
+    def setValues(self, props, vals):
+        """
+        Sets the values of the given properties in one go, pairing props and vals
+        by position. Each value is adjusted into its property's range, unchanged
+        entries are skipped and propertyChangedSignal is coalesced into one update.
+        Raises ValueError if props and vals differ in length.
+        """
+        setValuesInRange(self, self.propertyChanged, self.valueChangedSignal, props, vals)
+
     def setMinimum(self, prop, min_val):
         """
         Sets the minimum value for the given property to min_val.
@@ -732,7 +1142,7 @@ class QtIntPropertyManager(QtAbstractPropertyManager):
         that the current value is within the range).
         """
         setMinimumValue(self,
-                        self.propertyChangedSignal,
+                        self.propertyChanged,
                         self.valueChangedSignal,
                         self.rangeChangedSignal,
                         prop, min_val)
@@ -745,7 +1155,7 @@ class QtIntPropertyManager(QtAbstractPropertyManager):
         that the current value is within the range).
         """
         setMaximumValue(self,
-                        self.propertyChangedSignal,
+                        self.propertyChanged,
                         self.valueChangedSignal,
                         self.rangeChangedSignal,
                         prop, max_val)
@@ -761,7 +1171,7 @@ class QtIntPropertyManager(QtAbstractPropertyManager):
         """
         set_subprop_range = 0
         setBorderValues(self,
-                        self.propertyChangedSignal,
+                        self.propertyChanged,
                         self.valueChangedSignal,
                         self.rangeChangedSignal,
                         prop, min_val, max_val, set_subprop_range)
@@ -772,7 +1182,7 @@ class QtIntPropertyManager(QtAbstractPropertyManager):
         The step is typically used to increment or decrement a property value
         while pressing an arrow key.
         """
-        if not prop in self.values.keys():
+        if not prop in self.values:
             return
 
         data = self.values[prop]
@@ -792,7 +1202,7 @@ class QtIntPropertyManager(QtAbstractPropertyManager):
         """
         Sets read-only status of the property.
         """
-        if not prop in self.values.keys():
+        if not prop in self.values:
             return
 
         data = self.values[prop]
@@ -803,14 +1213,14 @@ class QtIntPropertyManager(QtAbstractPropertyManager):
         data.read_only = read_only
         self.values[prop] = data
 
-        self.propertyChangedSignal.emit(prop)
+        self.propertyChanged(prop)
         self.readOnlyChangedSignal.emit(prop, data.read_only)
 
     def initializeProperty(self, prop):
         """
         Reimplementation
         """
-        self.values[prop] = QtIntPropertyManager.Data()
+        self.values.add(prop)
 
     def uninitializeProperty(self, prop):
         """
@@ -895,7 +1305,7 @@ class QtDoublePropertyManager(QtAbstractPropertyManager):
         Creates a manager with the given parent.
         """
         super(QtDoublePropertyManager, self).__init__(parent)
-        self.values = QMap()
+        self.values = QtNumericColumns('d', QtDoublePropertyManager.Data)
         self.Data = QtDoublePropertyManager.Data()
 
     def __del__(self):
@@ -908,19 +1318,19 @@ class QtDoublePropertyManager(QtAbstractPropertyManager):
         """
         Returns the given property's value.
         """
-        return getValue(self.values, prop, 0.0)
+        return self.values.getData(DATA_VAL, prop, 0.0)
 
     def minimum(self, prop):
         """
         Returns the given property's minimum value.
         """
-        return getMinimum(self.values, prop, 0.0)
+        return self.values.getData(DATA_MINVAL, prop, 0.0)
 
     def maximum(self, prop):
         """
         Returns the given property's maximum value.
         """
-        return getMaximum(self.values, prop, 0.0)
+        return self.values.getData(DATA_MAXVAL, prop, 0.0)
 
     def singleStep(self, prop):
         """
@@ -928,13 +1338,13 @@ class QtDoublePropertyManager(QtAbstractPropertyManager):
         The step is typically used to increment or decrement a property value
         while pressing an arrow key.
         """
-        return getData(self.values, DATA_SINGLESTEP, prop, 0)
+        return self.values.getData(DATA_SINGLESTEP, prop, 0)
 
     def decimals(self, prop):
         """
         Returns the given property's precision, in decimals.
         """
-        return getData(self.values, DATA_DECIMALS, prop, 0)
+        return self.values.getData(DATA_DECIMALS, prop, 0)
 
     def isReadOnly(self, prop):
         """
@@ -942,16 +1352,17 @@ class QtDoublePropertyManager(QtAbstractPropertyManager):
         When property is read-only it's value can be selected and copied
         from editor but not modified.
         """
-        return getData(self.values, DATA_READONLY, prop, False)
+        return self.values.getData(DATA_READONLY, prop, False)
 
     def valueText(self, prop) -> str:
         """
         Reimplementation
         """
-        if not prop in self.values.keys():
+        if not prop in self.values:
             return ""
 
-        return QLocale.system().toString(float(self.values[prop].val), 'f', self.values[prop].decimals)
+        values = self.values
+        return QLocale.system().toString(values.getData(DATA_VAL, prop), 'f', values.getData(DATA_DECIMALS, prop))
 
     def setValue(self, prop, val):
         """
@@ -961,9 +1372,18 @@ class QtDoublePropertyManager(QtAbstractPropertyManager):
         value within the range.
         """
         set_subprop_value = None
-        setValueInRange(self, self.propertyChangedSignal, self.valueChangedSignal,
+        setValueInRange(self, self.propertyChanged, self.valueChangedSignal,
                         prop, val, set_subprop_value)
 
+    def setValues(self, props, vals):
+        """
+        Sets the values of the given properties in one go, pairing props and vals
+        by position. Each value is adjusted into its property's range, unchanged
+        entries are skipped and propertyChangedSignal is coalesced into one update.
+        Raises ValueError if props and vals differ in length.
+        """
+        setValuesInRange(self, self.propertyChanged, self.valueChangedSignal, props, vals)
+
     def setMinimum(self, prop, min_val):
         """
         Sets the minimum value for the given property to min_val.
@@ -972,7 +1392,7 @@ class QtDoublePropertyManager(QtAbstractPropertyManager):
         that the current value is within the range).
         """
         setMinimumValue(self,
-                        self.propertyChangedSignal,
+                        self.propertyChanged,
                         self.valueChangedSignal,
                         self.rangeChangedSignal,
                         prop, min_val)
@@ -985,7 +1405,7 @@ class QtDoublePropertyManager(QtAbstractPropertyManager):
         that the current value is within the range).
         """
         setMaximumValue(self,
-                        self.propertyChangedSignal,
+                        self.propertyChanged,
                         self.valueChangedSignal,
                         self.rangeChangedSignal,
                         prop, max_val)
@@ -1001,7 +1421,7 @@ class QtDoublePropertyManager(QtAbstractPropertyManager):
         """
         set_subprop_range = 0
         setBorderValues(self,
-                        self.propertyChangedSignal,
+                        self.propertyChanged,
                         self.valueChangedSignal,
                         self.rangeChangedSignal,
                         prop, min_val, max_val, set_subprop_range)
@@ -1012,7 +1432,7 @@ class QtDoublePropertyManager(QtAbstractPropertyManager):
         The step is typically used to increment or decrement a property value
         while pressing an arrow key.
         """
-        if not prop in self.values.keys():
+        if not prop in self.values:
             return
 
         data = self.values[prop]
@@ -1032,7 +1452,7 @@ class QtDoublePropertyManager(QtAbstractPropertyManager):
         """
         Sets read-only status of the property.
         """
-        if not prop in self.values.keys():
+        if not prop in self.values:
             return
 
         data = self.values[prop]
@@ -1043,7 +1463,7 @@ class QtDoublePropertyManager(QtAbstractPropertyManager):
         data.read_only = read_only
         self.values[prop] = data
 
-        self.propertyChangedSignal.emit(prop)
+        self.propertyChanged(prop)
         self.readOnlyChangedSignal.emit(prop, data.read_only)
 
     def setDecimals(self, prop, precision):
@@ -1052,7 +1472,7 @@ class QtDoublePropertyManager(QtAbstractPropertyManager):
         The valid decimal range is 0~13.
         The default is 2.
         """
-        if not prop in self.values.keys():
+        if not prop in self.values:
             return
 
         data = self.values[prop]
@@ -1074,7 +1494,7 @@ class QtDoublePropertyManager(QtAbstractPropertyManager):
         """
         Reimplementation
         """
-        self.values[prop] = QtDoublePropertyManager.Data()
+        self.values.add(prop)
 
     def uninitializeProperty(self, prop):
         """
@@ -1152,7 +1572,7 @@ class QtBoolPropertyManager(QtAbstractPropertyManager):
         """
         Reimplementation
         """
-        if not prop in self.values.keys():
+        if not prop in self.values:
             return ""
 
         data = self.values[prop]
@@ -1172,7 +1592,7 @@ class QtBoolPropertyManager(QtAbstractPropertyManager):
         """
         Reimplementation
         """
-        if not prop in self.values.keys():
+        if not prop in self.values:
             return
 
         if self.values[prop].val:
@@ -1184,7 +1604,7 @@ class QtBoolPropertyManager(QtAbstractPropertyManager):
         """
         Sets the value of the given property to value.
         """
-        if not prop in self.values.keys():
+        if not prop in self.values:
             return
 
         data = self.values[prop]
@@ -1194,11 +1614,11 @@ class QtBoolPropertyManager(QtAbstractPropertyManager):
         data.val = val
         self.values[prop] = data
 
-        self.propertyChangedSignal.emit(prop)
+        self.propertyChanged(prop)
         self.valueChangedSignal.emit(prop, data.val)
 
     def setTextVisible(self, prop, text_visible):
-        if not prop in self.values.keys():
+        if not prop in self.values:
             return
 
         data = self.values[prop]
@@ -1209,7 +1629,7 @@ class QtBoolPropertyManager(QtAbstractPropertyManager):
         data.text_visible = text_visible
         self.values[prop] = data
 
-        self.propertyChangedSignal.emit(prop)
+        self.propertyChanged(prop)
         self.textVisibleChangedSignal.emit(prop, data.text_visible)
 
     def initializeProperty(self, prop):
@@ -1266,10 +1686,7 @@ class QtColorPropertyManager(QtAbstractPropertyManager):
         self.prop_to_g = QMap()
         self.prop_to_b = QMap()
         self.prop_to_a = QMap()
-        self.r_to_prop = QMap()
-        self.g_to_prop = QMap()
-        self.b_to_prop = QMap()
-        self.a_to_prop = QMap()
+        self.sub_to_prop = QMap()
         self.int_prop_mgr = None
 
         self.int_prop_mgr = QtIntPropertyManager(self)
@@ -1304,7 +1721,7 @@ class QtColorPropertyManager(QtAbstractPropertyManager):
         """
         Reimplementation
         """
-        if not prop in self.values.keys():
+        if not prop in self.values:
             return ""
 
         color = self.values[prop]
@@ -1314,7 +1731,7 @@ class QtColorPropertyManager(QtAbstractPropertyManager):
         """
         Reimplementation
         """
-        if not prop in self.values.keys():
+        if not prop in self.values:
             return QIcon()
 
         return brushValueIcon(QBrush(self.values[prop]))
@@ -1324,7 +1741,7 @@ class QtColorPropertyManager(QtAbstractPropertyManager):
         Sets the value of the given property to value.
         Nested properties are updated automatically.
         """
-        if not prop in self.values.keys():
+        if not prop in self.values:
             return
 
         if self.values[prop] == val:
@@ -1337,125 +1754,75 @@ class QtColorPropertyManager(QtAbstractPropertyManager):
         self.int_prop_mgr.setValue(self.prop_to_b[prop], val.blue())
         self.int_prop_mgr.setValue(self.prop_to_a[prop], val.alpha())
 
-        self.propertyChangedSignal.emit(prop)
+        self.propertyChanged(prop)
         self.valueChangedSignal.emit(prop, val)
 
     def initializeProperty(self, prop):
         """
         Reimplementation
         """
-        val = QColor()
-        self.values[prop] = val
+        self.values[prop] = QColor()
+        self.initializeSubProperties(prop)
+
+    def createSubProperties(self, prop):
+        """
+        Reimplementation
+        """
+        val = self.values[prop]
 
         r_prop = self.int_prop_mgr.addProperty()
         r_prop.setPropertyName("Red")
         self.int_prop_mgr.setValue(r_prop, val.red())
         self.int_prop_mgr.setRange(r_prop, 0, 0xFF)
-        self.prop_to_r[prop] = r_prop
-        self.r_to_prop[r_prop] = prop
+        linkSubProperty(self.sub_to_prop, self.prop_to_r, prop, r_prop)
         prop.addSubProperty(r_prop)
 
         g_prop = self.int_prop_mgr.addProperty()
         g_prop.setPropertyName("Green")
         self.int_prop_mgr.setValue(g_prop, val.green())
         self.int_prop_mgr.setRange(g_prop, 0, 0xFF)
-        self.prop_to_g[prop] = g_prop
-        self.g_to_prop[g_prop] = prop
+        linkSubProperty(self.sub_to_prop, self.prop_to_g, prop, g_prop)
         prop.addSubProperty(g_prop)
 
         b_prop = self.int_prop_mgr.addProperty()
         b_prop.setPropertyName("Blue")
         self.int_prop_mgr.setValue(b_prop, val.blue())
         self.int_prop_mgr.setRange(b_prop, 0, 0xFF)
-        self.prop_to_b[prop] = b_prop
-        self.b_to_prop[b_prop] = prop
+        linkSubProperty(self.sub_to_prop, self.prop_to_b, prop, b_prop)
         prop.addSubProperty(b_prop)
 
         a_prop = self.int_prop_mgr.addProperty()
         a_prop.setPropertyName("Alpha")
         self.int_prop_mgr.setValue(a_prop, val.alpha())
         self.int_prop_mgr.setRange(a_prop, 0, 0xFF)
-        self.prop_to_a[prop] = a_prop
-        self.a_to_prop[a_prop] = prop
+        linkSubProperty(self.sub_to_prop, self.prop_to_a, prop, a_prop)
         prop.addSubProperty(a_prop)
 
     def uninitializeProperty(self, prop):
         """
         Reimplementation
         """
-        r_prop = self.prop_to_r[prop]
-        if r_prop:
-            self.r_to_prop.remove(r_prop)
-            del r_prop
-
-        self.prop_to_r.remove(prop)
-
-        g_prop = self.prop_to_g[prop]
-        if g_prop:
-            self.g_to_prop.remove(g_prop)
-            del g_prop
-
-        self.prop_to_g.remove(prop)
-
-        b_prop = self.prop_to_b[prop]
-        if b_prop:
-            self.b_to_prop.remove(b_prop)
-            del b_prop
-
-        self.prop_to_b.remove(prop)
-
-        a_prop = self.prop_to_a[prop]
-        if a_prop:
-            self.a_to_prop.remove(a_prop)
-            del a_prop
-
-        self.prop_to_a.remove(prop)
+        unlinkSubProperties(self.sub_to_prop, prop, self.prop_to_r, self.prop_to_g, self.prop_to_b, self.prop_to_a)
+        self.values.remove(prop)
 
     def slotIntChanged(self, prop, value):
-        prop_r = self.r_to_prop.get(prop, 0)
-        if prop_r:
-            c = copy.copy(self.values[prop_r])
+        prop_color, channel = self.sub_to_prop.get(prop, (None, None))
+        if not prop_color:
+            return
+
+        c = copy.copy(self.values[prop_color])
+        if channel is self.prop_to_r:
             c.setRed(value)
-            self.setValue(prop_r, c)
+        elif channel is self.prop_to_g:
+            c.setGreen(value)
+        elif channel is self.prop_to_b:
+            c.setBlue(value)
         else:
-            prop_g = self.g_to_prop.get(prop, 0)
-            if prop_g:
-                c = copy.copy(self.values[prop_g])
-                c.setGreen(value)
-                self.setValue(prop_g, c)
-            else:
-                prop_b = self.b_to_prop.get(prop, 0)
-                if prop_b:
-                    c = copy.copy(self.values[prop_b])
-                    c.setBlue(value)
-                    self.setValue(prop_b, c)
-                else:
-                    prop_a = self.a_to_prop.get(prop, 0)
-                    if prop_a:
-                        c = copy.copy(self.values[prop_a])
-                        c.setAlpha(value)
-                        self.setValue(prop_a, c)
+            c.setAlpha(value)
+        self.setValue(prop_color, c)
 
     def slotPropertyDestroyed(self, prop):
-        prop_r = self.r_to_prop.get(prop, 0)
-        if prop_r:
-            self.prop_to_r[prop_r] = 0
-            self.r_to_prop.remove(prop)
-        else:
-            prop_g = self.g_to_prop.get(prop, 0)
-            if prop_g:
-                self.prop_to_g[prop_g] = 0
-                self.g_to_prop.remove(prop)
-            else:
-                prop_b = self.b_to_prop.get(prop, 0)
-                if prop_b:
-                    self.prop_to_b[prop_b] = 0
-                    self.b_to_prop.remove(prop)
-                else:
-                    prop_a = self.a_to_prop.get(prop, 0)
-                    if prop_a:
-                        self.prop_to_a[prop_a] = 0
-                        self.a_to_prop.remove(prop)
+        unlinkDestroyedSubProperty(self.sub_to_prop, prop)
 
 
 #####################################################################################
@@ -1514,10 +1881,7 @@ class QtRectPropertyManager(QtAbstractPropertyManager):
         self.prop_to_y = QMap()
         self.prop_to_w = QMap()
         self.prop_to_h = QMap()
-        self.x_to_prop = QMap()
-        self.y_to_prop = QMap()
-        self.w_to_prop = QMap()
-        self.h_to_prop = QMap()
+        self.sub_to_prop = QMap()
         self.Data = QtRectPropertyManager.Data()
 
         self.int_prop_mgr = QtIntPropertyManager(self)
@@ -1559,7 +1923,7 @@ class QtRectPropertyManager(QtAbstractPropertyManager):
         """
         Reimplementation
         """
-        if not prop in self.values.keys():
+        if not prop in self.values:
             return ""
 
         val = self.values[prop].val
@@ -1574,7 +1938,7 @@ class QtRectPropertyManager(QtAbstractPropertyManager):
         If the specified value is not inside the given property's constraining rectangle,
         the value is adjusted accordingly to fit within constraint.
         """
-        if not prop in self.values.keys():
+        if not prop in self.values:
             return
 
         data = self.values[prop]
@@ -1602,7 +1966,7 @@ class QtRectPropertyManager(QtAbstractPropertyManager):
         self.int_prop_mgr.setValue(self.prop_to_w[prop], new_rect.width())
         self.int_prop_mgr.setValue(self.prop_to_h[prop], new_rect.height())
 
-        self.propertyChangedSignal.emit(prop)
+        self.propertyChanged(prop)
         self.valueChangedSignal.emit(prop, data.val)
 
     def setConstraint(self, prop, constraint):
@@ -1612,7 +1976,7 @@ class QtRectPropertyManager(QtAbstractPropertyManager):
         (ensuring that the current rectangle value is inside the constraint).
         In order to reset the constraint pass a null QRect value.
         """
-        if not prop in self.values.keys():
+        if not prop in self.values:
             return
 
         data = self.values[prop]
@@ -1622,7 +1986,7 @@ class QtRectPropertyManager(QtAbstractPropertyManager):
             return
 
         old_val = data.val
-        data.cosntraint = new_constraint
+        data.constraint = new_constraint
 
         if not data.constraint.isNull() and not data.constraint.contains(old_val):
             r1 = data.constraint
@@ -1654,7 +2018,7 @@ class QtRectPropertyManager(QtAbstractPropertyManager):
         if data.val == old_val:
             return
 
-        self.propertyChangedSignal.emit(prop)
+        self.propertyChanged(prop)
         self.valueChangedSignal.emit(prop, data.val)
 
     def initializeProperty(self, prop):
@@ -1662,120 +2026,71 @@ class QtRectPropertyManager(QtAbstractPropertyManager):
         Reimplementation
         """
         self.values[prop] = QtRectPropertyManager.Data()
+        self.initializeSubProperties(prop)
+
+    def createSubProperties(self, prop):
+        """
+        Reimplementation
+        """
+        data = self.values[prop]
 
         prop_x = self.int_prop_mgr.addProperty()
         prop_x.setPropertyName("X")
         self.int_prop_mgr.setValue(prop_x, self.values[prop].val.x())
-        self.prop_to_x[prop] = prop_x
-        self.x_to_prop[prop_x] = prop
+        linkSubProperty(self.sub_to_prop, self.prop_to_x, prop, prop_x)
         prop.addSubProperty(prop_x)
 
         prop_y = self.int_prop_mgr.addProperty()
         prop_y.setPropertyName("Y")
         self.int_prop_mgr.setValue(prop_y, self.values[prop].val.y())
-        self.prop_to_y[prop] = prop_y
-        self.y_to_prop[prop_y] = prop
+        linkSubProperty(self.sub_to_prop, self.prop_to_y, prop, prop_y)
         prop.addSubProperty(prop_y)
 
         prop_width = self.int_prop_mgr.addProperty()
         prop_width.setPropertyName("Width")
         self.int_prop_mgr.setValue(prop_width, self.values[prop].val.width())
         self.int_prop_mgr.setMinimum(prop_width, 0)
-        self.prop_to_w[prop] = prop_width
-        self.w_to_prop[prop_width] = prop
+        linkSubProperty(self.sub_to_prop, self.prop_to_w, prop, prop_width)
         prop.addSubProperty(prop_width)
 
         prop_height = self.int_prop_mgr.addProperty()
         prop_height.setPropertyName("Height")
         self.int_prop_mgr.setValue(prop_height, self.values[prop].val.height())
         self.int_prop_mgr.setMinimum(prop_height, 0)
-        self.prop_to_h[prop] = prop_height
-        self.h_to_prop[prop_height] = prop
+        linkSubProperty(self.sub_to_prop, self.prop_to_h, prop, prop_height)
         prop.addSubProperty(prop_height)
+        self.setConstraintWithValue(prop, data.constraint, data.val)
 
     def uninitializeProperty(self, prop):
         """
         Reimplementation
         """
-        prop_x = self.prop_to_x[prop]
-        if prop_x:
-            self.x_to_prop.remove(prop_x)
-            del prop_x
-        self.prop_to_x.remove(prop)
-
-        prop_y = self.prop_to_y[prop]
-        if prop_y:
-            self.y_to_prop.remove(prop_y)
-            del prop_y
-        self.prop_to_y.remove(prop)
-
-        prop_width = self.prop_to_w[prop]
-        if prop_width:
-            self.w_to_prop.remove(prop_width)
-            del prop_width
-        self.prop_to_w.remove(prop)
-
-        prop_height = self.prop_to_h[prop]
-        if prop_height:
-            self.h_to_prop.remove(prop_height)
-            del prop_height
-        self.prop_to_h.remove(prop)
-
+        unlinkSubProperties(self.sub_to_prop, prop, self.prop_to_x, self.prop_to_y, self.prop_to_w, self.prop_to_h)
         self.values.remove(prop)
 
     def slotIntChanged(self, prop, value):
-        prop_x = self.x_to_prop.get(prop, 0)
-        if prop_x:
-            r = copy.copy(self.values[prop_x].val)
+        prop_rect, channel = self.sub_to_prop.get(prop, (None, None))
+        if not prop_rect:
+            return
+
+        data = self.values[prop_rect]
+        r = copy.copy(data.val)
+        if channel is self.prop_to_x:
             r.moveLeft(value)
-            self.setValue(prop_x, r)
+        elif channel is self.prop_to_y:
+            r.moveTop(value)
+        elif channel is self.prop_to_w:
+            r.setWidth(value)
+            if not data.constraint.isNull() and data.constraint.x() + data.constraint.width() < r.x() + r.width():
+                r.moveLeft(data.constraint.left() + data.constraint.width() - r.width())
         else:
-            prop_y = self.y_to_prop.get(prop, 0)  # 0을 넣냐 마냐
-            if prop_y:
-                r = copy.copy(self.values[prop_y].val)
-                r.moveTop(value)
-                self.setValue(prop_y, r)
-            else:
-                prop_width = self.w_to_prop.get(prop, 0)
-                if prop_width:
-                    data = copy.copy(self.values[prop_width])
-                    r = copy.copy(data.val)
-                    r.setWidth(value)
-                    if not data.constraint.isNull() and data.constraint.x() + data.constraint.width() < r.x() + r.width():
-                        r.moveLeft(data.constraint.left() + data.constraint.width() - r.width())
-
-                    self.setValue(prop_width, r)
-                else:
-                    prop_height = self.h_to_prop.get(prop, 0)
-                    if prop_height:
-                        data = copy.copy(self.values[prop_height])
-                        r = copy.copy(data.val)
-                        r.setHeight(value)
-                        if not data.constraint.isNull() and data.constraint.y() + data.constraint.height() < r.y() + r.height():
-                            r.moveTop(data.constraint.top() + data.constraint.height() - r.height())
-
-                        self.setValue(prop_height, r)
+            r.setHeight(value)
+            if not data.constraint.isNull() and data.constraint.y() + data.constraint.height() < r.y() + r.height():
+                r.moveTop(data.constraint.top() + data.constraint.height() - r.height())
+        self.setValue(prop_rect, r)
 
     def slotPropertyDestroyed(self, prop):
-        prop_x = self.x_to_prop.get(prop, 0)
-        if prop_x:
-            self.prop_to_x[prop_x] = 0
-            self.x_to_prop.remove(prop)
-        else:
-            prop_y = self.y_to_prop.get(prop, 0)
-            if prop_y:
-                self.prop_to_y[prop_y] = 0
-                self.y_to_prop.remove(prop)
-            else:
-                prop_width = self.w_to_prop.get(prop, 0)
-                if prop_width:
-                    self.prop_to_w[prop_width] = 0
-                    self.w_to_prop.remove(prop)
-                else:
-                    prop_height = self.h_to_prop.get(prop, 0)
-                    if prop_height:
-                        self.prop_to_h[prop_height] = 0
-                        self.h_to_prop.remove(prop)
+        unlinkDestroyedSubProperty(self.sub_to_prop, prop)
 
     def setConstraintWithValue(self, prop, constraint, val):
         isNull = constraint.isNull()
@@ -1870,10 +2185,7 @@ class QtRectFPropertyManager(QtAbstractPropertyManager):
         self.prop_to_y = QMap()
         self.prop_to_w = QMap()
         self.prop_to_h = QMap()
-        self.x_to_prop = QMap()
-        self.y_to_prop = QMap()
-        self.w_to_prop = QMap()
-        self.h_to_prop = QMap()
+        self.sub_to_prop = QMap()
         self.Data = QtRectFPropertyManager.Data()
 
         self.double_prop_mgr = QtDoublePropertyManager(self)
@@ -1921,7 +2233,7 @@ class QtRectFPropertyManager(QtAbstractPropertyManager):
         """
         Reimplementation
         """
-        if not prop in self.values.keys():
+        if not prop in self.values:
             return ""
 
         val = self.values[prop].val
@@ -1937,7 +2249,7 @@ class QtRectFPropertyManager(QtAbstractPropertyManager):
         If the specified value is not inside the given property's constraining rectangle,
         the value is adjusted accordingly to fit within constraint.
         """
-        if not prop in self.values.keys():
+        if not prop in self.values:
             return
 
         data = self.values[prop]
@@ -1965,7 +2277,7 @@ class QtRectFPropertyManager(QtAbstractPropertyManager):
         self.double_prop_mgr.setValue(self.prop_to_w[prop], new_rect.width())
         self.double_prop_mgr.setValue(self.prop_to_h[prop], new_rect.height())
 
-        self.propertyChangedSignal.emit(prop)
+        self.propertyChanged(prop)
         self.valueChangedSignal.emit(prop, data.val)
 
     def setConstraint(self, prop, constraint):
@@ -1975,7 +2287,7 @@ class QtRectFPropertyManager(QtAbstractPropertyManager):
         (ensuring that the current rectangle value is inside the constraint).
         In order to reset the constraint pass a null QRect value.
         """
-        if not prop in self.values.keys():
+        if not prop in self.values:
             return
 
         data = self.values[prop]
@@ -1985,7 +2297,7 @@ class QtRectFPropertyManager(QtAbstractPropertyManager):
             return
 
         old_val = data.val
-        data.cosntraint = new_constraint
+        data.constraint = new_constraint
 
         if not data.constraint.isNull() and not data.constraint.contains(old_val):
             r1 = data.constraint
@@ -2017,7 +2329,7 @@ class QtRectFPropertyManager(QtAbstractPropertyManager):
         if data.val == old_val:
             return
 
-        self.propertyChangedSignal.emit(prop)
+        self.propertyChanged(prop)
         self.valueChangedSignal.emit(prop, data.val)
 
     def setDecimals(self, prop, precision):
@@ -2026,7 +2338,7 @@ class QtRectFPropertyManager(QtAbstractPropertyManager):
         The valid decimal range is 0~13.
         The default is 4.
         """
-        if not prop in self.values.keys():
+        if not prop in self.values:
             return
 
         data = self.values[prop]
@@ -2054,7 +2366,7 @@ class QtRectFPropertyManager(QtAbstractPropertyManager):
         """
         Sets the single step of the given property to step.
         """
-        if not prop in self.values.keys():
+        if not prop in self.values:
             return
 
         data = self.values[prop]
@@ -2074,21 +2386,26 @@ class QtRectFPropertyManager(QtAbstractPropertyManager):
         Reimplementation
         """
         self.values[prop] = QtRectFPropertyManager.Data()
+        self.initializeSubProperties(prop)
+
+    def createSubProperties(self, prop):
+        """
+        Reimplementation
+        """
+        data = self.values[prop]
 
         prop_x = self.double_prop_mgr.addProperty()
         prop_x.setPropertyName("X")
         self.double_prop_mgr.setDecimals(prop_x, self.decimals(prop))
         self.double_prop_mgr.setValue(prop_x, self.values[prop].val.x())
-        self.prop_to_x[prop] = prop_x
-        self.x_to_prop[prop_x] = prop
+        linkSubProperty(self.sub_to_prop, self.prop_to_x, prop, prop_x)
         prop.addSubProperty(prop_x)
 
         prop_y = self.double_prop_mgr.addProperty()
         prop_y.setPropertyName("Y")
         self.double_prop_mgr.setDecimals(prop_y, self.decimals(prop))
         self.double_prop_mgr.setValue(prop_y, self.values[prop].val.y())
-        self.prop_to_y[prop] = prop_y
-        self.y_to_prop[prop_y] = prop
+        linkSubProperty(self.sub_to_prop, self.prop_to_y, prop, prop_y)
         prop.addSubProperty(prop_y)
 
         prop_width = self.double_prop_mgr.addProperty()
@@ -2096,8 +2413,7 @@ class QtRectFPropertyManager(QtAbstractPropertyManager):
         self.double_prop_mgr.setDecimals(prop_width, self.decimals(prop))
         self.double_prop_mgr.setValue(prop_width, self.values[prop].val.width())
         self.double_prop_mgr.setMinimum(prop_width, 0)
-        self.prop_to_w[prop] = prop_width
-        self.w_to_prop[prop_width] = prop
+        linkSubProperty(self.sub_to_prop, self.prop_to_w, prop, prop_width)
         prop.addSubProperty(prop_width)
 
         prop_height = self.double_prop_mgr.addProperty()
@@ -2105,93 +2421,40 @@ class QtRectFPropertyManager(QtAbstractPropertyManager):
         self.double_prop_mgr.setDecimals(prop_height, self.decimals(prop))
         self.double_prop_mgr.setValue(prop_height, self.values[prop].val.height())
         self.double_prop_mgr.setMinimum(prop_height, 0)
-        self.prop_to_h[prop] = prop_height
-        self.h_to_prop[prop_height] = prop
+        linkSubProperty(self.sub_to_prop, self.prop_to_h, prop, prop_height)
         prop.addSubProperty(prop_height)
+        self.setConstraintWithValue(prop, data.constraint, data.val)
 
     def uninitializeProperty(self, prop):
         """
         Reimplementation
         """
-        prop_x = self.prop_to_x[prop]
-        if prop_x:
-            self.x_to_prop.remove(prop_x)
-            del prop_x
-        self.prop_to_x.remove(prop)
-
-        prop_y = self.prop_to_y[prop]
-        if prop_y:
-            self.y_to_prop.remove(prop_y)
-            del prop_y
-        self.prop_to_y.remove(prop)
-
-        prop_width = self.prop_to_w[prop]
-        if prop_width:
-            self.w_to_prop.remove(prop_width)
-            del prop_width
-        self.prop_to_w.remove(prop)
-
-        prop_height = self.prop_to_h[prop]
-        if prop_height:
-            self.h_to_prop.remove(prop_height)
-            del prop_height
-        self.prop_to_h.remove(prop)
-
+        unlinkSubProperties(self.sub_to_prop, prop, self.prop_to_x, self.prop_to_y, self.prop_to_w, self.prop_to_h)
         self.values.remove(prop)
 
     def slotDoubleChanged(self, prop, value):
-        prop_x = self.x_to_prop.get(prop, 0)
-        if prop_x:
-            r = QRectF(self.values[prop_x].val)
+        prop_rect, channel = self.sub_to_prop.get(prop, (None, None))
+        if not prop_rect:
+            return
+
+        data = self.values[prop_rect]
+        r = QRectF(data.val)
+        if channel is self.prop_to_x:
             r.moveLeft(value)
-            self.setValue(prop_x, r)
+        elif channel is self.prop_to_y:
+            r.moveTop(value)
+        elif channel is self.prop_to_w:
+            r.setWidth(value)
+            if not data.constraint.isNull() and data.constraint.x() + data.constraint.width() < r.x() + r.width():
+                r.moveLeft(data.constraint.left() + data.constraint.width() - r.width())
         else:
-            prop_y = self.y_to_prop.get(prop, 0)  # 0을 넣냐 마냐
-            if prop_y:
-                r = QRectF(self.values[prop_y].val)
-                r.moveTop(value)
-                self.setValue(prop_y, r)
-            else:
-                prop_width = self.w_to_prop.get(prop, 0)
-                if prop_width:
-                    data = self.values[prop_width]
-                    r = QRectF(data.val)
-                    r.setWidth(value)
-                    if not data.constraint.isNull() and data.constraint.x() + data.constraint.width() < r.x() + r.width():
-                        r.moveLeft(data.constraint.left() + data.constraint.width() - r.width())
-
-                    self.setValue(prop_width, r)
-                else:
-                    prop_height = self.h_to_prop.get(prop, 0)
-                    if prop_height:
-                        data = self.values[prop_height]
-                        r = QRectF(data.val)
-                        r.setHeight(value)
-                        if not data.constraint.isNull() and data.constraint.y() + data.constraint.height() < r.y() + r.height():
-                            r.moveTop(data.constraint.top() + data.constraint.height() - r.height())
-
-                        self.setValue(prop_height, r)
+            r.setHeight(value)
+            if not data.constraint.isNull() and data.constraint.y() + data.constraint.height() < r.y() + r.height():
+                r.moveTop(data.constraint.top() + data.constraint.height() - r.height())
+        self.setValue(prop_rect, r)
 
     def slotPropertyDestroyed(self, prop):
-        prop_x = self.x_to_prop.get(prop, 0)
-        if prop_x:
-            self.prop_to_x[prop_x] = 0
-            self.x_to_prop.remove(prop)
-        else:
-            prop_y = self.y_to_prop.get(prop, 0)
-            if prop_y:
-                self.prop_to_y[prop_y] = 0
-                self.y_to_prop.remove(prop)
-            else:
-                prop_width = self.w_to_prop.get(prop, 0)
-                if prop_width:
-                    self.prop_to_w[prop_width] = 0
-                    self.w_to_prop.remove(prop)
-                else:
-                    prop_height = self.h_to_prop.get(prop, 0)
-                    if prop_height:
-                        self.prop_to_h[prop_height] = 0
-                        self.h_to_prop.remove(prop)
+        unlinkDestroyedSubProperty(self.sub_to_prop, prop)
 
     def setConstraintWithValue(self, prop, constraint, val):
         isNull = constraint.isNull()
@@ -2281,8 +2544,7 @@ class QtSizePropertyManager(QtAbstractPropertyManager):
         self.values = QMap()
         self.prop_to_w = QMap()
         self.prop_to_h = QMap()
-        self.w_to_prop = QMap()
-        self.h_to_prop = QMap()
+        self.sub_to_prop = QMap()
         self.Data = QtSizePropertyManager.Data()
 
         self.int_prop_mgr = QtIntPropertyManager(self)
@@ -2331,7 +2593,7 @@ class QtSizePropertyManager(QtAbstractPropertyManager):
         """
         Reimplementation
         """
-        if not prop in self.values.keys():
+        if not prop in self.values:
             return
 
         val = self.values[prop].val
@@ -2347,7 +2609,7 @@ class QtSizePropertyManager(QtAbstractPropertyManager):
         valid value within the size range.
         """
         setValueInRange(self,
-                        self.propertyChangedSignal,
+                        self.propertyChanged,
                         self.valueChangedSignal,
                         prop,
                         val,
@@ -2362,7 +2624,7 @@ class QtSizePropertyManager(QtAbstractPropertyManager):
         that the current value is within the range).
         """
         setBorderValue(self,
-                       self.propertyChangedSignal,
+                       self.propertyChanged,
                        self.valueChangedSignal,
                        self.rangeChangedSignal,
                        prop,
@@ -2380,7 +2642,7 @@ class QtSizePropertyManager(QtAbstractPropertyManager):
         that the current value is within the range).
         """
         setBorderValue(self,
-                       self.propertyChangedSignal,
+                       self.propertyChanged,
                        self.valueChangedSignal,
                        self.rangeChangedSignal,
                        prop,
@@ -2401,7 +2663,7 @@ class QtSizePropertyManager(QtAbstractPropertyManager):
         necessary 9ensuring that the value remains within the range).
         """
         setBorderValues(self,
-                        self.propertyChangedSignal,
+                        self.propertyChanged,
                         self.valueChangedSignal,
                         self.rangeChangedSignal,
                         prop,
@@ -2414,64 +2676,50 @@ class QtSizePropertyManager(QtAbstractPropertyManager):
         Reimplementation
         """
         self.values[prop] = QtSizePropertyManager.Data()
+        self.initializeSubProperties(prop)
+
+    def createSubProperties(self, prop):
+        """
+        Reimplementation
+        """
+        data = self.values[prop]
 
         prop_w = self.int_prop_mgr.addProperty()
         prop_w.setPropertyName("Width")
         self.int_prop_mgr.setValue(prop_w, 0)
         self.int_prop_mgr.setMinimum(prop_w, 0)
-        self.prop_to_w[prop] = prop_w
-        self.w_to_prop[prop_w] = prop
+        linkSubProperty(self.sub_to_prop, self.prop_to_w, prop, prop_w)
         prop.addSubProperty(prop_w)
 
         prop_h = self.int_prop_mgr.addProperty()
         prop_h.setPropertyName("Width")
         self.int_prop_mgr.setValue(prop_h, 0)
         self.int_prop_mgr.setMinimum(prop_h, 0)
-        self.prop_to_h[prop] = prop_h
-        self.h_to_prop[prop_h] = prop
+        linkSubProperty(self.sub_to_prop, self.prop_to_h, prop, prop_h)
         prop.addSubProperty(prop_h)
+        self.setRangeToManager(prop, data.min_val, data.max_val, data.val)
 
     def uninitializeProperty(self, prop):
         """
         Reimplementation
         """
-        prop_w = self.prop_to_w[prop]
-        if prop_w:
-            self.w_to_prop.remove(prop_w)
-            del prop_w
-        self.prop_to_w.remove(prop)
-
-        prop_h = self.prop_to_h[prop]
-        if prop_h:
-            self.h_to_prop.remove(prop_h)
-            del prop_h
-        self.prop_to_h.remove(prop)
-
+        unlinkSubProperties(self.sub_to_prop, prop, self.prop_to_w, self.prop_to_h)
         self.values.remove(prop)
 
     def slotIntChanged(self, prop, value):
-        prop_w = self.w_to_prop.get(prop, 0)
-        if prop_w:
-            s = copy.copy(self.values[prop_w].val)
+        prop_size, channel = self.sub_to_prop.get(prop, (None, None))
+        if not prop_size:
+            return
+
+        s = copy.copy(self.values[prop_size].val)
+        if channel is self.prop_to_w:
             s.setWidth(value)
-            self.setValue(prop_w, s)
         else:
-            prop_h = self.h_to_prop.get(prop, 0)
-            if prop_h:
-                s = copy.copy(self.values[prop_h].val)
-                s.setHeight(value)
-                self.setValue(prop_h, s)
+            s.setHeight(value)
+        self.setValue(prop_size, s)
 
     def slotPropertyDestroyed(self, prop):
-        prop_w = self.w_to_prop.get(prop, 0)
-        if prop_w:
-            self.prop_to_w[prop_w] = 0
-            self.w_to_prop.remove(prop)
-        else:
-            prop_h = self.h_to_prop.get(prop, 0)
-            if prop_h:
-                self.prop_to_h[prop_h] = 0
-                self.h_to_prop.remove(prop)
+        unlinkDestroyedSubProperty(self.sub_to_prop, prop)
 
     def setValueToManager(self, prop, val):
         self.int_prop_mgr.setValue(self.prop_to_w[prop], val.width())
@@ -2556,8 +2804,7 @@ class QtSizeFPropertyManager(QtAbstractPropertyManager):
         self.values = QMap()
         self.prop_to_w = QMap()
         self.prop_to_h = QMap()
-        self.w_to_prop = QMap()
-        self.h_to_prop = QMap()
+        self.sub_to_prop = QMap()
         self.Data = QtSizeFPropertyManager.Data()
 
         self.double_prop_mgr = QtDoublePropertyManager(self)
@@ -2612,7 +2859,7 @@ class QtSizeFPropertyManager(QtAbstractPropertyManager):
         """
         Reimplementation
         """
-        if not prop in self.values.keys():
+        if not prop in self.values:
             return
 
         val = self.values[prop].val
@@ -2630,7 +2877,7 @@ class QtSizeFPropertyManager(QtAbstractPropertyManager):
         valid value within the size range.
         """
         setValueInRange(self,
-                        self.propertyChangedSignal,
+                        self.propertyChanged,
                         self.valueChangedSignal,
                         prop,
                         val,
@@ -2645,7 +2892,7 @@ class QtSizeFPropertyManager(QtAbstractPropertyManager):
         that the current value is within the range).
         """
         setBorderValue(self,
-                       self.propertyChangedSignal,
+                       self.propertyChanged,
                        self.valueChangedSignal,
                        self.rangeChangedSignal,
                        prop,
@@ -2663,7 +2910,7 @@ class QtSizeFPropertyManager(QtAbstractPropertyManager):
         that the current value is within the range).
         """
         setBorderValue(self,
-                       self.propertyChangedSignal,
+                       self.propertyChanged,
                        self.valueChangedSignal,
                        self.rangeChangedSignal,
                        prop,
@@ -2678,7 +2925,7 @@ class QtSizeFPropertyManager(QtAbstractPropertyManager):
 
         The vlaid decimal range is 0~13. The default is 4.
         """
-        if not prop in self.values.keys():
+        if not prop in self.values:
             return
 
         data = self.values[prop]
@@ -2703,7 +2950,7 @@ class QtSizeFPropertyManager(QtAbstractPropertyManager):
         """
         Sets the isngle step of the given property to step.
         """
-        if not prop in self.values.keys():
+        if not prop in self.values:
             return
 
         data = self.values[prop]
@@ -2728,7 +2975,7 @@ class QtSizeFPropertyManager(QtAbstractPropertyManager):
         necessary 9ensuring that the value remains within the range).
         """
         setBorderValues(self,
-                        self.propertyChangedSignal,
+                        self.propertyChanged,
                         self.valueChangedSignal,
                         self.rangeChangedSignal,
                         prop,
@@ -2738,17 +2985,23 @@ class QtSizeFPropertyManager(QtAbstractPropertyManager):
 
     def initializeProperty(self, prop):
         """
-                Reimplementation
-                """
+        Reimplementation
+        """
         self.values[prop] = QtSizeFPropertyManager.Data()
+        self.initializeSubProperties(prop)
+
+    def createSubProperties(self, prop):
+        """
+        Reimplementation
+        """
+        data = self.values[prop]
 
         prop_w = self.double_prop_mgr.addProperty()
         prop_w.setPropertyName("Width")
         self.double_prop_mgr.setDecimals(prop_w, self.decimals(prop))
         self.double_prop_mgr.setValue(prop_w, 0)
         self.double_prop_mgr.setMinimum(prop_w, 0)
-        self.prop_to_w[prop] = prop_w
-        self.w_to_prop[prop_w] = prop
+        linkSubProperty(self.sub_to_prop, self.prop_to_w, prop, prop_w)
         prop.addSubProperty(prop_w)
 
         prop_h = self.double_prop_mgr.addProperty()
@@ -2756,51 +3009,31 @@ class QtSizeFPropertyManager(QtAbstractPropertyManager):
         self.double_prop_mgr.setDecimals(prop_h, self.decimals(prop))
         self.double_prop_mgr.setValue(prop_h, 0)
         self.double_prop_mgr.setMinimum(prop_h, 0)
-        self.prop_to_h[prop] = prop_h
-        self.h_to_prop[prop_h] = prop
+        linkSubProperty(self.sub_to_prop, self.prop_to_h, prop, prop_h)
         prop.addSubProperty(prop_h)
+        self.setRangeToManager(prop, data.min_val, data.max_val, data.val)
 
     def uninitializeProperty(self, prop):
         """
         Reimplementation
         """
-        prop_w = self.prop_to_w[prop]
-        if prop_w:
-            self.w_to_prop.remove(prop_w)
-            del prop_w
-        self.prop_to_w.remove(prop)
-
-        prop_h = self.prop_to_h[prop]
-        if prop_h:
-            self.h_to_prop.remove(prop_h)
-            del prop_h
-        self.prop_to_h.remove(prop)
-
+        unlinkSubProperties(self.sub_to_prop, prop, self.prop_to_w, self.prop_to_h)
         self.values.remove(prop)
 
     def slotDoubleChanged(self, prop, value):
-        prop_w = self.w_to_prop.get(prop, 0)
-        if prop_w:
-            s = copy.copy(self.values[prop_w].val)
+        prop_size, channel = self.sub_to_prop.get(prop, (None, None))
+        if not prop_size:
+            return
+
+        s = copy.copy(self.values[prop_size].val)
+        if channel is self.prop_to_w:
             s.setWidth(value)
-            self.setValue(prop_w, s)
         else:
-            prop_h = self.h_to_prop.get(prop, 0)
-            if prop_h:
-                s = copy.copy(self.values[prop_h].val)
-                s.setHeight(value)
-                self.setValue(prop_h, s)
+            s.setHeight(value)
+        self.setValue(prop_size, s)
 
     def slotPropertyDestroyed(self, prop):
-        prop_w = self.w_to_prop.get(prop, 0)
-        if prop_w:
-            self.prop_to_w[prop_w] = 0
-            self.w_to_prop.remove(prop)
-        else:
-            prop_h = self.h_to_prop.get(prop, 0)
-            if prop_h:
-                self.prop_to_h[prop_h] = 0
-                self.h_to_prop.remove(prop)
+        unlinkDestroyedSubProperty(self.sub_to_prop, prop)
 
     def setValueToManager(self, prop, val):
         self.double_prop_mgr.setValue(self.prop_to_w[prop], val.width())
@@ -2866,6 +3099,8 @@ class QtEnumPropertyManager(QtAbstractPropertyManager):
         val = -1
         enum_names = QList()
         enum_icons = QMap()
+        names_key = ()
+        icons_key = ()
 
     def __init__(self, parent=None):
         """
@@ -2894,6 +3129,7 @@ class QtEnumPropertyManager(QtAbstractPropertyManager):
     def enumNames(self, prop):
         """
         Returns the given property's list of enum names.
+        Properties with equal names share the list, so it must not be modified.
         """
 
         # In case of QtSizePolicyPropertyManager
@@ -2902,7 +3138,7 @@ class QtEnumPropertyManager(QtAbstractPropertyManager):
             return QList(data.values())
         ###
 
-        return getData(self.values, DATA_ENUMNAMES, prop, [])
+        return data
 
     def enumIcons(self, prop):
         """
@@ -2914,7 +3150,7 @@ class QtEnumPropertyManager(QtAbstractPropertyManager):
         """
         Reimplementation
         """
-        if not prop in self.values.keys():
+        if not prop in self.values:
             return
 
         data = self.values[prop]
@@ -2936,7 +3172,7 @@ class QtEnumPropertyManager(QtAbstractPropertyManager):
         """
         Reimplementation
         """
-        if not prop in self.values.keys():
+        if not prop in self.values:
             return
 
         data = self.values[prop]
@@ -2949,7 +3185,7 @@ class QtEnumPropertyManager(QtAbstractPropertyManager):
         The specified value must be less than the size of the given property's
         enum_names list, and larger than (or equal to) 0.
         """
-        if not prop in self.values.keys():
+        if not prop in self.values:
             return
 
         data = self.values[prop]
@@ -2968,7 +3204,7 @@ class QtEnumPropertyManager(QtAbstractPropertyManager):
 
         data.val = val
         self.values[prop] = data
-        self.propertyChangedSignal.emit(prop)
+        self.propertyChanged(prop)
         self.valueChangedSignal.emit(prop, data.val)
 
     def setEnumNames(self, prop, names):
@@ -2977,15 +3213,17 @@ class QtEnumPropertyManager(QtAbstractPropertyManager):
         The property's current value is reset to 0 indicating the first item of the list.
         If the specified enum_names list is empy, the property's current value is set to -1.
         """
-        if not prop in self.values.keys():
-            return
-
         data = self.values[prop]
+        if not data:
+            return
 
-        if data.enum_names == names:
+        key = g_enumNameTables.key(names)
+        if data.names_key == key:
             return
 
-        data.enum_names = names
+        data.enum_names = g_enumNameTables.acquire(key, names)
+        g_enumNameTables.release(data.names_key)
+        data.names_key = g_enumNameTables.key(data.enum_names)
         data.val = -1
 
         if len(names) > 0:
@@ -2993,7 +3231,7 @@ class QtEnumPropertyManager(QtAbstractPropertyManager):
 
         self.values[prop] = data
         self.enumNamesChangedSignal.emit(prop, data.enum_names)
-        self.propertyChangedSignal.emit(prop)
+        self.propertyChanged(prop)
         self.valueChangedSignal.emit(prop, data.val)
 
     def setEnumIcons(self, prop, icons):
@@ -3002,13 +3240,20 @@ class QtEnumPropertyManager(QtAbstractPropertyManager):
         Each enum value can have associated icon.
         This association is represented with passed enum_icons map.
         """
-        if not prop in self.values.keys():
+        data = self.values[prop]
+        if not data:
             return
 
-        self.values[prop].enum_icons = icons
+        key = g_enumIconTables.key(icons)
+        if data.icons_key == key:
+            return
 
-        self.enumIconsChangedSignal.emit(prop, self.values[prop].enum_icons)
-        self.propertyChangedSignal.emit(prop)
+        data.enum_icons = g_enumIconTables.acquire(key, icons)
+        g_enumIconTables.release(data.icons_key)
+        data.icons_key = g_enumIconTables.key(data.enum_icons)
+
+        self.enumIconsChangedSignal.emit(prop, data.enum_icons)
+        self.propertyChanged(prop)
 
     def initializeProperty(self, prop):
         """
@@ -3020,7 +3265,10 @@ class QtEnumPropertyManager(QtAbstractPropertyManager):
         """
         Reimplementation
         """
-        self.values.remove(prop)
+        data = self.values.pop(prop, None)
+        if data:
+            g_enumNameTables.release(data.names_key)
+            g_enumIconTables.release(data.icons_key)
 
 
 #####################################################################################
@@ -3066,10 +3314,7 @@ class QtSizePolicyPropertyManager(QtAbstractPropertyManager):
         self.prop_to_hstretch = QMap()
         self.prop_to_vpolicy = QMap()
         self.prop_to_vstretch = QMap()
-        self.hpolicy_to_prop = QMap()
-        self.hstretch_to_prop = QMap()
-        self.vpolicy_to_prop = QMap()
-        self.vstretch_to_prop = QMap()
+        self.sub_to_prop = QMap()
 
         self.int_prop_mgr = QtIntPropertyManager(self)
         self.int_prop_mgr.valueChangedSignal.connect(self.slotIntChanged)
@@ -3118,7 +3363,7 @@ class QtSizePolicyPropertyManager(QtAbstractPropertyManager):
         """
         Reimplementation
         """
-        if not prop in self.values.keys():
+        if not prop in self.values:
             return ""
 
         sp = self.values[prop]
@@ -3148,7 +3393,7 @@ class QtSizePolicyPropertyManager(QtAbstractPropertyManager):
         Sets the value of the given property to value.
         Nested properties are updated automatically.
         """
-        if not prop in self.values.keys():
+        if not prop in self.values:
             return
 
         # if self.values[prop] == val:
@@ -3162,130 +3407,84 @@ class QtSizePolicyPropertyManager(QtAbstractPropertyManager):
         self.int_prop_mgr.setValue(self.prop_to_hstretch[prop], val.horizontalStretch())
         self.int_prop_mgr.setValue(self.prop_to_vstretch[prop], val.verticalStretch())
 
-        self.propertyChangedSignal.emit(prop)
+        self.propertyChanged(prop)
         self.valueChangedSignal.emit(prop, val)
 
     def initializeProperty(self, prop):
         """
         Reimplementation
         """
-        val = QSizePolicy()
-        self.values[prop] = val
+        self.values[prop] = QSizePolicy()
+        self.initializeSubProperties(prop)
+
+    def createSubProperties(self, prop):
+        """
+        Reimplementation
+        """
+        val = self.values[prop]
 
         prop_hpolicy = self.enum_prop_mgr.addProperty()
         prop_hpolicy.setPropertyName("Horizontal Policy")
         self.enum_prop_mgr.setEnumNames(prop_hpolicy, metaEnumProvider().policyEnumValueNames())
         self.enum_prop_mgr.setValue(prop_hpolicy, metaEnumProvider().sizePolicyToIndex(val.horizontalPolicy()))
-        self.prop_to_hpolicy[prop] = prop_hpolicy
-        self.hpolicy_to_prop[prop_hpolicy] = prop
+        linkSubProperty(self.sub_to_prop, self.prop_to_hpolicy, prop, prop_hpolicy)
         prop.addSubProperty(prop_hpolicy)
 
         prop_vpolicy = self.enum_prop_mgr.addProperty()
         prop_vpolicy.setPropertyName("Vertical Policy")
         self.enum_prop_mgr.setEnumNames(prop_vpolicy, metaEnumProvider().policyEnumValueNames())
         self.enum_prop_mgr.setValue(prop_vpolicy, metaEnumProvider().sizePolicyToIndex(val.verticalPolicy()))
-        self.prop_to_vpolicy[prop] = prop_vpolicy
-        self.vpolicy_to_prop[prop_vpolicy] = prop
+        linkSubProperty(self.sub_to_prop, self.prop_to_vpolicy, prop, prop_vpolicy)
         prop.addSubProperty(prop_vpolicy)
 
         prop_hstretch = self.int_prop_mgr.addProperty()
         prop_hstretch.setPropertyName("Horizontal Stretch")
         self.int_prop_mgr.setValue(prop_hstretch, val.horizontalStretch())
         self.int_prop_mgr.setRange(prop_hstretch, 0, 0xff)
-        self.prop_to_hstretch[prop] = prop_hstretch
-        self.hstretch_to_prop[prop_hstretch] = prop
+        linkSubProperty(self.sub_to_prop, self.prop_to_hstretch, prop, prop_hstretch)
         prop.addSubProperty(prop_hstretch)
 
         prop_vstretch = self.int_prop_mgr.addProperty()
         prop_vstretch.setPropertyName("Vertical Stretch")
         self.int_prop_mgr.setValue(prop_vstretch, val.verticalStretch())
         self.int_prop_mgr.setRange(prop_vstretch, 0, 0xff)
-        self.prop_to_vstretch[prop] = prop_vstretch
-        self.vstretch_to_prop[prop_vstretch] = prop
+        linkSubProperty(self.sub_to_prop, self.prop_to_vstretch, prop, prop_vstretch)
         prop.addSubProperty(prop_vstretch)
 
     def uninitializeProperty(self, prop):
         """
         Reimplementation
         """
-        prop_hpolicy = self.prop_to_hpolicy[prop]
-        if prop_hpolicy:
-            self.hpolicy_to_prop.remove(prop_hpolicy)
-            del prop_hpolicy
-
-        self.prop_to_hpolicy.remove(prop)
-
-        prop_vpolicy = self.prop_to_vpolicy[prop]
-        if prop_vpolicy:
-            self.vpolicy_to_prop.remove(prop_vpolicy)
-            del prop_vpolicy
-
-        self.prop_to_vpolicy.remove(prop)
-
-        prop_hstretch = self.prop_to_hstretch[prop]
-        if prop_hstretch:
-            self.hstretch_to_prop.remove(prop_hstretch)
-            del prop_hstretch
-
-        self.prop_to_hstretch.remove(prop)
-
-        prop_vstretch = self.prop_to_vstretch[prop]
-        if prop_vstretch:
-            self.vstretch_to_prop.remove(prop_vstretch)
-            del prop_vstretch
-
-        self.prop_to_vstretch.remove(prop)
-
+        unlinkSubProperties(self.sub_to_prop, prop,
+                            self.prop_to_hpolicy, self.prop_to_hstretch, self.prop_to_vpolicy, self.prop_to_vstretch)
         self.values.remove(prop)
 
     def slotIntChanged(self, prop, value):
-        prop_hstretch = self.hstretch_to_prop.get(prop, 0)
-        if prop_hstretch:
-            sp = self.values[prop_hstretch]
-            # sp = QSizePolicy(self.values[prop_hstretch])
+        prop_policy, channel = self.sub_to_prop.get(prop, (None, None))
+        if not prop_policy:
+            return
+
+        sp = self.values[prop_policy]
+        if channel is self.prop_to_hstretch:
             sp.setHorizontalStretch(value)
-            self.setValue(prop_hstretch, sp)
         else:
-            prop_vstretch = self.vstretch_to_prop.get(prop, 0)
-            if prop_vstretch:
-                sp = self.values[prop_vstretch]
-                # sp = QSizePolicy(self.values[prop_vstretch])
-                sp.setVerticalStretch(value)
-                self.setValue(prop_vstretch, sp)
+            sp.setVerticalStretch(value)
+        self.setValue(prop_policy, sp)
 
     def slotEnumChanged(self, prop, value):
-        prop_hpolicy = self.hpolicy_to_prop.get(prop, 0)
-        if prop_hpolicy:
-            sp = self.values[prop_hpolicy]
+        prop_policy, channel = self.sub_to_prop.get(prop, (None, None))
+        if not prop_policy:
+            return
+
+        sp = self.values[prop_policy]
+        if channel is self.prop_to_hpolicy:
             sp.setHorizontalPolicy(metaEnumProvider().indexToSizePolicy(value))
-            self.setValue(prop_hpolicy, sp)
         else:
-            prop_vpolicy = self.vpolicy_to_prop.get(prop, 0)
-            if prop_vpolicy:
-                sp = self.values[prop_vpolicy]
-                sp.setVerticalPolicy(metaEnumProvider().indexToSizePolicy(value))
-                self.setValue(prop_vpolicy, sp)
+            sp.setVerticalPolicy(metaEnumProvider().indexToSizePolicy(value))
+        self.setValue(prop_policy, sp)
 
     def slotPropertyDestroyed(self, prop):
-        prop_hstretch = self.hstretch_to_prop.get(prop, 0)
-        if prop_hstretch:
-            self.prop_to_hstretch[prop_hstretch] = 0
-            self.hstretch_to_prop.remove(prop)
-        else:
-            prop_vstretch = self.vstretch_to_prop.get(prop, 0)
-            if prop_vstretch:
-                self.prop_to_vstretch[prop_vstretch] = 0
-                self.vstretch_to_prop.remove(prop)
-            else:
-                prop_hpolicy = self.hpolicy_to_prop.get(prop, 0)
-                if prop_hpolicy:
-                    self.prop_to_hpolicy[prop_hpolicy] = 0
-                    self.hpolicy_to_prop.remove(prop)
-                else:
-                    prop_vpolicy = self.vpolicy_to_prop.get(prop, 0)
-                    if prop_vpolicy:
-                        self.prop_to_vpolicy[prop_vpolicy] = 0
-                        self.vpolicy_to_prop.remove(prop)
+        unlinkDestroyedSubProperty(self.sub_to_prop, prop)
 
 
 #####################################################################################
@@ -3302,8 +3501,8 @@ class QtSizePolicyPropertyManager(QtAbstractPropertyManager):
 #   representing each flag, i.e. a flag property's value is the binary combination of 
 #   the subproperties' value. A property's value can be retrieved and set using
 #   the value() and setValue() slots respectively. The combination of flags is 
-#   represented by single int value - that's why it's possible to store up to 
-#   32 independent flags in one flag property.
+#   represented by single int value, which is not limited to 32 bits, so wide
+#   register-style masks can be stored in one flag property.
 #
 #   The subproperties are created by a QtBoolPropertyManager object. This manager 
 #   can be retrieved using the subBoolPropertyManager() function. In order to 
@@ -3332,12 +3531,13 @@ class QtSizePolicyPropertyManager(QtAbstractPropertyManager):
 #####################################################################################
 class QtFlagPropertyManager(QtAbstractPropertyManager):
     # Defines custom signals
-    valueChangedSignal      = Signal(QtProperty, int)
+    valueChangedSignal      = Signal(QtProperty, object)
     flagNamesChangedSignal  = Signal(QtProperty, QList)
 
     class Data:
         val = -1
         flag_names = QList()
+        flag_key = ()
 
     def __init__(self, parent=None) -> None:
         """
@@ -3387,24 +3587,11 @@ class QtFlagPropertyManager(QtAbstractPropertyManager):
         """
         Reimplementation
         """
-        if not prop in self.values.keys():
-            return ""
-
         data = self.values[prop]
+        if not data:
+            return ""
 
-        s = ""
-        level = 0
-        bar = " | "
-        for it in data.flag_names:
-            if data.val & (1 << level):
-                if s != "":
-                    s += bar
-                
-                s += it
-
-            level += 1
-            
-        return s
+        return flagValueText(data.flag_key, data.val)
 
     def setValue(self, prop, val):
         """
@@ -3415,10 +3602,10 @@ class QtFlagPropertyManager(QtAbstractPropertyManager):
         the property's flagNames() list size (i.e. less than 2^n, where n 
         is the size of the list) and larger than (or equal to) 0.
         """
-        if not prop in self.values.keys():
+        data = self.values[prop]
+        if not data:
             return
 
-        data = self.values[prop]
         if data.val == val:
             return
 
@@ -3428,67 +3615,80 @@ class QtFlagPropertyManager(QtAbstractPropertyManager):
         if val < 0:
             return
 
+        # Only the bool subproperties whose bit flipped need an update.
+        changed = val ^ max(data.val, 0)
         data.val = val
-        self.values[prop] = data
 
-        level = 0
-        for p in self.prop_to_flags[prop]:
+        flags = self.prop_to_flags[prop]
+        while changed:
+            bit = changed & -changed
+            changed ^= bit
+            p = flags[bit.bit_length() - 1]
             if p:
-                self.bool_prop_mgr.setValue(p, val & (1 << level))
-            level += 1
+                self.bool_prop_mgr.setValue(p, bool(val & bit))
 
-        self.propertyChangedSignal.emit(prop)
+        self.propertyChanged(prop)
         self.valueChangedSignal.emit(prop, data.val)
 
     def slotBoolChanged(self, prop, value):
-        p = self.flags_to_prop.get(prop, 0)
-        if p == 0:
+        p, bit = self.flags_to_prop.get(prop, (None, 0))
+        if not p:
             return
-        
-        level = 0
-        for a in self.prop_to_flags[p]:
-            if a == prop:
-                v = copy.copy(self.values[p].val)
-
-                if value:
-                    v |= (1 << level)
-                else:
-                    v &= ~(1 << level)
 
-                self.setValue(p, v)
-                return
+        v = self.values[p].val
+        if value:
+            v |= bit
+        else:
+            v &= ~bit
 
-            level += 1
+        self.setValue(p, v)
 
     def setFlagNames(self, prop, flag_names):
-        if not prop in self.values.keys():
-            return
+        """
+        Sets the given property's list of flag names to flagNames.
+        The property's current value is reset to 0 indicating the first item of the list.
 
+        Flag subproperties are renamed and reused where possible; only the missing
+        ones are created and the surplus ones destroyed.
+        """
         data = self.values[prop]
+        if not data:
+            return
+
         if data.flag_names == flag_names:
             return
 
         data.flag_names = flag_names
+        data.flag_key = tuple(flag_names)
         data.val = 0
 
-        self.values[prop] = data
-
-        for p in self.prop_to_flags[prop]:
+        flags = self.prop_to_flags[prop]
+        while len(flags) > len(flag_names):
+            p = flags.pop()
             if p:
-                del p
+                self.flags_to_prop.remove(p)
+                prop.removeSubProperty(p)
+                p.destroy()
 
-        self.prop_to_flags[prop].clear()
+        for level, flag_name in enumerate(flag_names):
+            if level < len(flags) and flags[level]:
+                p = flags[level]
+                p.setPropertyName(flag_name)
+                self.bool_prop_mgr.setValue(p, False)
+                continue
 
-        for flag_name in flag_names:
             p = self.bool_prop_mgr.addProperty()
             p.setPropertyName(flag_name)
             prop.addSubProperty(p)
 
-            self.prop_to_flags[prop].append(p)
-            self.flags_to_prop[p] = prop
+            if level < len(flags):
+                flags[level] = p
+            else:
+                flags.append(p)
+            self.flags_to_prop[p] = (prop, 1 << level)
 
         self.flagNamesChangedSignal.emit(prop, data.flag_names)
-        self.propertyChangedSignal.emit(prop)
+        self.propertyChanged(prop)
         self.valueChangedSignal.emit(prop, data.val)
 
     def initializeProperty(self, prop):
@@ -3504,18 +3704,17 @@ class QtFlagPropertyManager(QtAbstractPropertyManager):
         """
         for p in self.prop_to_flags[prop]:
             if p:
-                del p
+                self.flags_to_prop.remove(p)
 
         self.prop_to_flags.remove(prop)
         self.values.remove(prop)
 
     def slotPropertyDestroyed(self, prop):
-        flag_prop = self.flags_to_prop.get(prop, 0)
-        if flag_prop == 0:
+        flag_prop, bit = self.flags_to_prop.pop(prop, (None, 0))
+        if not flag_prop:
             return
 
-        self.prop_to_flags[flag_prop].replace(self.prop_to_flags[flag_prop].indexOf(prop), 0)
-        self.flags_to_prop.remove(prop)
+        self.prop_to_flags[flag_prop][bit.bit_length() - 1] = 0
 
 
 #####################################################################################
@@ -3552,8 +3751,7 @@ class QtPointPropertyManager(QtAbstractPropertyManager):
         self.values = QMap()
         self.prop_to_x = QMap()
         self.prop_to_y = QMap()
-        self.x_to_prop = QMap()
-        self.y_to_prop = QMap()
+        self.sub_to_prop = QMap()
 
         self.int_prop_mgr = QtIntPropertyManager(self)
         self.int_prop_mgr.valueChangedSignal.connect(self.slotIntChanged)
@@ -3586,7 +3784,7 @@ class QtPointPropertyManager(QtAbstractPropertyManager):
         """
         Reimplementation
         """
-        if not prop in self.values.keys():
+        if not prop in self.values:
             return ""
 
         val = self.values[prop]
@@ -3597,7 +3795,7 @@ class QtPointPropertyManager(QtAbstractPropertyManager):
         Sets the value of the given property to value.
         Nested properties are updated automatically.
         """
-        if not prop in self.values.keys():
+        if not prop in self.values:
             return
 
         if self.values[prop] == val:
@@ -3607,7 +3805,7 @@ class QtPointPropertyManager(QtAbstractPropertyManager):
         self.int_prop_mgr.setValue(self.prop_to_x[prop], val.x())
         self.int_prop_mgr.setValue(self.prop_to_y[prop], val.y())
 
-        self.propertyChangedSignal.emit(prop)
+        self.propertyChanged(prop)
         self.valueChangedSignal.emit(prop, val)
 
     def initializeProperty(self, prop):
@@ -3615,63 +3813,47 @@ class QtPointPropertyManager(QtAbstractPropertyManager):
         Reimplementation
         """
         self.values[prop] = QPoint(0, 0)
+        self.initializeSubProperties(prop)
+
+    def createSubProperties(self, prop):
+        """
+        Reimplementation
+        """
+        val = self.values[prop]
 
         prop_x = self.int_prop_mgr.addProperty()
         prop_x.setPropertyName("X")
-        self.int_prop_mgr.setValue(prop_x, 0)
-        self.prop_to_x[prop] = prop_x
-        self.x_to_prop[prop_x] = prop
+        self.int_prop_mgr.setValue(prop_x, val.x())
+        linkSubProperty(self.sub_to_prop, self.prop_to_x, prop, prop_x)
         prop.addSubProperty(prop_x)
 
         prop_y = self.int_prop_mgr.addProperty()
         prop_y.setPropertyName("Y")
-        self.int_prop_mgr.setValue(prop_y, 0)
-        self.prop_to_y[prop] = prop_y
-        self.y_to_prop[prop_y] = prop
+        self.int_prop_mgr.setValue(prop_y, val.y())
+        linkSubProperty(self.sub_to_prop, self.prop_to_y, prop, prop_y)
         prop.addSubProperty(prop_y)
 
     def uninitializeProperty(self, prop):
         """
         Reimplementation
         """
-        prop_x = self.prop_to_x[prop]
-        if prop_x:
-            self.x_to_prop.remove(prop_x)
-            del prop_x
-        self.prop_to_x.remove(prop)
-
-        prop_y = self.prop_to_y[prop]
-        if prop_y:
-            self.y_to_prop.remove(prop_y)
-            del prop_y
-        self.prop_to_y.remove(prop)
-
-        self.values.remove(prop)    
-        
+        unlinkSubProperties(self.sub_to_prop, prop, self.prop_to_x, self.prop_to_y)
+        self.values.remove(prop)
 
     def slotIntChanged(self, prop, value):
-        prop_x = self.x_to_prop.get(prop, 0)
-        if prop_x:
-            p = copy.copy(self.values[prop_x])
+        prop_point, channel = self.sub_to_prop.get(prop, (None, None))
+        if not prop_point:
+            return
+
+        p = copy.copy(self.values[prop_point])
+        if channel is self.prop_to_x:
             p.setX(value)
-            self.setValue(prop_x, p)
         else:
-            prop_y = self.y_to_prop.get(prop, 0)
-            if prop_y:
-                p = copy.copy(self.values[prop_y])
-                p.setY(value)
-                self.setValue(prop_y, p)
+            p.setY(value)
+        self.setValue(prop_point, p)
 
     def slotPropertyDestroyed(self, prop):
-        prop_x = self.x_to_prop.get(prop, 0)
-        if prop_x:
-            self.prop_to_x[prop_x] = 0
-            self.x_to_prop.remove(prop)
-        else:
-            prop_y = self.y_to_prop.get(prop, 0)
-            if prop_y:
-                self.prop_to_y[prop_y] = 0
-                self.y_to_prop.remove(prop)
+        unlinkDestroyedSubProperty(self.sub_to_prop, prop)
 
 
 #####################################################################################
@@ -3724,8 +3906,7 @@ class QtPointFPropertyManager(QtAbstractPropertyManager):
         self.values = QMap()
         self.prop_to_x = QMap()
         self.prop_to_y = QMap()
-        self.x_to_prop = QMap()
-        self.y_to_prop = QMap()
+        self.sub_to_prop = QMap()
         self.Data = QtPointFPropertyManager.Data()
 
         self.double_prop_mgr = QtDoublePropertyManager(self)
@@ -3765,7 +3946,7 @@ class QtPointFPropertyManager(QtAbstractPropertyManager):
         """
         Reimplementation
         """
-        if not prop in self.values.keys():
+        if not prop in self.values:
             return ""
         
         val = self.values[prop].val
@@ -3778,7 +3959,7 @@ class QtPointFPropertyManager(QtAbstractPropertyManager):
         Sets the value of the given property to value.
         Nested properties are updated automatically.
         """
-        if not prop in self.values.keys():
+        if not prop in self.values:
             return
 
         if self.values[prop].val == val:
@@ -3788,7 +3969,7 @@ class QtPointFPropertyManager(QtAbstractPropertyManager):
         self.double_prop_mgr.setValue(self.prop_to_x[prop], val.x())
         self.double_prop_mgr.setValue(self.prop_to_y[prop], val.y())
 
-        self.propertyChangedSignal.emit(prop)
+        self.propertyChanged(prop)
         self.valueChangedSignal.emit(prop, val)
 
     def setDecimals(self, prop, precision):
@@ -3797,7 +3978,7 @@ class QtPointFPropertyManager(QtAbstractPropertyManager):
         The valid decimal range is 0~13.
         The default is 4.
         """
-        if not prop in self.values.keys():
+        if not prop in self.values:
             return
         
         data = self.values[prop]
@@ -3821,7 +4002,7 @@ class QtPointFPropertyManager(QtAbstractPropertyManager):
         """
         Sets the single step of the given property to step.
         """
-        if not prop in self.values.keys():
+        if not prop in self.values:
             return
         
         data = self.values[prop]
@@ -3840,65 +4021,49 @@ class QtPointFPropertyManager(QtAbstractPropertyManager):
         Reimplementation
         """
         self.values[prop] = QtPointFPropertyManager.Data()
+        self.initializeSubProperties(prop)
+
+    def createSubProperties(self, prop):
+        """
+        Reimplementation
+        """
+        val = self.values[prop].val
 
         prop_x = self.double_prop_mgr.addProperty()
         prop_x.setPropertyName("X")
         self.double_prop_mgr.setDecimals(prop_x, self.decimals(prop))
-        self.double_prop_mgr.setValue(prop_x, 0)
-        self.prop_to_x[prop] = prop_x
-        self.x_to_prop[prop_x] = prop
+        self.double_prop_mgr.setValue(prop_x, val.x())
+        linkSubProperty(self.sub_to_prop, self.prop_to_x, prop, prop_x)
         prop.addSubProperty(prop_x)
 
         prop_y = self.double_prop_mgr.addProperty()
         prop_y.setPropertyName("X")
         self.double_prop_mgr.setDecimals(prop_y, self.decimals(prop))
-        self.double_prop_mgr.setValue(prop_y, 0)
-        self.prop_to_y[prop] = prop_y
-        self.y_to_prop[prop_y] = prop
+        self.double_prop_mgr.setValue(prop_y, val.y())
+        linkSubProperty(self.sub_to_prop, self.prop_to_y, prop, prop_y)
         prop.addSubProperty(prop_y)
 
     def uninitializeProperty(self, prop):
         """
         Reimplementation
         """
-        prop_x = self.prop_to_x[prop]
-        if prop_x:
-            self.x_to_prop.remove(prop_x)
-            del prop_x
-        self.prop_to_x.remove(prop)
-
-        prop_y = self.prop_to_y[prop]
-        if prop_y:
-            self.y_to_prop.remove(prop_y)
-            del prop_y
-        self.prop_to_y.remove(prop)
-
-        self.values.remove(prop)   
-
+        unlinkSubProperties(self.sub_to_prop, prop, self.prop_to_x, self.prop_to_y)
+        self.values.remove(prop)
 
     def slotDoubleChanged(self, prop, value):
-        prop_x = self.x_to_prop.get(prop, 0)
-        if prop_x:
-            p = copy.copy(self.values[prop_x].val)
+        prop_point, channel = self.sub_to_prop.get(prop, (None, None))
+        if not prop_point:
+            return
+
+        p = copy.copy(self.values[prop_point].val)
+        if channel is self.prop_to_x:
             p.setX(value)
-            self.setValue(prop_x, p)
         else:
-            prop_y = self.y_to_prop.get(prop, 0)
-            if prop_y:
-                p = copy.copy(self.values[prop_y].val)
-                p.setY(value)
-                self.setValue(prop_y, p)
+            p.setY(value)
+        self.setValue(prop_point, p)
 
     def slotPropertyDestroyed(self, prop):
-        prop_x = self.x_to_prop.get(prop, 0)
-        if prop_x:
-            self.prop_to_x[prop_x] = 0
-            self.x_to_prop.remove(prop)
-        else:
-            prop_y = self.y_to_prop.get(prop, 0)
-            if prop_y:
-                self.prop_to_y[prop_y] = 0
-                self.y_to_prop.remove(prop)
+        unlinkDestroyedSubProperty(self.sub_to_prop, prop)
 
 
 #####################################################################################
@@ -3984,7 +4149,7 @@ class QtDatePropertyManager(QtAbstractPropertyManager):
         """
         Reimplementation
         """
-        if not prop in self.values.keys():
+        if not prop in self.values:
             return ""
 
         return self.values[prop].val.toString(self.format)
@@ -3999,7 +4164,7 @@ class QtDatePropertyManager(QtAbstractPropertyManager):
         """
         set_subprop_value = 0
         setValueInRange(self, 
-                        self.propertyChangedSignal,
+                        self.propertyChanged,
                         self.valueChangedSignal, 
                         prop, 
                         val,
@@ -4014,7 +4179,7 @@ class QtDatePropertyManager(QtAbstractPropertyManager):
         that the current value is within in the range).
         """
         setMinimumValue(self,
-                        self.propertyChangedSignal,
+                        self.propertyChanged,
                         self.valueChangedSignal,
                         self.rangeChangedSignal,
                         prop,
@@ -4029,7 +4194,7 @@ class QtDatePropertyManager(QtAbstractPropertyManager):
         that the current value is within in the range).
         """
         setMaximumValue(self,
-                        self.propertyChangedSignal,
+                        self.propertyChanged,
                         self.valueChangedSignal,
                         self.rangeChangedSignal,
                         prop,
@@ -4038,7 +4203,7 @@ class QtDatePropertyManager(QtAbstractPropertyManager):
     def setRange(self, prop, min_val, max_val):
         set_subprop_range = 0
         setBorderValues(self,
-                        self.propertyChangedSignal,
+                        self.propertyChanged,
                         self.valueChangedSignal,
                         self.rangeChangedSignal,
                         prop,
@@ -4111,7 +4276,7 @@ class QtTimePropertyManager(QtAbstractPropertyManager):
         """
         Reimplementation
         """
-        if not prop in self.values.keys():
+        if not prop in self.values:
             return ""
 
         return self.values[prop].toString(self.format)
@@ -4121,7 +4286,7 @@ class QtTimePropertyManager(QtAbstractPropertyManager):
         Sets the value of the given property to value.
         """
         setSimpleValue(self.values,
-                       self.propertyChangedSignal,
+                       self.propertyChanged,
                        self.valueChangedSignal,
                        prop,
                        val)
@@ -4130,7 +4295,7 @@ class QtTimePropertyManager(QtAbstractPropertyManager):
         """
         Sets the value of the given property to format.
         """
-        if not prop in self.values.keys():
+        if not prop in self.values:
             return
 
         self.format = QLocale().timeFormat(format)
@@ -4213,7 +4378,7 @@ class QtDateTimePropertyManager(QtAbstractPropertyManager):
         Sets the value of the given property to value.
         """
         setSimpleValue(self.values,
-                      self.propertyChangedSignal,
+                      self.propertyChanged,
                       self.valueChangedSignal,
                       prop,
                       val)
@@ -4223,7 +4388,7 @@ class QtDateTimePropertyManager(QtAbstractPropertyManager):
         Sets the value of the given property to format.
         Date and time are changed.
         """
-        if not prop in self.values.keys():
+        if not prop in self.values:
             return
         
         self.format = QLocale().dateFormat(format)
@@ -4283,7 +4448,9 @@ class QtFontPropertyManager(QtAbstractPropertyManager):
         """
         super().__init__(parent)
         self.values = QMap()
-        self.family_names = QList()
+        # Loaded from the font database on first use, see familyNames()
+        self.family_names = None
+        self.family_to_index = {}
         self.prop_to_family = QMap()
         self.prop_to_font_size = QMap()
         self.prop_to_bold = QMap()
@@ -4291,14 +4458,7 @@ class QtFontPropertyManager(QtAbstractPropertyManager):
         self.prop_to_underline = QMap()
         self.prop_to_strike_out = QMap()
         self.prop_to_kerning = QMap()
-        
-        self.family_to_prop = QMap()
-        self.font_size_to_prop = QMap()
-        self.bold_to_prop = QMap()
-        self.italic_to_prop = QMap()
-        self.underline_to_prop = QMap()
-        self.strike_out_to_prop = QMap()
-        self.kerning_to_prop = QMap()
+        self.sub_to_prop = QMap()
 
         self.setting_value = False
         self.font_database_change_timer = None
@@ -4363,11 +4523,23 @@ class QtFontPropertyManager(QtAbstractPropertyManager):
         """
         return self.values.get(prop, QFont())
 
+    def familyNames(self):
+        """
+        Returns the font families listed by the family subproperties.
+
+        The font database is only queried when the families are first needed,
+        i.e. when the first family subproperty is created.
+        """
+        if self.family_names is None:
+            self.family_names = QList(fontDatabase().families())
+            self.family_to_index = {family: i for i, family in enumerate(self.family_names)}
+        return self.family_names
+
     def valueText(self, prop) -> str:
         """
         Reimplementation
         """
-        if not prop in self.values.keys():
+        if not prop in self.values:
             return ""
 
         return fontValueText(self.values[prop])
@@ -4376,7 +4548,7 @@ class QtFontPropertyManager(QtAbstractPropertyManager):
         """
         Reimplementation
         """
-        if not prop in self.values.keys():
+        if not prop in self.values:
             return QIcon()
 
         return fontValueIcon(self.values[prop])
@@ -4386,7 +4558,7 @@ class QtFontPropertyManager(QtAbstractPropertyManager):
         Sets the value of the given property to value.
         Nested properties are updated automatically.
         """
-        if not prop in self.values.keys():
+        if not prop in self.values:
             return
 
         old_val = self.values[prop]
@@ -4395,231 +4567,139 @@ class QtFontPropertyManager(QtAbstractPropertyManager):
 
         self.values[prop] = val
 
-        idx = self.family_names.indexOf(val.family())
-        if idx == -1:
-            idx = 0
-
         setting_value = self.setting_value
         self.setting_value = True
 
-        self.enum_prop_mgr.setValue(self.prop_to_family[prop], idx)
-        self.enum_prop_mgr.setValue(self.prop_to_font_size[prop], idx)
-        self.enum_prop_mgr.setValue(self.prop_to_bold[prop], idx)
-        self.enum_prop_mgr.setValue(self.prop_to_italic[prop], idx)
-        self.enum_prop_mgr.setValue(self.prop_to_underline[prop], idx)
-        self.enum_prop_mgr.setValue(self.prop_to_strike_out[prop], idx)
-        self.enum_prop_mgr.setValue(self.prop_to_kerning[prop], idx)
+        prop_family = self.prop_to_family[prop]
+        if prop_family:
+            self.enum_prop_mgr.setValue(prop_family, self.family_to_index.get(val.family(), 0))
+        self.int_prop_mgr.setValue(self.prop_to_font_size[prop], val.pointSize())
+        self.bool_prop_mgr.setValue(self.prop_to_bold[prop], val.bold())
+        self.bool_prop_mgr.setValue(self.prop_to_italic[prop], val.italic())
+        self.bool_prop_mgr.setValue(self.prop_to_underline[prop], val.underline())
+        self.bool_prop_mgr.setValue(self.prop_to_strike_out[prop], val.strikeOut())
+        self.bool_prop_mgr.setValue(self.prop_to_kerning[prop], val.kerning())
 
         self.setting_value = setting_value
 
-        self.propertyChangedSignal.emit(prop)
+        self.propertyChanged(prop)
         self.valueChangedSignal.emit(prop, val)
 
     def initializeProperty(self, prop):
         """
         Reimplementation
         """
-        val = QFont()
-        self.values[prop] = val
+        self.values[prop] = QFont()
+        self.initializeSubProperties(prop)
+
+    def createSubProperties(self, prop):
+        """
+        Reimplementation
+        """
+        val = self.values[prop]
 
         prop_family = self.enum_prop_mgr.addProperty()
         prop_family.setPropertyName("Family")
-        if len(self.family_names) <= 0:
-            self.family_names += fontDatabase().families()
-        
-        self.enum_prop_mgr.setEnumNames(prop_family, self.family_names)
-        idx = self.family_names.indexOf(val.family())
-        if idx == -1:
-            idx = 0
-        
-        self.enum_prop_mgr.setValue(prop_family, idx)
-        self.prop_to_family[prop] = prop_family
-        self.family_to_prop[prop_family] = prop
+        self.enum_prop_mgr.setEnumNames(prop_family, self.familyNames())
+        # Reuse the shared table, so later font properties skip hashing the family list.
+        self.family_names = self.enum_prop_mgr.enumNames(prop_family)
+        self.enum_prop_mgr.setValue(prop_family, self.family_to_index.get(val.family(), 0))
+        linkSubProperty(self.sub_to_prop, self.prop_to_family, prop, prop_family)
         prop.addSubProperty(prop_family)
 
         prop_point_size = self.int_prop_mgr.addProperty()
         prop_point_size.setPropertyName("Font size")
         self.int_prop_mgr.setValue(prop_point_size, val.pointSize())
         self.int_prop_mgr.setMinimum(prop_point_size, 1)
-        self.prop_to_font_size[prop] = prop_point_size
-        self.font_size_to_prop[prop_point_size] = prop
+        linkSubProperty(self.sub_to_prop, self.prop_to_font_size, prop, prop_point_size)
         prop.addSubProperty(prop_point_size)
 
         prop_bold = self.bool_prop_mgr.addProperty()
         prop_bold.setPropertyName("Bold")
         self.bool_prop_mgr.setValue(prop_bold, val.bold())
-        self.prop_to_bold[prop] = prop_bold
-        self.bold_to_prop[prop_bold] = prop
+        linkSubProperty(self.sub_to_prop, self.prop_to_bold, prop, prop_bold)
         prop.addSubProperty(prop_bold)
 
         prop_italic = self.bool_prop_mgr.addProperty()
         prop_italic.setPropertyName("Italic")
         self.bool_prop_mgr.setValue(prop_italic, val.italic())
-        self.prop_to_italic[prop] = prop_italic
-        self.italic_to_prop[prop_italic] = prop
+        linkSubProperty(self.sub_to_prop, self.prop_to_italic, prop, prop_italic)
         prop.addSubProperty(prop_italic)
 
         prop_underline = self.bool_prop_mgr.addProperty()
         prop_underline.setPropertyName("Underline")
         self.bool_prop_mgr.setValue(prop_underline, val.underline())
-        self.prop_to_underline[prop] = prop_underline
-        self.underline_to_prop[prop_underline] = prop
+        linkSubProperty(self.sub_to_prop, self.prop_to_underline, prop, prop_underline)
         prop.addSubProperty(prop_underline)
 
         prop_strike_out = self.bool_prop_mgr.addProperty()
         prop_strike_out.setPropertyName("Strike_out")
         self.bool_prop_mgr.setValue(prop_strike_out, val.strikeOut())
-        self.prop_to_strike_out[prop] = prop_strike_out
-        self.strike_out_to_prop[prop_strike_out] = prop
+        linkSubProperty(self.sub_to_prop, self.prop_to_strike_out, prop, prop_strike_out)
         prop.addSubProperty(prop_strike_out)
 
         prop_kerning = self.bool_prop_mgr.addProperty()
         prop_kerning.setPropertyName("Kerning")
         self.bool_prop_mgr.setValue(prop_kerning, val.kerning())
-        self.prop_to_kerning[prop] = prop_kerning
-        self.kerning_to_prop[prop_kerning] = prop
+        linkSubProperty(self.sub_to_prop, self.prop_to_kerning, prop, prop_kerning)
         prop.addSubProperty(prop_kerning)
 
     def uninitializeProperty(self, prop):
         """
         Reimplementation
         """
-        prop_family = self.prop_to_family[prop]
-        if prop_family:
-            self.family_to_prop.remove(prop_family)
-            del prop_family
-        self.prop_to_family.remove(prop)
-
-        prop_point_size = self.prop_to_font_size[prop]
-        if prop_point_size:
-            self.font_size_to_prop.remove(prop_point_size)
-            del prop_point_size
-        self.prop_to_font_size.remove(prop)
-
-        prop_bold = self.prop_to_bold[prop]
-        if prop_bold:
-            self.bold_to_prop.remove(prop_bold)
-            del prop_bold
-        self.prop_to_bold.remove(prop)
-
-        prop_italic = self.prop_to_italic[prop]
-        if prop_italic:
-            self.italic_to_prop.remove(prop_italic)
-            del prop_italic
-        self.prop_to_italic.remove(prop)
-
-        prop_underline = self.prop_to_underline[prop]
-        if prop_underline:
-            self.underline_to_prop.remove(prop_underline)
-            del prop_underline
-        self.prop_to_underline.remove(prop)
-
-        prop_strike_out = self.prop_to_strike_out[prop]
-        if prop_strike_out:
-            self.strike_out_to_prop.remove(prop_strike_out)
-            del prop_strike_out
-        self.prop_to_strike_out.remove(prop)
-
-        prop_kerning = self.prop_to_kerning[prop]
-        if prop_kerning:
-            self.kerning_to_prop.remove(prop_kerning)
-            del prop_kerning
-        self.prop_to_kerning.remove(prop)
-            
+        unlinkSubProperties(self.sub_to_prop, prop,
+                            self.prop_to_family, self.prop_to_font_size, self.prop_to_bold, self.prop_to_italic,
+                            self.prop_to_underline, self.prop_to_strike_out, self.prop_to_kerning)
+        self.values.remove(prop)
 
     def slotIntChanged(self, prop, value):
         if self.setting_value:
             return
-        
-        prop_point_size = self.font_size_to_prop.get(prop, 0)
-        if prop_point_size:
-            f = QFont(self.values[prop_point_size])
+
+        prop_font, channel = self.sub_to_prop.get(prop, (None, None))
+        if prop_font:
+            f = QFont(self.values[prop_font])
             f.setPointSize(value)
-            self.setValue(prop_point_size, f)
+            self.setValue(prop_font, f)
 
     def slotEnumChanged(self, prop, value):
         if self.setting_value:
             return
 
-        prop_family = self.family_to_prop.get(prop, 0)
-        if prop_family:
-            f = QFont(self.values[prop_family])
+        prop_font, channel = self.sub_to_prop.get(prop, (None, None))
+        if prop_font:
+            f = QFont(self.values[prop_font])
             f.setFamily(self.family_names[value])
-            self.setValue(prop_family, f)
+            self.setValue(prop_font, f)
 
     def slotBoolChanged(self, prop, value):
         if self.setting_value:
             return
 
-        p = self.bold_to_prop.get(prop, 0)
-        if p:
-            f = QFont(self.values[p])
+        prop_font, channel = self.sub_to_prop.get(prop, (None, None))
+        if not prop_font:
+            return
+
+        f = QFont(self.values[prop_font])
+        if channel is self.prop_to_bold:
             f.setBold(value)
-            self.setValue(p, f)
+        elif channel is self.prop_to_italic:
+            f.setItalic(value)
+        elif channel is self.prop_to_underline:
+            f.setUnderline(value)
+        elif channel is self.prop_to_strike_out:
+            f.setStrikeOut(value)
         else:
-            p = self.italic_to_prop.get(prop, 0)
-            if p:
-                f = QFont(self.values[p])
-                f.setItalic(value)
-                self.setValue(p, f)
-            else:
-                p = self.underline_to_prop.get(prop, 0)
-                if p:
-                    f = QFont(self.values[p])
-                    f.setUnderline(value)
-                    self.setValue(p, f)
-                else:
-                    p = self.strike_out_to_prop.get(prop, 0)
-                    if p:
-                        f = QFont(self.values[p])
-                        f.setStrikeOut(value)
-                        self.setValue(p, f)
-                    else:
-                        p = self.kerning_to_prop.get(prop, 0)
-                        if p:
-                            f = QFont(self.values[p])
-                            f.setKerning(value)
-                            self.setValue(p, f)
+            f.setKerning(value)
+        self.setValue(prop_font, f)
 
     def slotPropertyDestroyed(self, prop):
-        p = self.font_size_to_prop.get(prop, 0)
-        if p:
-            self.prop_to_font_size[p] = 0
-            self.font_size_to_prop.remove(prop)
-        else:
-            p = self.family_to_prop.get(prop, 0)
-            if p:
-                self.prop_to_family[p] = 0
-                self.family_to_prop.remove(prop)
-            else:
-                p = self.bold_to_prop.get(prop, 0)
-                if p:
-                    self.prop_to_bold[p] = 0
-                    self.bold_to_prop.remove(prop)
-                else:
-                    p = self.italic_to_prop.get(prop, 0)
-                    if p:
-                        self.prop_to_italic[p] = 0
-                        self.italic_to_prop.remove(prop)
-                    else:
-                        p = self.underline_to_prop.get(prop, 0)
-                        if p:
-                            self.prop_to_underline[p] = 0
-                            self.underline_to_prop.remove(prop)
-                        else:
-                            p = self.strike_out_to_prop.get(prop, 0)
-                            if p:
-                                self.prop_to_strike_out[p] = 0
-                                self.strike_out_to_prop.remove(prop)
-                            else:
-                                p = self.kerning_to_prop.get(prop, 0)
-                                if p:
-                                    self.prop_to_kerning[p] = 0
-                                    self.kerning_to_prop.remove(prop)
+        unlinkDestroyedSubProperty(self.sub_to_prop, prop)
 
     def slotFontDatabaseChanged(self):
         if not self.font_database_change_timer:
-            self.font_database_change_timer = QTime(self)
+            self.font_database_change_timer = QTimer(self)
             self.font_database_change_timer.setInterval(0)
             self.font_database_change_timer.setSingleShot(True)
             self.font_database_change_timer.timeout.connect(self.slotFontDatabaseDelayedChange)
@@ -4628,21 +4708,40 @@ class QtFontPropertyManager(QtAbstractPropertyManager):
             self.font_database_change_timer.start()
 
     def slotFontDatabaseDelayedChange(self):
-        # Rescan available font names
+        # Families that were never loaded are read fresh on first use.
         old_families = self.family_names
-        self.family_names = fontDatabase().families()
+        if old_families is None:
+            return
 
-        # Adapt all existing properties
-        if len(self.prop_to_family) > 0:
-            for prop_family in self.prop_to_family:
-                old_idx = self.enum_prop_mgr[prop_family]
-                new_idx = self.family_names.indexOf(old_families[old_idx])
+        # Rescan available font names
+        families = QList(fontDatabase().families())
+        if families == old_families:
+            return
+
+        self.family_names = families
+        self.family_to_index = {family: i for i, family in enumerate(families)}
 
-                if new_idx < 0:
-                    new_idx = 0
-                
-                self.enum_prop_mgr.setEnumNames(prop_family, self.family_names)
-                self.enum_prop_mgr.setValue(prop_family, new_idx)
+        # Adapt all existing properties. The new list is interned by the first
+        # setEnumNames() call; the following ones pass the shared table as is.
+        setting_value = self.setting_value
+        self.setting_value = True
+        new_indexes = {}
+        for prop_family in self.prop_to_family.values():
+            if not prop_family:
+                continue
+
+            old_idx = self.enum_prop_mgr.value(prop_family)
+            new_idx = new_indexes.get(old_idx)
+            if new_idx is None:
+                new_idx = 0
+                if 0 <= old_idx < len(old_families):
+                    new_idx = self.family_to_index.get(old_families[old_idx], 0)
+                new_indexes[old_idx] = new_idx
+
+            self.enum_prop_mgr.setEnumNames(prop_family, self.family_names)
+            self.family_names = self.enum_prop_mgr.enumNames(prop_family)
+            self.enum_prop_mgr.setValue(prop_family, new_idx)
+        self.setting_value = setting_value
 
 
 #####################################################################################
@@ -4682,8 +4781,7 @@ class QtLocalePropertyManager(QtAbstractPropertyManager):
         self.values = QMap()
         self.prop_to_lang = QMap()
         self.prop_to_country = QMap()
-        self.lang_to_prop = QMap()
-        self.country_to_prop = QMap()
+        self.sub_to_prop = QMap()
         
         self.enum_prop_mgr = QtEnumPropertyManager(self)
         self.enum_prop_mgr.valueChangedSignal.connect(self.slotEnumChanged)
@@ -4717,7 +4815,7 @@ class QtLocalePropertyManager(QtAbstractPropertyManager):
         """
         Reimplementation
         """
-        if not prop in self.values.keys():
+        if not prop in self.values:
             return ""
 
         loc = self.values[prop]
@@ -4733,7 +4831,7 @@ class QtLocalePropertyManager(QtAbstractPropertyManager):
         """
         Sets the value of the given property to value. Nested properties are updated automatically.
         """
-        if not prop in self.values.keys():
+        if not prop in self.values:
             return
 
         loc = self.values[prop]
@@ -4751,7 +4849,7 @@ class QtLocalePropertyManager(QtAbstractPropertyManager):
 
         self.enum_prop_mgr.setValue(self.prop_to_country[prop], country_idx)
 
-        self.propertyChangedSignal.emit(prop)
+        self.propertyChanged(prop)
         self.valueChangedSignal.emit(prop, val)
 
     def initializeProperty(self, prop):
@@ -4769,71 +4867,38 @@ class QtLocalePropertyManager(QtAbstractPropertyManager):
         prop_lang.setPropertyName(self.tr("Language"))
         self.enum_prop_mgr.setEnumNames(prop_lang, metaEnumProvider().languageEnumNames())
         self.enum_prop_mgr.setValue(prop_lang, lang_idx)
-        self.prop_to_lang[prop] = prop_lang
-        self.lang_to_prop[prop_lang] = prop
+        linkSubProperty(self.sub_to_prop, self.prop_to_lang, prop, prop_lang)
         prop.addSubProperty(prop_lang)
 
         prop_country = self.enum_prop_mgr.addProperty()
         prop_country.setPropertyName(self.tr("Country"))
         self.enum_prop_mgr.setEnumNames(prop_country, metaEnumProvider().countryEnumNames(val.language()))
         self.enum_prop_mgr.setValue(prop_country, country_idx)
-        self.prop_to_country[prop] = prop_country
-        self.country_to_prop[prop_country] = prop
+        linkSubProperty(self.sub_to_prop, self.prop_to_country, prop, prop_country)
         prop.addSubProperty(prop_country)
 
     def uninitializeProperty(self, prop):
         """
         Reimplementation
         """
-        prop_lang = self.prop_to_lang[prop]
-        if prop_lang:
-            self.lang_to_prop.remove(prop_lang)
-            del prop_lang
-
-        self.prop_to_lang.remove(prop)
-
-        prop_country = self.prop_to_country[prop]
-        if prop_country:
-            self.country_to_prop.remove(prop_country)
-            del prop_country
-
-        self.prop_to_country.remove(prop)
-
+        unlinkSubProperties(self.sub_to_prop, prop, self.prop_to_lang, self.prop_to_country)
         self.values.remove(prop)
 
     def slotEnumChanged(self, prop, value):
-        prop_lang = self.lang_to_prop.get(prop, 0)
-        if prop_lang:
-            loc = self.values[prop_lang]
-            new_lang = loc.language()
-            new_country = loc.country()
+        prop_locale, channel = self.sub_to_prop.get(prop, (None, None))
+        if not prop_locale:
+            return
+
+        loc = self.values[prop_locale]
+        if channel is self.prop_to_lang:
             new_lang, c = metaEnumProvider().indexToLocale(value, 0)
-            newLoc = QLocale(new_lang, new_country)
-            self.setValue(prop_lang, newLoc)
+            new_country = loc.country()
         else:
-            prop_country = self.country_to_prop.get(prop, 0)
-            if prop_country:
-                loc = self.values[prop_country]
-                new_lang = loc.language()
-                new_country = loc.country()
-                new_lang, new_country = metaEnumProvider().indexToLocale(self.enum_prop_mgr.value(self.prop_to_lang[prop_country]), value)
-                newLoc = QLocale(new_lang, new_country)
-                self.setValue(prop_country, newLoc)
+            new_lang, new_country = metaEnumProvider().indexToLocale(self.enum_prop_mgr.value(self.prop_to_lang[prop_locale]), value)
+        self.setValue(prop_locale, QLocale(new_lang, new_country))
 
     def slotPropertyDestroyed(self, prop):
-        subProp = self.lang_to_prop.get(prop, 0)
-        if subProp:
-            self.prop_to_lang[subProp] = 0
-            self.lang_to_prop.remove(prop)
-        else:
-            subProp = self.country_to_prop.get(prop, 0)
-            if subProp:
-                self.prop_to_country[subProp] = 0
-                self.country_to_prop.remove(prop)
-
-        self.enum_prop_mgr = QtEnumPropertyManager(self)
-        self.enum_prop_mgr.valueChangedSignal.connect(self.slotEnumChanged)
-        self.enum_prop_mgr.propertyDestroyedSignal.connect(self.slotPropertyDestroyed)
+        unlinkDestroyedSubProperty(self.sub_to_prop, prop)
 
 
 #####################################################################################
@@ -4888,7 +4953,7 @@ class QtKeySequencePropertyManager(QtAbstractPropertyManager):
         """
         Reimplementation
         """
-        if not prop in self.values.keys():
+        if not prop in self.values:
             return ""
 
         return self.values[prop].toString(QKeySequence.NativeText)
@@ -4898,7 +4963,7 @@ class QtKeySequencePropertyManager(QtAbstractPropertyManager):
         Sets the value of the given property to value.
         """
         setSimpleValue(self.values,
-                       self.propertyChangedSignal,
+                       self.propertyChanged,
                        self.valueChangedSignal,
                        prop,
                        val)
@@ -4966,7 +5031,7 @@ class QtCharPropertyManager(QtAbstractPropertyManager):
         """
         Reimplementation
         """
-        if not prop in self.values.keys():
+        if not prop in self.values:
             return ""
 
         char = self.values[prop]
@@ -4980,7 +5045,7 @@ class QtCharPropertyManager(QtAbstractPropertyManager):
         Sets the value of the given property to value.
         """
         setSimpleValue(self.values,
-                       self.propertyChangedSignal,
+                       self.propertyChanged,
                        self.valueChangedSignal,
                        prop,
                        val)
@@ -5072,7 +5137,7 @@ class QtCursorPropertyManager(QtAbstractPropertyManager):
         """
         Reimplementation
         """
-        if not prop in self.values.keys():
+        if not prop in self.values:
             return
 
         return cursorDatabase().cursorToShapeName(self.values[prop])
@@ -5081,7 +5146,7 @@ class QtCursorPropertyManager(QtAbstractPropertyManager):
         """
         Reimplementation
         """
-        if not prop in self.values.keys():
+        if not prop in self.values:
             return
 
         return cursorDatabase().cursorToShapeIcon(self.values[prop])
@@ -5090,7 +5155,7 @@ class QtCursorPropertyManager(QtAbstractPropertyManager):
         """
         Sets the value of the given property to value.
         """
-        if not prop in self.values.keys():
+        if not prop in self.values:
             return
 
         if self.values[prop].shape() == value.shape() and value.shaep() != Qt.BitmapCursor:
@@ -5098,7 +5163,7 @@ class QtCursorPropertyManager(QtAbstractPropertyManager):
 
         self.values[prop] = value
 
-        self.propertyChangedSignal.emit(prop)
+        self.propertyChanged(prop)
         self.valueChangedSignal.emit(prop, value)
 
     def initializeProperty(self, prop):
@@ -5158,7 +5223,7 @@ class QtCharPropertyManager(QtAbstractPropertyManager):
         """
         Reimplementation
         """
-        if not prop in self.values.keys():
+        if not prop in self.values:
             return ""
 
         char = self.values[prop]
@@ -5172,7 +5237,7 @@ class QtCharPropertyManager(QtAbstractPropertyManager):
         Sets the value of the given property to value.
         """
         setSimpleValue(self.values,
-                       self.propertyChangedSignal,
+                       self.propertyChanged,
                        self.valueChangedSignal,
                        prop,
                        val)
@@ -42,18 +42,118 @@
 #
 ############################################################################
 
-from PySide6.QtCore import Qt, QLocale, QRectF
+import json
+import os
+from collections import OrderedDict
+from PySide6.QtCore import Qt, QLocale, QRectF, QStandardPaths, qVersion, qAddPostRoutine
 from PySide6.QtWidgets import QSizePolicy
-from PySide6.QtGui import QImage, QPainter, QPixmap, QIcon, QFont, QTextOption, QCursor
+from PySide6.QtGui import QImage, QPainter, QPixmap, QIcon, QBrush, QFont, QTextOption, QCursor
 from libqt5.pyqtcore import QList, QMap, QMapMap
 
 
+#####################################################################################
+#
+#   class   QtIconCache
+#
+#   brief   Bounded LRU cache of the small pixmaps and icons drawn for property values.
+#
+#   valueIcon() is called on every property change, so a panel full of colors, fonts
+#   or bools would otherwise rasterize the same 16x16 images over and over. Entries are
+#   keyed by what the image depends on, e.g. ("brush", rgba, brush style); the least
+#   recently used entry is dropped once maxSize() entries are stored.
+#
+#   The entries are dropped when QApplication is destroyed, like the cursor database,
+#   so no pixmap or icon outlives it.
+#
+#####################################################################################
+class QtIconCache:
+    def __init__(self, maxSize=1024):
+        self.m_maxSize = maxSize
+        self.m_entries = OrderedDict()
+        self.m_hits = 0
+        self.m_misses = 0
+        self.m_postRoutineAdded = False
+
+    def __len__(self):
+        return len(self.m_entries)
+
+    def get(self, key, create):
+        """
+        Returns the entry stored under key, storing create() first if there is none.
+        """
+        entries = self.m_entries
+        value = entries.get(key)
+        if value is not None:
+            self.m_hits += 1
+            entries.move_to_end(key)
+            return value
+
+        self.m_misses += 1
+        if not self.m_postRoutineAdded:
+            qAddPostRoutine(self.applicationDestroyed)
+            self.m_postRoutineAdded = True
+        value = entries[key] = create()
+        if len(entries) > self.m_maxSize:
+            entries.popitem(last=False)
+        return value
+
+    def maxSize(self):
+        return self.m_maxSize
+
+    def setMaxSize(self, maxSize):
+        self.m_maxSize = maxSize
+        while len(self.m_entries) > maxSize:
+            self.m_entries.popitem(last=False)
+
+    def hits(self):
+        return self.m_hits
+
+    def misses(self):
+        return self.m_misses
+
+    def clear(self):
+        """
+        Drops all entries, e.g. after the application style changed, and resets the counters.
+        """
+        self.m_entries.clear()
+        self.m_hits = 0
+        self.m_misses = 0
+
+    def applicationDestroyed(self):
+        """
+        Post routine registered on first use; a later QApplication registers it again.
+        """
+        self.clear()
+        self.m_postRoutineAdded = False
+
+
+g_iconCache = QtIconCache()
+
+
+def iconCache():
+    return g_iconCache
+
+
+# Gradient and texture brushes are not described by their color, so they are not cached
+UNCACHED_BRUSH_STYLES = (Qt.LinearGradientPattern, Qt.RadialGradientPattern,
+                         Qt.ConicalGradientPattern, Qt.TexturePattern)
+
+
 # For QtColorEditWidget #########################################################
 def colorValueText(color):
     return "[%d, %d, %d] (%d)" % (color.red(), color.green(), color.blue(), color.alpha())
 
 
 def brushValuePixmap(brush):
+    style = brush.style()
+    if style in UNCACHED_BRUSH_STYLES:
+        return drawBrushValuePixmap(brush)
+
+    key = ("brush", brush.color().rgba(), style)
+    return g_iconCache.get(key, lambda: drawBrushValuePixmap(brush))
+
+
+def drawBrushValuePixmap(brush):
     img = QImage(16, 16, QImage.Format_ARGB32_Premultiplied)
     img.fill(0)
 
@@ -63,7 +163,7 @@ def brushValuePixmap(brush):
 
     color = brush.color()
     if color.alpha() != 255:  # indicate alpha by an inset
-        opaque_brush = brush
+        opaque_brush = QBrush(brush)
         color.setAlpha(255)
         opaque_brush.setColor(color)
         painter.fillRect(img.width() / 4, img.height() / 4,
@@ -75,10 +175,45 @@ def brushValuePixmap(brush):
 
 
 def brushValueIcon(brush):
-    return QIcon(brushValuePixmap(brush))
+    style = brush.style()
+    if style in UNCACHED_BRUSH_STYLES:
+        return QIcon(drawBrushValuePixmap(brush))
+
+    key = ("brushIcon", brush.color().rgba(), style)
+    return g_iconCache.get(key, lambda: QIcon(brushValuePixmap(brush)))
 
 
 # For QtLocalePropertyManager and QtSizePolicyPropertyManager ###################
+LOCALE_CACHE_VERSION = 1
+g_localeCacheDirectory = None
+
+
+def setLocaleCacheDirectory(directory):
+    """
+    Enables the on-disk cache of the language and country tables used by
+    QtLocalePropertyManager, which are otherwise rebuilt at every start.
+    An empty string selects the user's cache directory; None disables the cache.
+    Must be called before the first locale property is created.
+    """
+    global g_localeCacheDirectory
+    g_localeCacheDirectory = directory
+
+
+def localeCacheFile():
+    """
+    Returns the cache file for the running Qt version and system locale,
+    or None if the cache is disabled.
+    """
+    if g_localeCacheDirectory is None:
+        return None
+
+    directory = g_localeCacheDirectory
+    if not directory:
+        directory = os.path.join(QStandardPaths.writableLocation(QStandardPaths.GenericCacheLocation), "QtProperty")
+
+    return os.path.join(directory, "locales-v%d-qt%s-%s.json" % (LOCALE_CACHE_VERSION, qVersion(), QLocale.system().name()))
+
+
 class QtMetaEnumProvider:
     def __init__(self):
         self.language_enum_names = QList()
@@ -87,6 +222,8 @@ class QtMetaEnumProvider:
         self.language_to_index = QMap()
         self.index_to_country = QMapMap()
         self.country_to_index = QMapMap()
+        # Countries of the languages whose country tables are not built yet
+        self.language_countries = {}
         # self.policy_enum_names = ['Fixed', 'Minimum', 'MinimumExpanding', 'Maximum', 'Preferred', 'Expanding', 'Ignored']
         self.policy_enum_names = {0: 'Fixed',
                                   1: 'Minimum',
@@ -98,49 +235,105 @@ class QtMetaEnumProvider:
         self.initLocale()
 
     def initLocale(self):
-        name_to_language = {}
-        all_locales = QLocale.matchingLocales(QLocale.AnyLanguage, QLocale.AnyScript, QLocale.AnyCountry)
-        for idx, select_locale in enumerate(all_locales):
-            language = select_locale.language()
-
-            if not select_locale.languageToString(select_locale.language()) in name_to_language:
-                name_to_language[language] = QLocale.languageToString(language)
-        # language = QLocale.C
-        # while language <= QLocale.LastLanguage:
-        #     locale = QLocale(language)
-        #
-        #     if locale.language() == language:
-        #         name_to_language[language] = QLocale.languageToString(language)
-        #     language = language + 1
+        """
+        Builds the language table. The country table of a language is built
+        by initCountries() when it is first needed, unless the cache is enabled.
+        """
+        cache_file = localeCacheFile()
+        if cache_file and self.loadLocaleCache(cache_file):
+            return
+
+        # A single query groups the countries of every language.
+        for locale in QLocale.matchingLocales(QLocale.AnyLanguage, QLocale.AnyScript, QLocale.AnyCountry):
+            self.language_countries.setdefault(locale.language(), []).append(locale.country())
 
         system = QLocale.system()
-        sys_lang = system.language()
-        if not QLocale.languageToString(system.language()) in name_to_language.values():
-            name_to_language[QLocale.languageToString(sys_lang)] = sys_lang
-
-        languages = name_to_language.keys()
-        for language in languages:
-            countries = QLocale.matchingLocales(language, QLocale.AnyScript, QLocale.AnyCountry)
-            if len(countries) > 0 and language == sys_lang:
-                countries.append(QLocale(sys_lang, system.country()))
-
-            if len(countries) > 0 and not self.language_to_index.get(language):
-                countries = self.sortCountries(countries)
-                lang_idx = len(self.language_enum_names)
-                self.index_to_language[lang_idx] = language
-                self.language_to_index[language] = lang_idx
-
-                country_names = QList()
-                country_idx = 0
-                for c in countries:
-                    country = c
-                    country_names.append(QLocale.countryToString(country))
-                    self.index_to_country[lang_idx][country_idx] = country
-                    self.country_to_index[language][country] = country_idx
-                    country_idx += 1
-
-                self.language_enum_names.append(QLocale.languageToString(language))
-                self.country_enum_names[language] = country_names
+        countries = self.language_countries.get(system.language())
+        if countries is not None:
+            countries.append(system.country())
+
+        for language in self.language_countries:
+            lang_idx = len(self.language_enum_names)
+            self.index_to_language[lang_idx] = language
+            self.language_to_index[language] = lang_idx
+            self.language_enum_names.append(QLocale.languageToString(language))
+
+        if cache_file:
+            self.saveLocaleCache(cache_file)
+
+    def initCountries(self, language):
+        """
+        Builds the country table of the given language if it is not built yet.
+        """
+        countries = self.language_countries.pop(language, None)
+        if countries is None:
+            return
+
+        lang_idx = self.language_to_index[language]
+        country_names = QList()
+        for country_idx, country in enumerate(self.sortCountries(countries)):
+            country_names.append(QLocale.countryToString(country))
+            self.index_to_country[lang_idx][country_idx] = country
+            self.country_to_index[language][country] = country_idx
+
+        self.country_enum_names[language] = country_names
+
+    def loadLocaleCache(self, cache_file):
+        """
+        Loads all tables from cache_file. Returns False if the file is missing or stale.
+        """
+        try:
+            with open(cache_file, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return False
+
+        if (not isinstance(data, dict) or data.get("version") != LOCALE_CACHE_VERSION
+                or data.get("qt") != qVersion() or data.get("system") != QLocale.system().name()):
+            return False
+
+        try:
+            languages = [(QLocale.Language(language), language_name,
+                          [QLocale.Country(country) for country in countries], QList(country_names))
+                         for language, language_name, countries, country_names in data["languages"]]
+        except (KeyError, TypeError, ValueError):
+            return False
+
+        for lang_idx, (language, language_name, countries, country_names) in enumerate(languages):
+            self.index_to_language[lang_idx] = language
+            self.language_to_index[language] = lang_idx
+            self.language_enum_names.append(language_name)
+            for country_idx, country in enumerate(countries):
+                self.index_to_country[lang_idx][country_idx] = country
+                self.country_to_index[language][country] = country_idx
+            self.country_enum_names[language] = country_names
+
+        return True
+
+    def saveLocaleCache(self, cache_file):
+        """
+        Builds all country tables and writes every table to cache_file.
+        Failing to write the cache is not an error.
+        """
+        languages = []
+        for lang_idx, language_name in enumerate(self.language_enum_names):
+            language = self.index_to_language[lang_idx]
+            self.initCountries(language)
+            countries = self.index_to_country[lang_idx]
+            languages.append([language.value, language_name,
+                              [countries[i].value for i in range(len(countries))],
+                              list(self.country_enum_names[language])])
+
+        data = {"version": LOCALE_CACHE_VERSION, "qt": qVersion(), "system": QLocale.system().name(),
+                "languages": languages}
+        try:
+            os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+            tmp_file = cache_file + ".tmp"
+            with open(tmp_file, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(tmp_file, cache_file)
+        except OSError:
+            pass
 
     def policyEnumValueNames(self):
         return self.policy_enum_names
@@ -152,16 +345,18 @@ class QtMetaEnumProvider:
         return self.language_enum_names
 
     def countryEnumNames(self, language):
+        self.initCountries(language)
         return self.country_enum_names[language]
 
     def sortCountries(self, countries):
-        countries_map = QMap()
+        """
+        Returns the given countries without duplicates, sorted by name.
+        """
+        countries_map = {}
         for country in countries:
-            c = country.country()
-            countries_map[c] = QLocale.countryToString(c)
-        sorted(countries_map)
+            countries_map[country] = QLocale.countryToString(country)
 
-        return countries_map.keys()
+        return sorted(countries_map, key=countries_map.get)
 
     def indexToSizePolicy(self, index):
         """
@@ -227,6 +422,7 @@ class QtMetaEnumProvider:
 
         if self.index_to_language.get(language_index):
             lang = self.index_to_language[language_index]
+            self.initCountries(lang)
 
             if self.index_to_country.get(language_index) and self.index_to_country[language_index].get(country_index):
                 country = self.index_to_country[language_index][country_index]
@@ -236,8 +432,9 @@ class QtMetaEnumProvider:
     def localeToIndex(self, language, country):
         lang = 0
         coun = 0
-        if self.language_to_index.get(language):
+        if self.language_to_index.get(language) is not None:
             lang = self.language_to_index[language]
+            self.initCountries(language)
 
             if self.country_to_index.get(language) and self.country_to_index[language].get(country):
                 coun = self.country_to_index[language][country]
@@ -247,7 +444,13 @@ class QtMetaEnumProvider:
 
 # For QtFontEditWidget #########################################################
 def fontValuePixmap(font):
+    # The sample is always drawn at 13pt, so fonts differing only in size share it
     f = QFont(font)
+    f.setPointSize(13)
+    return g_iconCache.get(("font", f.key()), lambda: drawFontValuePixmap(f))
+
+
+def drawFontValuePixmap(f):
     img = QImage(16, 16, QImage.Format_ARGB32_Premultiplied)
     img.fill(0)
 
@@ -255,7 +458,6 @@ def fontValuePixmap(font):
     p.setRenderHint(QPainter.TextAntialiasing, True)
     p.setRenderHint(QPainter.Antialiasing, True)
 
-    f.setPointSize(13)
     p.setFont(f)
 
     t = QTextOption()
@@ -271,7 +473,9 @@ def fontValueText(font):
 
 
 def fontValueIcon(font):
-    return QIcon(fontValuePixmap(font))
+    f = QFont(font)
+    f.setPointSize(13)
+    return g_iconCache.get(("fontIcon", f.key()), lambda: QIcon(fontValuePixmap(f)))
 
 
 # For QtCursorPropertyManager #########################################################
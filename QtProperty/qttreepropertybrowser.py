@@ -42,7 +42,6 @@
 #
 ############################################################################
 
-import ctypes
 from PySide6.QtCore import (
     Qt,
     QRect,
@@ -52,7 +51,9 @@ from PySide6.QtCore import (
     Property,
     Signal,
     Slot,
-    QModelIndex
+    QModelIndex,
+    QTimer,
+    QElapsedTimer
 )
 from PySide6.QtWidgets import (
     QStyleOption,
@@ -66,13 +67,18 @@ from PySide6.QtWidgets import (
     QHeaderView,
     QTreeWidgetItem
 )
-from PySide6.QtGui import QPixmap, QIcon, QPainter, QPalette, QPen, QColor, QFontMetrics
+from PySide6.QtGui import QPixmap, QIcon, QPainter, QPalette, QPen, QColor, QFont, QFontMetrics, QRegion
 
 from libqt5.pyqtcore import QMap, QList
 from QtProperty.qtbrowseritem import QtBrowserItem
 from QtProperty.qtproperty import QtProperty
 from QtProperty.qtabstractpropertybrowser import QtAbstractPropertyBrowser
 
+# Item state before its first update, differs from every real state
+_NO_ITEM_STATE = (None,) * 8
+
+ROW_GRID_COLOR = QColor(211, 211, 211)
+
 
 def drawIndicatorIcon(palette, style):
     """
@@ -107,6 +113,41 @@ def drawIndicatorIcon(palette, style):
     return rc
 
 
+def propertyRowOption(editorPrivate, painter, option, index):
+    """
+    Fills the background of a property row and returns the option the row is drawn with.
+    The option is only copied for rows with a background color.
+    """
+    browserItem = editorPrivate.indexToBrowserItem(index)
+    hasValue = True
+    if browserItem:
+        hasValue = browserItem.property().hasValue()
+
+    if not hasValue and editorPrivate.markPropertiesWithoutValue():
+        c = option.palette.color(QPalette.Dark)
+        painter.fillRect(option.rect, c)
+        opt = QStyleOptionViewItem(option)
+        opt.palette.setColor(QPalette.AlternateBase, c)
+        return opt
+
+    c = editorPrivate.calculatedBackgroundColor(browserItem)
+    if c.isValid():
+        painter.fillRect(option.rect, c)
+        opt = QStyleOptionViewItem(option)
+        opt.palette.setColor(QPalette.AlternateBase, c.lighter(112))
+        return opt
+
+    return option
+
+
+def drawRowGridLine(painter, opt):
+    rect = opt.rect
+    painter.save()
+    painter.setPen(ROW_GRID_COLOR)
+    painter.drawLine(rect.x(), rect.bottom(), rect.right(), rect.bottom())
+    painter.restore()
+
+
 ## ------------ QtPropertyEditorView
 class QtPropertyEditorView(QTreeWidget):
     def __init__(self, parent):
@@ -122,30 +163,9 @@ class QtPropertyEditorView(QTreeWidget):
         return self.itemFromIndex(index)
 
     def drawRow(self, painter, option, index):
-        opt = QStyleOptionViewItem(option)
-        hasValue = True
-        if self.m_editorPrivate:
-            prop = self.m_editorPrivate.indexToProperty(index)
-            if prop:
-                hasValue = prop.hasValue()
-
-        if not hasValue and self.m_editorPrivate.markPropertiesWithoutValue():
-            c = option.palette.color(QPalette.Dark)
-            painter.fillRect(option.rect, c)
-            opt.palette.setColor(QPalette.AlternateBase, c)
-        else:
-            c = self.m_editorPrivate.calculatedBackgroundColor(self.m_editorPrivate.indexToBrowserItem(index))
-            if c.isValid():
-                painter.fillRect(option.rect, c)
-                opt.palette.setColor(QPalette.AlternateBase, c.lighter(112))
-
+        opt = propertyRowOption(self.m_editorPrivate, painter, option, index)
         super(QtPropertyEditorView, self).drawRow(painter, opt, index)
-
-        # color = ctypes.c_ulong(QApplication.style().styleHint(QStyle.SH_Table_GridLineColor, opt)).value
-        painter.save()
-        painter.setPen(QPen(QColor(211, 211, 211)))
-        painter.drawLine(opt.rect.x(), opt.rect.bottom(), opt.rect.right(), opt.rect.bottom())
-        painter.restore()
+        drawRowGridLine(painter, opt)
 
     def keyPressEvent(self, event):
         if event.key() in [Qt.Key_Return, Qt.Key_Enter, Qt.Key_Space]:  # Trigger Edit
@@ -189,6 +209,13 @@ class QtPropertyEditorDelegate(QItemDelegate):
         self.m_disablePainting = False
         self.m_propertyToEditor = QMap()
         self.m_editorToProperty = QMap()
+        # Paint state, recomputed only when the style, palette or font changes
+        self.m_gridStyle = None
+        self.m_gridPaletteKey = None
+        self.m_gridPen = None
+        self.m_boldFontBase = None
+        self.m_boldFont = None
+        self.m_boldFontMetrics = None
 
     def setEditorPrivate(self, editorPrivate):
         self.m_editorPrivate = editorPrivate
@@ -206,11 +233,11 @@ class QtPropertyEditorDelegate(QItemDelegate):
         if not self.m_editorPrivate:
             return 0
 
-        item = self.m_editorPrivate.indexToItem(index)
-        indent = 0
-        while item.parent():
-            item = item.parent()
-            indent += 1
+        item = self.m_editorPrivate.indexToBrowserItem(index)
+        if not item:
+            return 0
+
+        indent = item.depth()
         if self.m_editorPrivate.treeWidget().rootIsDecorated():
             indent += 1
         return indent * self.m_editorPrivate.treeWidget().indentation()
@@ -232,9 +259,9 @@ class QtPropertyEditorDelegate(QItemDelegate):
         if editor:
             hv = editor.property('hash_value')
 
-            for x in self.m_editorToProperty:
-                if x[0].hash_value == hv:
-                    self.m_propertyToEditor.remove(x)
+            for x in self.m_editorToProperty.keys():
+                if x.hash_value == hv:
+                    self.m_propertyToEditor.remove(self.m_editorToProperty[x])
                     self.m_editorToProperty.erase(x)
                     break
             if self.m_editedWidget.hash_value == hv:
@@ -250,7 +277,7 @@ class QtPropertyEditorDelegate(QItemDelegate):
             prop = self.m_editorPrivate.indexToProperty(index)
             item = self.m_editorPrivate.indexToItem(index)
 
-            if prop and item and (item.flags() & Qt.ItemIsEnabled):
+            if prop and item and (index.flags() & Qt.ItemIsEnabled):
                 editor = self.m_editorPrivate.createEditor(prop, parent)
 
                 if editor:
@@ -271,54 +298,85 @@ class QtPropertyEditorDelegate(QItemDelegate):
     def updateEditorGeometry(self, editor, option, index):
         editor.setGeometry(option.rect.adjusted(0, 0, 0, -1))
 
-    def paint(self, painter, option, index):
-        hasValue = True
-        if self.m_editorPrivate:
-            prop = self.m_editorPrivate.indexToProperty(index)
-            if prop:
-                hasValue = prop.hasValue()
+    def gridPen(self, palette):
+        """
+        Returns the pen of the column separators for the given palette.
+        """
+        style = QApplication.style()
+        paletteKey = palette.cacheKey()
+        if style is not self.m_gridStyle or paletteKey != self.m_gridPaletteKey:
+            gridOption = QStyleOptionViewItem()
+            gridOption.palette = QPalette(palette)
+            gridOption.palette.setCurrentColorGroup(QPalette.Active)
+            # styleHint() returns the ARGB value as a signed int
+            color = style.styleHint(QStyle.SH_Table_GridLineColor, gridOption) & 0xFFFFFFFF
+            self.m_gridStyle = style
+            self.m_gridPaletteKey = paletteKey
+            self.m_gridPen = QPen(QColor.fromRgba(color))
+        return self.m_gridPen
+
+    def boldFont(self, font):
+        """
+        Returns the bold variant of font and its metrics, used for modified properties.
+        """
+        if self.m_boldFontBase is None or font != self.m_boldFontBase:
+            self.m_boldFontBase = QFont(font)
+            self.m_boldFont = QFont(font)
+            self.m_boldFont.setBold(True)
+            self.m_boldFontMetrics = QFontMetrics(self.m_boldFont)
+        return self.m_boldFont, self.m_boldFontMetrics
 
-        opt = QStyleOptionViewItem(option)
-        if (self.m_editorPrivate and index.column() == 0) or not hasValue:
-            prop = self.m_editorPrivate.indexToProperty(index)
-            if prop and prop.isModified():
-                opt.font.setBold(True)
-                opt.fontMetrics = QFontMetrics(opt.font)
-
-        c = QColor()
-        if not hasValue and self.m_editorPrivate.markPropertiesWithoutValue():
-            c = opt.palette.color(QPalette.Dark)
-            opt.palette.setColor(QPalette.Text, opt.palette.color(QPalette.BrightText))
+    def paint(self, painter, option, index):
+        editorPrivate = self.m_editorPrivate
+        browserItem = None
+        prop = None
+        if editorPrivate:
+            browserItem = editorPrivate.indexToBrowserItem(index)
+            if browserItem:
+                prop = browserItem.property()
+        hasValue = prop.hasValue() if prop else True
+
+        bold = ((editorPrivate and index.column() == 0) or not hasValue) and prop and prop.isModified()
+        markedWithoutValue = not hasValue and editorPrivate.markPropertiesWithoutValue()
+
+        # The option is only copied for cells which draw differently from the view's option
+        opt = option
+        # Fully qualified enum values, PySide resolves the short Qt.* names slowly
+        if bold or markedWithoutValue or (option.state & QStyle.StateFlag.State_HasFocus):
+            opt = QStyleOptionViewItem(option)
+            opt.state &= ~QStyle.StateFlag.State_HasFocus
+            if bold:
+                opt.font, opt.fontMetrics = self.boldFont(opt.font)
+
+        if markedWithoutValue:
+            c = opt.palette.color(QPalette.ColorRole.Dark)
+            opt.palette.setColor(QPalette.ColorRole.Text, opt.palette.color(QPalette.ColorRole.BrightText))
         else:
-            c = self.m_editorPrivate.calculatedBackgroundColor(self.m_editorPrivate.indexToBrowserItem(index))
-            if c.isValid() and (opt.features & QStyleOptionViewItem.Alternate):
+            c = editorPrivate.calculatedBackgroundColor(browserItem)
+            if c.isValid() and (opt.features & QStyleOptionViewItem.ViewItemFeature.Alternate):
                 c = c.lighter(112)
 
         if c.isValid():
             painter.fillRect(option.rect, c)
-        opt.state &= ~QStyle.State_HasFocus
 
-        if index.column() == 1:
-            item = self.m_editorPrivate.indexToItem(index)
-            if self.m_editedItem and (self.m_editedItem == item):
+        if index.column() == 1 and self.m_editedItem:
+            if self.m_editedItem == editorPrivate.indexToItem(index):
                 self.m_disablePainting = True
 
         super(QtPropertyEditorDelegate, self).paint(painter, opt, index)
         if option.type:
             self.m_disablePainting = False
 
-        opt.palette.setCurrentColorGroup(QPalette.Active)
-        color = ctypes.c_ulong(QApplication.style().styleHint(QStyle.SH_Table_GridLineColor, opt)).value
-        painter.save()
-        painter.setPen(QPen(QColor(color)))
-        if not self.m_editorPrivate or (not self.m_editorPrivate.lastColumn(index.column()) and hasValue):
-            if option.direction == Qt.LeftToRight:
-                right = option.rect.right()
+        if not editorPrivate or (not editorPrivate.lastColumn(index.column()) and hasValue):
+            rect = option.rect
+            if option.direction == Qt.LayoutDirection.LeftToRight:
+                right = rect.right()
             else:
-                right = option.rect.left()
-            painter.drawLine(right, option.rect.y(), right, option.rect.bottom())
-
-        painter.restore()
+                right = rect.left()
+            painter.save()
+            painter.setPen(self.gridPen(option.palette))
+            painter.drawLine(right, rect.y(), right, rect.bottom())
+            painter.restore()
 
     def drawDecoration(self, painter, option,rect, pixmap):
         if self.m_disablePainting:
@@ -384,6 +442,16 @@ class QtTreePropertyBrowser(QtAbstractPropertyBrowser):
         self.m_indexToItem = QMap()
         self.m_itemToIndex = QMap()
         self.m_indexToBackgroundColor = QMap()
+        # Background color inherited by each painted item, see calculatedBackgroundColor()
+        self.m_itemToCalculatedColor = {}
+        # Last texts and icons set on each tree item, see updateItem()
+        self.m_itemToState = {}
+        # Browser items changed since the last flush, in order
+        self.m_dirtyItems = {}
+        self.m_maximumUpdateRate = 0
+        self.m_updateTimer = None
+        # Time since the last flush, invalid before the first one
+        self.m_lastFlush = QElapsedTimer()
 
         self.m_treeWidget = None
         self.m_headerVisible = True
@@ -435,6 +503,10 @@ class QtTreePropertyBrowser(QtAbstractPropertyBrowser):
         self.m_treeWidget.expanded.connect(self.slotExpanded)
         self.m_treeWidget.currentItemChanged.connect(self.slotCurrentTreeItemChanged)
 
+        self.m_updateTimer = QTimer(parent)
+        self.m_updateTimer.setSingleShot(True)
+        self.m_updateTimer.timeout.connect(self.slotFlushUpdates)
+
     def createEditor(self, prop, parent):
         return super().createEditor(prop, parent)
 
@@ -526,7 +598,10 @@ class QtTreePropertyBrowser(QtAbstractPropertyBrowser):
         self.m_indexToItem[index] = newItem
 
         newItem.setFlags(newItem.flags() | Qt.ItemIsEditable)
-        newItem.setExpanded(True)
+        if self.hasDeferredChildren(index):
+            newItem.setChildIndicatorPolicy(QTreeWidgetItem.ShowIndicator)
+        else:
+            newItem.setExpanded(True)
 
         self.updateItem(newItem)
 
@@ -546,10 +621,71 @@ class QtTreePropertyBrowser(QtAbstractPropertyBrowser):
         self.m_indexToItem.remove(index)
         self.m_itemToIndex.remove(item)
         self.m_indexToBackgroundColor.remove(index)
+        self.m_itemToState.pop(item, None)
+        self.m_itemToCalculatedColor.pop(index, None)
+        self.m_dirtyItems.pop(index, None)
 
     def propertyChanged(self, index):
-        item = self.m_indexToItem.get(index)
-        self.updateItem(item)
+        # Changes are coalesced and applied by slotFlushUpdates()
+        self.m_dirtyItems[index] = None
+        if self.m_updateTimer.isActive():
+            return
+        if self.m_maximumUpdateRate <= 0:
+            self.m_updateTimer.start(0)
+            return
+
+        # The first change after a quiet interval is shown right away, only the ones following it wait
+        remaining = 0
+        if self.m_lastFlush.isValid():
+            remaining = 1000 // self.m_maximumUpdateRate - self.m_lastFlush.elapsed()
+        if remaining <= 0:
+            self.slotFlushUpdates()
+        else:
+            self.m_updateTimer.start(remaining)
+
+    def maximumUpdateRate(self):
+        return self.m_maximumUpdateRate
+
+    def setMaximumUpdateRate(self, rate):
+        """
+        Limits how many times per second changed properties are redrawn.
+        A change after a quiet interval is redrawn immediately, later ones are
+        batched until the interval has passed.
+        With 0, the default, changes are applied once per event loop iteration.
+        """
+        self.m_maximumUpdateRate = max(0, rate)
+
+    def flushUpdates(self):
+        """
+        Applies pending property changes to the tree right away.
+        """
+        self.m_updateTimer.stop()
+        self.slotFlushUpdates()
+
+    @Slot()
+    def slotFlushUpdates(self):
+        dirtyItems = self.m_dirtyItems
+        if not dirtyItems:
+            return
+        self.m_dirtyItems = {}
+        self.m_lastFlush.start()
+
+        viewport = self.m_treeWidget.viewport()
+        visibleRect = viewport.rect()
+        region = QRegion()
+        for index in dirtyItems:
+            item = self.m_indexToItem.get(index)
+            if item is None:
+                continue
+            self.updateItem(item)
+
+            # Also repaints the parts the delegate draws itself, e.g. the bold name of modified properties
+            rect = self.m_treeWidget.visualItemRect(item)
+            if rect.intersects(visibleRect):
+                region += QRect(0, rect.y(), visibleRect.width(), rect.height())
+
+        if not region.isEmpty():
+            viewport.update(region)
 
     def treeWidget(self):
         return self.m_treeWidget
@@ -558,31 +694,57 @@ class QtTreePropertyBrowser(QtAbstractPropertyBrowser):
         return self.m_markPropertiesWithoutValue
 
     def updateItem(self, item):
+        """
+        Copies the property's texts and icons to the tree item, setting only those which changed.
+        """
         prop = self.m_itemToIndex[item].property()
+        hasValue = prop.hasValue()
         expandIcon = QIcon()
+        valueIcon = QIcon()
+        toolTip = ""
+        text = ""
 
-        if prop.hasValue():
+        if hasValue:
+            displayText = prop.displayText()
             toolTip = prop.toolTip()
 
             if len(toolTip) <= 0:
-                toolTip = prop.displayText()
-            item.setToolTip(1, toolTip)
-            item.setIcon(1, prop.valueIcon())
+                toolTip = displayText
+            valueIcon = prop.valueIcon()
 
-            if len(prop.displayText()) <= 0:
-                item.setText(1, prop.valueText())
+            if len(displayText) <= 0:
+                text = prop.valueText()
             else:
-                item.setText(1, prop.displayText())
+                text = displayText
 
         elif self.markPropertiesWithoutValue() and not self.m_treeWidget.rootIsDecorated():
             expandIcon = self.m_expandIcon
 
-        item.setIcon(0, expandIcon)
-        item.setFirstColumnSpanned(not prop.hasValue())
-        item.setToolTip(0, prop.propertyName())
-        item.setStatusTip(0, prop.statusTip())
-        item.setWhatsThis(0, prop.whatsThis())
-        item.setText(0, prop.propertyName())
+        name = prop.propertyName()
+        state = (toolTip, valueIcon.cacheKey(), text, expandIcon.cacheKey(), hasValue,
+                 name, prop.statusTip(), prop.whatsThis())
+        old = self.m_itemToState.get(item, _NO_ITEM_STATE)
+        if state != old:
+            self.m_itemToState[item] = state
+            if hasValue:
+                if toolTip != old[0]:
+                    item.setToolTip(1, toolTip)
+                if state[1] != old[1]:
+                    item.setIcon(1, valueIcon)
+                if text != old[2]:
+                    item.setText(1, text)
+            if state[3] != old[3]:
+                item.setIcon(0, expandIcon)
+            if hasValue != old[4]:
+                item.setFirstColumnSpanned(not hasValue)
+            if name != old[5]:
+                item.setToolTip(0, name)
+                item.setText(0, name)
+            if state[6] != old[6]:
+                item.setStatusTip(0, state[6])
+            if state[7] != old[7]:
+                item.setWhatsThis(0, state[7])
+
         wasEnabled = item.flags() & Qt.ItemIsEnabled
         isEnabled = wasEnabled
 
@@ -601,8 +763,6 @@ class QtTreePropertyBrowser(QtAbstractPropertyBrowser):
             else:
                 self.disableItem(item)
 
-        self.m_treeWidget.viewport().update()
-
     def editedItem(self):
         return self.m_delegate.editedItem()
 
@@ -682,9 +842,19 @@ class QtTreePropertyBrowser(QtAbstractPropertyBrowser):
 
     def setExpandedByProperty(self, prop: QtProperty, expanded: bool) -> None:
         idx = self.propertyToIndex(prop)    # idx is QtBrowserItem
-        tree_item = self.m_indexToItem.get(idx)
-        if tree_item:
-            tree_item.setExpanded(expanded)
+        self.setExpanded(idx, expanded)
+
+    def createDeferredItems(self, index):
+        """
+        Reimplementation
+        """
+        if not self.hasDeferredChildren(index):
+            return
+
+        super().createDeferredItems(index)
+        treeItem = self.m_indexToItem.get(index)
+        if treeItem:
+            treeItem.setChildIndicatorPolicy(QTreeWidgetItem.DontShowIndicatorWhenChildless)
 
     def isExpanded(self, item: QtBrowserItem) -> bool:
         treeItem = self.m_indexToItem.get(item)
@@ -711,20 +881,24 @@ class QtTreePropertyBrowser(QtAbstractPropertyBrowser):
             self.m_indexToBackgroundColor[item] = color
         else:
             self.m_indexToBackgroundColor.remove(item)
+        # The color is inherited by the whole subtree
+        self.m_itemToCalculatedColor.clear()
         self.m_treeWidget.viewport().update()
 
     def backgroundColor(self, item):
         return self.m_indexToBackgroundColor.get(item)
 
     def calculatedBackgroundColor(self, item):
-        i = item
-        while i:
-            it = self.m_indexToBackgroundColor.get(i)
-            if it:
-                return it
-            i = i.parent()
+        if not item:
+            return QColor()
 
-        return QColor()
+        color = self.m_itemToCalculatedColor.get(item)
+        if color is None:
+            color = self.m_indexToBackgroundColor.get(item)
+            if color is None:
+                color = self.calculatedBackgroundColor(item.parent())
+            self.m_itemToCalculatedColor[item] = color
+        return color
 
     def setPropertiesWithoutValueMarked(self, mark):
         if self.m_markPropertiesWithoutValue == mark:
@@ -773,6 +947,7 @@ class QtTreePropertyBrowser(QtAbstractPropertyBrowser):
         item = self.indexToItem(index)
         idx = self.m_itemToIndex.get(item)
         if item:
+            self.createDeferredItems(idx)
             self.expandedSignal.emit(idx)
 
     @Slot(QtBrowserItem)
@@ -0,0 +1,47 @@
+"""
+Measures the throughput of the manager accessors that editors and the
+tree delegate call on every repaint, in nanoseconds per call.
+
+Usage: python benchmarks/bench_accessors.py [calls] [repeats]
+"""
+from common import best, intArg
+
+from PySide6.QtWidgets import QApplication
+from QtProperty.qtpropertymanager import (
+    QtIntPropertyManager,
+    QtDoublePropertyManager,
+    QtStringPropertyManager,
+    QtBoolPropertyManager
+)
+
+
+def nsPerCall(accessor, prop, calls, repeats):
+    def run():
+        for i in range(calls):
+            accessor(prop)
+    return best(run, repeats) / calls * 1e9
+
+
+if __name__ == '__main__':
+    app = QApplication([])
+    calls = intArg(1, 200000)
+    repeats = intArg(2, 3)
+
+    int_mgr = QtIntPropertyManager()
+    double_mgr = QtDoublePropertyManager()
+    string_mgr = QtStringPropertyManager()
+    bool_mgr = QtBoolPropertyManager()
+    int_prop = int_mgr.addProperty('int')
+    double_prop = double_mgr.addProperty('double')
+    string_prop = string_mgr.addProperty('string')
+    bool_prop = bool_mgr.addProperty('bool')
+
+    for name, accessor, prop in (('int value()', int_mgr.value, int_prop),
+                                 ('int minimum()', int_mgr.minimum, int_prop),
+                                 ('int singleStep()', int_mgr.singleStep, int_prop),
+                                 ('double value()', double_mgr.value, double_prop),
+                                 ('double decimals()', double_mgr.decimals, double_prop),
+                                 ('string value()', string_mgr.value, string_prop),
+                                 ('string echoMode()', string_mgr.echoMode, string_prop),
+                                 ('bool value()', bool_mgr.value, bool_prop)):
+        print('%-18s %6.0f ns/call' % (name, nsPerCall(accessor, prop, calls, repeats)))
@@ -0,0 +1,39 @@
+"""
+Reports the Python heap bytes per leaf QtProperty and per QtBrowserItem,
+leaf or with one child, measured with tracemalloc. Memory owned by Qt
+objects is not counted.
+
+Usage: python benchmarks/bench_memory.py [instances]
+"""
+import tracemalloc
+
+from common import intArg
+
+from QtProperty.qtproperty import QtProperty
+from QtProperty.qtbrowseritem import QtBrowserItem
+
+
+def bytesPerInstance(create, count):
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    instances = [create() for i in range(count)]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    size = sum(stat.size_diff for stat in after.compare_to(before, 'filename'))
+    # The list holding the instances is not part of their cost
+    size -= instances.__sizeof__()
+    return size / count
+
+
+def itemParent():
+    item = QtBrowserItem()
+    item.addChild(QtBrowserItem(None, None, item), None)
+    return item
+
+
+if __name__ == '__main__':
+    count = intArg(1, 20000)
+
+    print('QtProperty leaf:            %6.0f bytes' % bytesPerInstance(QtProperty, count))
+    print('QtBrowserItem leaf:         %6.0f bytes' % bytesPerInstance(QtBrowserItem, count))
+    print('QtBrowserItem with a child: %6.0f bytes (both items)' % bytesPerInstance(itemParent, count))
@@ -0,0 +1,47 @@
+"""
+Measures how long a property browser takes to paint its viewport with
+every row visible, rendered offscreen into a QPixmap. Every seventh
+property is marked as modified so that the bold path is painted too.
+
+Usage: python benchmarks/bench_paint.py [tree|model] [rows] [repeats]
+"""
+import sys
+
+from common import best, intArg
+
+from PySide6.QtGui import QPixmap
+from PySide6.QtWidgets import QApplication
+from QtProperty.qtpropertymanager import QtIntPropertyManager
+from QtProperty.qttreepropertybrowser import QtTreePropertyBrowser
+from QtProperty.qtmodelpropertybrowser import QtModelPropertyBrowser
+
+
+if __name__ == '__main__':
+    app = QApplication([])
+    kind = sys.argv[1] if len(sys.argv) > 1 else 'tree'
+    rows = intArg(2, 1000)
+    repeats = intArg(3, 3)
+
+    if kind == 'model':
+        browser = QtModelPropertyBrowser()
+    else:
+        browser = QtTreePropertyBrowser()
+    manager = QtIntPropertyManager(browser)
+    properties = [manager.addProperty('int%d' % i) for i in range(rows)]
+    for prop in properties:
+        browser.addProperty(prop)
+    for prop in properties[::7]:
+        prop.setModified(True)
+
+    view = browser.treeWidget()
+    browser.resize(400, rows * view.sizeHintForRow(0) + 60)
+    browser.show()
+    app.processEvents()
+    if hasattr(browser, 'flushUpdates'):
+        browser.flushUpdates()
+
+    viewport = view.viewport()
+    pixmap = QPixmap(viewport.size())
+    elapsed = best(lambda: viewport.render(pixmap), repeats)
+    print('%s: %d rows painted in %.1f ms (%.1f us per row)'
+          % (type(browser).__name__, rows, elapsed * 1e3, elapsed / rows * 1e6))
@@ -0,0 +1,66 @@
+"""
+Compares setValues() of the int and double managers with a setValue() loop
+updating the same properties, once with every value changed and once with
+every value unchanged. With numpy installed, setValues() is also timed
+with the values given as arrays.
+
+Usage: python benchmarks/bench_setvalues.py [properties] [repeats] [int|double|int[]|double[]]
+"""
+import sys
+
+from common import best, intArg
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from PySide6.QtCore import QCoreApplication
+from QtProperty.qtpropertymanager import QtIntPropertyManager, QtDoublePropertyManager
+
+
+def measure(manager, props, frames, repeats):
+    state = {'frame': 0}
+
+    def nextFrame():
+        state['frame'] = 1 - state['frame']
+        return frames[state['frame']]
+
+    def loop():
+        for prop, val in zip(props, nextFrame()):
+            manager.setValue(prop, val)
+
+    def bulk():
+        manager.setValues(props, nextFrame())
+
+    def loopUnchanged():
+        for prop, val in zip(props, frames[state['frame']]):
+            manager.setValue(prop, val)
+
+    def bulkUnchanged():
+        manager.setValues(props, frames[state['frame']])
+
+    return (best(loop, repeats), best(bulk, repeats),
+            best(loopUnchanged, repeats), best(bulkUnchanged, repeats))
+
+
+if __name__ == '__main__':
+    app = QCoreApplication([])
+    count = intArg(1, 2000)
+    repeats = intArg(2, 5)
+
+    runs = [('int', QtIntPropertyManager, int, list), ('double', QtDoublePropertyManager, float, list)]
+    if numpy is not None:
+        runs += [('int[]', QtIntPropertyManager, int, numpy.array),
+                 ('double[]', QtDoublePropertyManager, float, numpy.array)]
+    if len(sys.argv) > 3:
+        runs = [run for run in runs if run[0] == sys.argv[3]]
+    for name, manager_class, value_type, frame_type in runs:
+        manager = manager_class()
+        props = [manager.addProperty('p%d' % i) for i in range(count)]
+        frames = [frame_type([value_type(i) for i in range(count)]),
+                  frame_type([value_type(i + 1) for i in range(count)])]
+        loop, bulk, loopUnchanged, bulkUnchanged = measure(manager, props, frames, repeats)
+        print('%-8s %d properties: changed: setValue loop %.2f ms, setValues %.2f ms; '
+              'unchanged: setValue loop %.2f ms, setValues %.2f ms'
+              % (name, count, loop * 1e3, bulk * 1e3, loopUnchanged * 1e3, bulkUnchanged * 1e3))
@@ -0,0 +1,62 @@
+"""
+Times linking pre-built subtrees with QtProperty.addSubProperty(), building
+a binary tree and a chain bottom-up, i.e. every new property adopts
+existing subtrees.
+
+The properties use a manager that ignores the notifications, so only the
+linking and the cycle check are measured, not the signals.
+
+Usage: python benchmarks/bench_subproperties.py [properties] [repeats]
+"""
+from common import best, intArg
+
+from QtProperty.qtproperty import QtProperty
+
+
+class NullManager:
+    def propertyInserted(self, prop, parent, after):
+        pass
+
+    def propertiesInserted(self, props, parent, after):
+        pass
+
+    def propertyRemoved(self, prop, parent):
+        pass
+
+    def propertyDestroyed(self, prop):
+        pass
+
+
+def buildBinaryTree(manager, count):
+    level = [QtProperty(manager) for i in range((count + 1) // 2)]
+    created = len(level)
+    while len(level) > 1 and created < count:
+        parents = []
+        for i in range(0, len(level) - 1, 2):
+            parent = QtProperty(manager)
+            parent.addSubProperty(level[i])
+            parent.addSubProperty(level[i + 1])
+            parents.append(parent)
+            created += 1
+        if len(level) % 2:
+            parents.append(level[-1])
+        level = parents
+    return level
+
+
+def buildChain(manager, count):
+    prop = QtProperty(manager)
+    for i in range(count - 1):
+        parent = QtProperty(manager)
+        parent.addSubProperty(prop)
+        prop = parent
+    return prop
+
+
+if __name__ == '__main__':
+    count = intArg(1, 50000)
+    repeats = intArg(2, 3)
+    manager = NullManager()
+
+    print('binary tree of %d properties: %.3f s' % (count, best(lambda: buildBinaryTree(manager, count), repeats)))
+    print('chain of %d properties:       %.3f s' % (count, best(lambda: buildChain(manager, count), repeats)))
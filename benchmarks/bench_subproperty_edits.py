@@ -0,0 +1,69 @@
+"""
+Fuzzes composite managers with random edits of their subproperties and
+reports the average cost of routing one edit to its parent property.
+
+The edits call the managers' sub-property slots directly, and setValue()
+of the composite managers is stubbed, so the parent lookup and the value
+copy are measured without the change signals.
+
+Usage: python benchmarks/bench_subproperty_edits.py [parents] [edits] [repeats]
+"""
+import random
+
+from common import best, intArg
+
+from PySide6.QtWidgets import QApplication
+from QtProperty.qtpropertymanager import (
+    QtBoolPropertyManager,
+    QtColorPropertyManager,
+    QtDoublePropertyManager,
+    QtEnumPropertyManager,
+    QtFontPropertyManager,
+    QtIntPropertyManager,
+    QtPointPropertyManager,
+    QtRectFPropertyManager,
+    QtRectPropertyManager,
+    QtSizePropertyManager
+)
+
+# slot name and random value per type of sub-property manager
+SUB_EDITS = {
+    QtIntPropertyManager: ('slotIntChanged', lambda rng: rng.randint(0, 255)),
+    QtDoublePropertyManager: ('slotDoubleChanged', lambda rng: rng.uniform(0.0, 255.0)),
+    QtBoolPropertyManager: ('slotBoolChanged', lambda rng: rng.random() < 0.5),
+    QtEnumPropertyManager: ('slotEnumChanged', lambda rng: 0),
+}
+
+
+def collectEdits(manager_classes, parents):
+    edits = []
+    managers = []
+    for manager_class in manager_classes:
+        manager = manager_class()
+        managers.append(manager)
+        for i in range(parents):
+            prop = manager.addProperty('p%d' % i)
+            for sub in prop.subProperties():
+                slot_name, value = SUB_EDITS[type(sub.propertyManager())]
+                edits.append((getattr(manager, slot_name), sub, value))
+        manager.setValue = lambda prop, val: None
+    return managers, edits
+
+
+if __name__ == '__main__':
+    app = QApplication([])
+    parents = intArg(1, 10)
+    count = intArg(2, 300)
+    repeats = intArg(3, 8)
+
+    managers, edits = collectEdits((QtColorPropertyManager, QtRectPropertyManager, QtRectFPropertyManager,
+                                    QtSizePropertyManager, QtPointPropertyManager, QtFontPropertyManager), parents)
+    rng = random.Random(1)
+    script = [(slot, sub, value(rng)) for slot, sub, value in (rng.choice(edits) for i in range(count))]
+
+    def run():
+        for slot, sub, value in script:
+            slot(sub, value)
+
+    print('%d random edits over %d subproperties: %.2f us per edit'
+          % (count, len(edits), best(run, repeats) / count * 1e6))
@@ -0,0 +1,27 @@
+import os
+import sys
+import time
+
+filePath = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(filePath))
+
+
+def intArg(index, default):
+    """
+    Returns the command line argument at index as int, or default if it is missing.
+    """
+    if len(sys.argv) > index:
+        return int(sys.argv[index])
+    return default
+
+
+def best(func, repeats):
+    """
+    Calls func repeats times and returns the fastest run in seconds.
+    """
+    times = []
+    for i in range(repeats):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times)
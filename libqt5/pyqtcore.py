@@ -18,6 +18,8 @@
 # this program. If not, see <http://www.gnu.org/licenses/>.
 ##
 
+import bisect
+import itertools
 import random
 import os
 
@@ -164,11 +166,9 @@ class QList(list):
         return self.__contains__(item)
 
     def removeAll(self, item):
-        n = 0
-        for i in range(self.__len__() - 1, -1, -1):
-            if self.__getitem__(i) == item:
-                self.__delitem__(i)
-                n += 1
+        n = list.count(self, item)
+        if n:
+            self[:] = [x for x in self if not x == item]
         return n
 
     def remove(self, index):
@@ -182,10 +182,10 @@ class QList(list):
         self.__delitem__(index)
 
     def indexOf(self, item):
-        for i in range(self.__len__()):
-            if self.__getitem__(i) == item:
-                return i
-        return -1
+        try:
+            return list.index(self, item)
+        except ValueError:
+            return -1
 
     def first(self):
         if self.__len__() > 0:
@@ -281,57 +281,256 @@ class QList(list):
         self.insert(to, item)
 
 
-class QMap(QList):
+# Opt-in QList for unique, hashable items such as sibling properties or browser items.
+# An item -> position map is kept next to the list, so contains(), indexOf() and
+# removeAll() are hashed lookups. Positions are stored relative to a head offset, which
+# keeps the map valid when items are added or removed at either end. A change in the
+# middle only invalidates the positions behind it; they are rebuilt on the next lookup.
+class QIndexedList(QList):
+    def __init__(self, args=[]):
+        super(QIndexedList, self).__init__(args)
+        self.reindex()
+
+    def reindex(self):
+        self._positions = {x: i for i, x in enumerate(list.__iter__(self))}
+        self._offset = 0
+        self._validTo = self.__len__()
+
+    def position(self, item):
+        raw = self._positions.get(item)
+        if raw is None:
+            return -1
+        i = raw + self._offset
+        if 0 <= i < self._validTo and list.__getitem__(self, i) == item:
+            return i
+        positions = self._positions
+        offset = self._offset
+        for j in range(self._validTo, self.__len__()):
+            positions[list.__getitem__(self, j)] = j - offset
+        self._validTo = self.__len__()
+        return positions[item] + offset
+
+    def __contains__(self, item):
+        return item in self._positions
+
+    def contains(self, item):
+        return item in self._positions
+
+    def indexOf(self, item):
+        return self.position(item)
+
+    def removeAll(self, item):
+        i = self.position(item)
+        if i < 0:
+            return 0
+        self.__delitem__(i)
+        return 1
+
+    def append(self, item):
+        i = self.__len__()
+        list.append(self, item)
+        self._positions[item] = i - self._offset
+        if self._validTo == i:
+            self._validTo = i + 1
+
+    def insert(self, index, item):
+        l = self.__len__()
+        if index < 0:
+            index = max(index + l, 0)
+        if index >= l:
+            self.append(item)
+            return
+        list.insert(self, index, item)
+        if index == 0:
+            self._offset += 1
+            self._positions[item] = -self._offset
+            self._validTo += 1
+            return
+        self._positions[item] = index - self._offset
+        if self._validTo >= index:
+            self._validTo = index + 1
+
+    def extend(self, items):
+        for item in items:
+            self.append(item)
+
+    def __iadd__(self, items):
+        self.extend(items)
+        return self
+
+    def __setitem__(self, index, item):
+        if isinstance(index, slice):
+            list.__setitem__(self, index, item)
+            self.reindex()
+            return
+        if index < 0:
+            index += self.__len__()
+        del self._positions[list.__getitem__(self, index)]
+        list.__setitem__(self, index, item)
+        self._positions[item] = index - self._offset
+
+    def __delitem__(self, index):
+        if isinstance(index, slice):
+            list.__delitem__(self, index)
+            self.reindex()
+            return
+        if index < 0:
+            index += self.__len__()
+        del self._positions[list.__getitem__(self, index)]
+        list.__delitem__(self, index)
+        if index == 0:
+            self._offset -= 1
+            self._validTo = max(self._validTo - 1, 0)
+        elif self._validTo > index:
+            self._validTo = index
+
+    def pop(self, index=-1):
+        item = list.__getitem__(self, index)
+        self.__delitem__(index)
+        return item
+
+    def clear(self):
+        list.clear(self)
+        self.reindex()
+
+    def sort(self, *args, **kwargs):
+        list.sort(self, *args, **kwargs)
+        self.reindex()
+
+    def reverse(self):
+        list.reverse(self)
+        self.reindex()
+
+    def __copy__(self):
+        return QIndexedList(self)
+
+
+# Insertion ordered and dict backed. A missing key reads as None, and keys()/values()
+# return list snapshots so callers may modify the map while iterating over them.
+# The sorted key index used by lowerBound()/upperBound() is only built on the first
+# range query and is kept up to date with bisect afterwards.
+# Immutable empty QList with the read-only QList methods. Handed out where a shared
+# empty list would otherwise be returned, so callers can't modify it for everyone.
+class QEmptyList(tuple):
+    __slots__ = ()
+
+    def contains(self, item):
+        return False
+
+    def indexOf(self, item):
+        return -1
+
+    def first(self):
+        return None
+
+    def last(self):
+        return None
+
+    def at(self, i):
+        return None
+
+    def count(self):
+        return 0
+
+    def size(self):
+        return 0
+
+    def length(self):
+        return 0
+
+    def isEmpty(self):
+        return True
+
+    def empty(self):
+        return True
+
+
+class QMap(dict):
+    __slots__ = ('_sorted_keys',)
+
     def __init__(self, key=None, value=None):
         super(QMap, self).__init__()
+        self._sorted_keys = None
 
-        self.insert = self.__setitem__
-        self.find = self.get
         if key or value:
             self.__setitem__(key, value)
 
     def __getitem__(self, key):
-        for x in self.__iter__():
-            if x[0] == key:
-                return x[1]
-        return None
+        return dict.get(self, key)
 
     def __setitem__(self, key, value):
-        for i in range(self.__len__()):
-            x = super(QMap, self).__getitem__(i)
-            if x[0] == key:
-                super(QMap, self).__setitem__(i, [key, value])
-                return
-        self.append([key, value])
-        return self.__len__()
+        if self._sorted_keys is not None and not dict.__contains__(self, key):
+            bisect.insort(self._sorted_keys, key)
+        dict.__setitem__(self, key, value)
+
+    def __delitem__(self, key):
+        dict.__delitem__(self, key)
+        self.unindexKey(key)
+
+    def pop(self, key, *default):
+        if dict.__contains__(self, key):
+            self.unindexKey(key)
+        return dict.pop(self, key, *default)
+
+    def popitem(self):
+        self._sorted_keys = None
+        return dict.popitem(self)
+
+    def setdefault(self, key, default=None):
+        if not dict.__contains__(self, key):
+            self.__setitem__(key, default)
+        return dict.__getitem__(self, key)
+
+    def update(self, *args, **kwargs):
+        self._sorted_keys = None
+        dict.update(self, *args, **kwargs)
+
+    def clear(self):
+        self._sorted_keys = None
+        dict.clear(self)
+
+    def unindexKey(self, key):
+        if self._sorted_keys is None:
+            return
+        i = bisect.bisect_left(self._sorted_keys, key)
+        if i < len(self._sorted_keys) and self._sorted_keys[i] == key:
+            del self._sorted_keys[i]
+
+    def keyIndex(self):
+        if self._sorted_keys is None:
+            self._sorted_keys = sorted(dict.keys(self))
+        return self._sorted_keys
+
+    def sortedKeys(self):
+        return QList(self.keyIndex())
+
+    def keysInRange(self, lower, upper):
+        keys = self.keyIndex()
+        return QList(keys[bisect.bisect_left(keys, lower):bisect.bisect_left(keys, upper)])
+
+    def insert(self, key, value):
+        self.__setitem__(key, value)
+
+    def find(self, key, defvalue=None):
+        return self.get(key, defvalue)
 
     def keys(self):
-        r = []
-        for x in self.__iter__():
-            r.append(x[0])
-        return r
+        return list(dict.keys(self))
 
     def values(self):
-        r = []
-        for x in self.__iter__():
-            r.append(x[1])
-        return r
+        return list(dict.values(self))
 
     def value(self, key, defValue=None):
         return self.get(key, defValue)
 
     def get(self, key, defvalue=None):
-        v = self.__getitem__(key)
-        if v == None:
+        v = dict.get(self, key)
+        if v is None:
             return defvalue
         return v
 
     def remove(self, key):
-        for x in self.__iter__():
-            if x[0] == key:
-                index = self.index(x)
-                self.__delitem__(index)
-                return
+        self.pop(key, None)
 
     def erase(self, iter):
         self.remove(iter)
@@ -339,114 +538,75 @@ class QMap(QList):
     def count(self):
         return self.__len__()
 
+    def size(self):
+        return self.__len__()
+
+    def isEmpty(self):
+        return self.__len__() == 0
+
     def end(self):
         return None
 
     def contains(self, key):
-        return self.get(key) != None
+        return dict.get(self, key) is not None
 
     def take(self, key):
-        v = self.__getitem__(key)
-        if v == None:
+        v = dict.get(self, key)
+        if v is None:
             return None
         self.remove(key)
         return v
 
     def lowerBound(self, key):
-        keys = sorted(self.keys())
-        _keyfind = len(keys)
-
-        _keys = QSet(keys)
-
-        index = 0
-        for _key in _keys:
-            if key <= _key:
-                _keyfind = index
-                break
-            index += 1
-
-        return _keyfind
+        return bisect.bisect_left(self.keyIndex(), key)
 
     def upperBound(self, key):
-        keys = self.keys()
-        _keyfind = len(keys)
-
-        _keys = QSet(keys)
-
-        _keys = sorted(_keys)
-        index = 0
-        for _key in _keys:
-            if key < _key:
-                _keyfind = index
-                break
-            index += 1
-
-        return _keyfind
+        return bisect.bisect_right(self.keyIndex(), key)
 
     def itemByIndex(self, index):
         if index < 0 or index >= self.__len__():
             return None
-        return super().__getitem__(index)
+        key = next(itertools.islice(dict.keys(self), index, None))
+        return [key, dict.__getitem__(self, key)]
 
 
-class QMapList(QMap):
-    def __init__(self, key=None, value=None):
-        super(QMapList, self).__init__(key, value)
+# Auto-vivifying maps of containers. Indexing a missing key creates, stores and returns
+# an empty container of valueType, while get()/value() hand out a fresh empty container
+# that is not stored, so no caller ever shares a default instance.
+class QMapContainer(QMap):
+    __slots__ = ()
+    valueType = None
 
     def __getitem__(self, key):
-        v = super(QMapList, self).__getitem__(key)
-        if not v:
-            v = QList()
-            super(QMapList, self).__setitem__(key, v)
+        v = dict.get(self, key)
+        if v is None:
+            v = self.valueType()
+            self.__setitem__(key, v)
         return v
 
-    def get(self, key, defvalue=QList()):
-        v = super(QMapList, self).__getitem__(key)
-        if not v:
-            return defvalue
+    def get(self, key, defvalue=None):
+        v = dict.get(self, key)
+        if v is None:
+            return self.valueType() if defvalue is None else defvalue
         return v
 
-    def value(self, key, defvalue=QList()):
-        v = super(QMapList, self).__getitem__(key)
-        if not v:
-            return defvalue
-        return v
+    def value(self, key, defvalue=None):
+        return self.get(key, defvalue)
 
 
-class QMapMap(QMap):
-    def __init__(self, key=None, value=None):
-        super(QMapMap, self).__init__(key, value)
+class QMapList(QMapContainer):
+    __slots__ = ()
+    valueType = QList
 
-    def __getitem__(self, key):
-        v = super(QMapMap, self).__getitem__(key)
-        if not v:
-            v = QMap()
-            super(QMapMap, self).__setitem__(key, v)
-        return v
-
-    def get(self, key, defvalue=QMap()):
-        v = super(QMapMap, self).__getitem__(key)
-        if not v:
-            return defvalue
-        return v
 
+class QMapMap(QMapContainer):
+    __slots__ = ()
+    valueType = QMap
 
-class QMapMapList(QMap):
-    def __init__(self, key=None, value=None):
-        super(QMapMapList, self).__init__(key, value)
 
-    def __getitem__(self, key):
-        v = super(QMapMapList, self).__getitem__(key)
-        if not v:
-            v = QMapList()
-            super(QMapMapList, self).__setitem__(key, v)
-        return v
-
-    def get(self, key, defvalue=None):
-        v = super(QMapMapList, self).__getitem__(key)
-        if not v:
-            return defvalue
-        return v
+class QMapMapList(QMapContainer):
+    __slots__ = ()
+    valueType = QMapList
 
 
 class QVector(QList):